@@ -0,0 +1,25 @@
+"""
+Console entry point for SkillForge.
+
+Answers a bare ``--version`` without importing Typer or any other dependency;
+every other invocation is handed to the Typer app in ``skillforge.cli``.
+"""
+
+import sys
+
+from skillforge import __version__
+
+
+def main() -> None:
+    """Run the SkillForge CLI."""
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(f"SkillForge version {__version__}")
+        return
+
+    from skillforge.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
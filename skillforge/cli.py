@@ -5,43 +5,57 @@ This module provides the command-line interface using Typer,
 with rich formatting for enhanced user experience.
 """
 
+import importlib
+import logging
 import os
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from enum import Enum
+from functools import cache
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import typer
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from skillforge import __version__
-from skillforge.core.course_generator import CourseGenerator
-from skillforge.core.session import SessionManager, find_saved_sessions
-from skillforge.core.simulator import CommandSimulator
-from skillforge.core.validator import ExerciseValidator
-from skillforge.models.config import AppConfig, LLMConfig
-from skillforge.models.course import Course
-from skillforge.models.enums import Difficulty, LLMProvider
-from skillforge.models.session import LearningSession
-from skillforge.utils.llm_client import BaseLLMClient, LLMClientFactory
-from skillforge.utils.output import SessionDisplay
-from skillforge.utils.serialization import load_from_file, save_to_file
-
-# Initialize Typer app and Rich console
+
+# Heavy modules (pydantic models, LLM SDKs, session machinery) are imported
+# inside the commands that need them so --help/--version stay fast.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from skillforge.models.config import AppConfig
+    from skillforge.models.course import Course
+    from skillforge.utils.llm_client import BaseLLMClient
+
+
+logger = logging.getLogger(__name__)
+
+# Initialize Typer app
 app = typer.Typer(
     name="skillforge",
     help="AI-powered interactive learning CLI for developers",
     add_completion=False,
 )
-console = Console()
+
+
+@cache
+def console() -> "Console":
+    """Return the shared Rich console, creating it on first use.
+
+    Construction probes the terminal, so it is deferred until a command
+    actually prints something.
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 def version_callback(value: bool) -> None:
     """Display version information and exit."""
     if value:
-        console.print(
-            f"[bold cyan]SkillForge[/bold cyan] version [green]{__version__}[/green]"
-        )
+        typer.echo(f"SkillForge version {__version__}")
         raise typer.Exit()
 
 
@@ -64,9 +78,28 @@ def main(
     pass
 
 
-def load_config(provider: str | None = None) -> AppConfig:
+_E = TypeVar("_E", bound=Enum)
+
+# Value-to-member tables built by _enum_lookup, one per enum class
+_ENUM_LOOKUPS: dict[type[Enum], dict[str, Any]] = {}
+
+
+def _enum_lookup(enum_cls: type[_E]) -> dict[str, _E]:  # noqa: UP047
+    """Return a value-to-member table for parsing user-supplied enum values."""
+    table = _ENUM_LOOKUPS.get(enum_cls)
+    if table is None:
+        table = _ENUM_LOOKUPS[enum_cls] = {m.value: m for m in enum_cls}
+    return table
+
+
+@cache
+def load_config(provider: str | None = None) -> "AppConfig":
     """Load configuration from environment variables.
 
+    The result is cached per ``provider`` for the life of the process, since
+    the environment does not change under a running command. Callers must not
+    mutate the returned config; use ``load_config.cache_clear()`` to re-read.
+
     Args:
         provider: Optional provider override
 
@@ -76,12 +109,15 @@ def load_config(provider: str | None = None) -> AppConfig:
     Raises:
         typer.Exit: If configuration is invalid
     """
+    from skillforge.models.config import AppConfig, LLMConfig
+    from skillforge.models.enums import LLMProvider
+
     # Determine provider
-    if provider:
-        provider_enum = LLMProvider(provider.lower())
-    else:
-        provider_str = os.getenv("SKILLFORGE_LLM_PROVIDER", "anthropic")
-        provider_enum = LLMProvider(provider_str.lower())
+    if not provider:
+        provider = os.getenv("SKILLFORGE_LLM_PROVIDER", "anthropic")
+    provider_enum = _enum_lookup(LLMProvider).get(provider.lower())
+    if provider_enum is None:
+        raise ValueError(f"'{provider.lower()}' is not a valid LLMProvider")
 
     # Get model and temperature
     if provider_enum == LLMProvider.ANTHROPIC:
@@ -98,20 +134,32 @@ def load_config(provider: str | None = None) -> AppConfig:
     return AppConfig(llm=llm_config, data_dir=data_dir)
 
 
-def display_course_overview(course: Course) -> None:
+def display_course_overview(course: "Course") -> None:
     """Display course structure using Rich formatting.
 
     Args:
         course: Course object to display
     """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     # Course header
-    console.print(
+    console().print(
         Panel.fit(
-            f"[bold cyan]{course.topic}[/bold cyan]\n\n"
-            f"{course.description}\n\n"
-            f"[dim]Difficulty: {course.difficulty.value.title()} | "
-            f"Lessons: {course.total_lessons()} | "
-            f"Exercises: {course.total_exercises()}[/dim]",
+            Text.assemble(
+                (course.topic, "bold cyan"),
+                "\n\n",
+                course.description,
+                "\n\n",
+                (
+                    f"Difficulty: {course.difficulty.value.title()} | "
+                    f"Lessons: {course.total_lessons()} | "
+                    f"Exercises: {course.total_exercises()}",
+                    "dim",
+                ),
+            ),
             title="📚 Course Overview",
             border_style="cyan",
         )
@@ -129,32 +177,91 @@ def display_course_overview(course: Course) -> None:
     table.add_column("Exercises", justify="center", style="green")
     table.add_column("Objectives", style="yellow")
 
+    # Course text goes into Text cells so it is shown literally, not parsed
+    # as Rich markup
     for i, lesson in enumerate(course.lessons, 1):
-        objectives_str = "\n".join(f"• {obj}" for obj in lesson.objectives[:2])
-        if len(lesson.objectives) > 2:
-            objectives_str += f"\n[dim]...and {len(lesson.objectives) - 2} more[/dim]"
+        objectives = lesson.objectives
+        objectives_text = Text("\n".join(["• " + obj for obj in objectives[:2]]))
+        extra = len(objectives) - 2
+        if extra > 0:
+            objectives_text.append(f"\n...and {extra} more", "dim")
 
         table.add_row(
-            str(i), lesson.title, str(lesson.total_exercises()), objectives_str
+            str(i),
+            Text(lesson.title),
+            str(lesson.total_exercises()),
+            objectives_text,
         )
 
-    console.print(table)
+    console().print(table)
+
+
+def _prewarm_imports(*modules: str) -> threading.Thread:
+    """Import modules in a background thread so loading overlaps other work.
+
+    A later regular import of the same module waits on Python's per-module
+    import lock instead of importing it a second time. Failures are logged
+    at debug level; the foreground import raises the real error.
+
+    Args:
+        modules: Dotted module names to import
+
+    Returns:
+        The started daemon thread
+    """
+
+    def _run() -> None:
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                logger.debug("Background import of %s failed", name, exc_info=True)
+
+    thread = threading.Thread(target=_run, name="skillforge-prewarm", daemon=True)
+    thread.start()
+    return thread
+
 
+# Directories already created by this process; mkdir runs at most once each.
+_ENSURED_DIRS: set[Path] = set()
 
-def save_course(course: Course) -> None:
+
+@cache
+def _courses_dir() -> Path:
+    """Return the directory where saved courses are stored."""
+    return Path.home() / ".skillforge" / "courses"
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (with parents) once per process and return it.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path
+    """
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
+def save_course(course: "Course") -> None:
     """Save course to disk.
 
     Args:
         course: Course object to save
     """
-    course_dir = Path.home() / ".skillforge" / "courses"
-    course_dir.mkdir(parents=True, exist_ok=True)
+    from skillforge.utils.serialization import save_to_file
+
+    course_dir = _ensure_dir(_courses_dir())
 
     filename = f"{course.id}.json"
     filepath = course_dir / filename
 
     save_to_file(course, filepath)
-    console.print(f"\n[green]✓[/green] Course saved to: [dim]{filepath}[/dim]")
+    console().print(f"\n[green]✓[/green] Course saved to: [dim]{filepath}[/dim]")
 
 
 @app.command()
@@ -178,6 +285,9 @@ def learn(
     interactive: bool = typer.Option(
         True, "--interactive/--no-interactive", help="Enable interactive mode"
     ),
+    yes: bool = typer.Option(
+        False, "--yes", "-y", help="Save the course without prompting"
+    ),
 ) -> None:
     """
     Start a new learning session with AI-generated course.
@@ -186,12 +296,14 @@ def learn(
         skillforge learn "pytorch basics"
         skillforge learn "docker fundamentals" --difficulty advanced
         skillforge learn "kubernetes" --lessons 7 --provider openai
+        skillforge learn "git basics" --no-interactive --yes
     """
+    from skillforge.models.enums import Difficulty, LLMProvider
+
     # Validate difficulty
-    try:
-        difficulty_enum = Difficulty(difficulty.lower())
-    except ValueError:
-        console.print(
+    difficulty_enum = _enum_lookup(Difficulty).get(difficulty.lower())
+    if difficulty_enum is None:
+        console().print(
             f"[bold red]Error:[/bold red] Invalid difficulty '{difficulty}'. "
             f"Must be: beginner, intermediate, or advanced"
         )
@@ -199,7 +311,7 @@ def learn(
 
     # Validate lesson count
     if lessons < 1 or lessons > 20:
-        console.print(
+        console().print(
             "[bold red]Error:[/bold red] Number of lessons must be between 1 and 20"
         )
         raise typer.Exit(1)
@@ -208,65 +320,83 @@ def learn(
     try:
         config = load_config(provider)
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Failed to load configuration: {e}")
+        console().print(
+            f"[bold red]Error:[/bold red] Failed to load configuration: {e}"
+        )
         raise typer.Exit(1)
 
+    # Start loading the provider's SDK (its package is named after the
+    # provider) while the generator's own modules are imported below
+    _prewarm_imports(config.llm.provider.value)
+
+    from skillforge.core.course_generator import CourseGenerator
+    from skillforge.utils.llm_client import LLMClientFactory
+
     # Create LLM client
     try:
         llm_client = LLMClientFactory.create_client(config.llm)
     except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
-        console.print("\n[yellow]Make sure your API key is set:[/yellow]")
+        console().print(f"[bold red]Error:[/bold red] {e}")
+        console().print("\n[yellow]Make sure your API key is set:[/yellow]")
         if config.llm.provider == LLMProvider.ANTHROPIC:
-            console.print("  export ANTHROPIC_API_KEY=your-key")
+            console().print("  export ANTHROPIC_API_KEY=your-key")
         else:
-            console.print("  export OPENAI_API_KEY=your-key")
+            console().print("  export OPENAI_API_KEY=your-key")
         raise typer.Exit(1)
 
     # Display generation info
-    console.print(f"\n[bold cyan]Generating course:[/bold cyan] {topic}")
-    console.print(
+    console().print(f"\n[bold cyan]Generating course:[/bold cyan] {topic}")
+    console().print(
         f"[dim]Difficulty: {difficulty_enum.value.title()} | "
         f"Lessons: {lessons} | "
         f"Provider: {config.llm.provider.value}[/dim]\n"
     )
 
-    # Generate course with progress indicator
-    with console.status(
-        "[bold green]Generating your personalized course...[/bold green]",
-        spinner="dots",
-    ):
+    # Generate course with progress indicator (skipped when output is not a
+    # terminal, where the spinner's render thread would only emit redraws)
+    if console().is_terminal:
+        progress_indicator: AbstractContextManager[object] = console().status(
+            "[bold green]Generating your personalized course...[/bold green]",
+            spinner="dots",
+        )
+    else:
+        progress_indicator = nullcontext()
+
+    with progress_indicator:
         try:
             generator = CourseGenerator(llm_client)
             course = generator.generate_course(
                 topic=topic, difficulty=difficulty_enum, num_lessons=lessons
             )
         except Exception as e:
-            console.print(
+            console().print(
                 f"\n[bold red]Error:[/bold red] Failed to generate course: {e}"
             )
             raise typer.Exit(1)
 
     # Display course overview
-    console.print("\n")
+    console().print("\n")
     display_course_overview(course)
 
     # Offer to save course
-    console.print()
-    if typer.confirm("Save this course for later?", default=True):
+    console().print()
+    if yes or typer.confirm("Save this course for later?", default=True):
         save_course(course)
 
     # Start interactive session or finish
     if interactive:
-        console.print()
+        console().print()
         _start_interactive_session(course, llm_client, config.data_dir)
     else:
-        console.print("\n[bold green]✓[/bold green] Course generation complete!\n")
+        console().print("\n[bold green]✓[/bold green] Course generation complete!\n")
 
 
 @app.command()
 def cache_clear() -> None:
     """Clear the course generation cache."""
+    from skillforge.core.course_generator import CourseGenerator
+    from skillforge.utils.llm_client import LLMClientFactory
+
     # Load minimal config just to create generator
     try:
         config = load_config()
@@ -277,18 +407,24 @@ def cache_clear() -> None:
 
         if count > 0:
             plural = "s" if count != 1 else ""
-            console.print(f"[green]✓[/green] Cleared {count} cached course{plural}")
+            console().print(f"[green]✓[/green] Cleared {count} cached course{plural}")
         else:
-            console.print("[yellow]No cached courses found[/yellow]")
+            console().print("[yellow]No cached courses found[/yellow]")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Failed to clear cache: {e}")
+        console().print(f"[bold red]Error:[/bold red] Failed to clear cache: {e}")
         raise typer.Exit(1)
 
 
 @app.command()
 def cache_info() -> None:
     """Show cache statistics."""
+    from rich import box
+    from rich.table import Table
+
+    from skillforge.core.course_generator import CourseGenerator
+    from skillforge.utils.llm_client import LLMClientFactory
+
     try:
         config = load_config()
         llm_client = LLMClientFactory.create_client(config.llm)
@@ -304,17 +440,17 @@ def cache_info() -> None:
         table.add_row("Total Size", f"{stats['total_size_bytes'] / 1024:.2f} KB")
         table.add_row("Cache Directory", stats["cache_dir"])
 
-        console.print()
-        console.print(table)
-        console.print()
+        console().print()
+        console().print(table)
+        console().print()
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Failed to get cache info: {e}")
+        console().print(f"[bold red]Error:[/bold red] Failed to get cache info: {e}")
         raise typer.Exit(1)
 
 
 def _start_interactive_session(
-    course: Course, llm_client: BaseLLMClient, data_dir: str
+    course: "Course", llm_client: "BaseLLMClient", data_dir: str
 ) -> None:
     """Start an interactive learning session for a course.
 
@@ -323,9 +459,14 @@ def _start_interactive_session(
         llm_client: LLM client for simulation and validation
         data_dir: Base data directory for session persistence
     """
+    from skillforge.core.session import SessionManager
+    from skillforge.core.simulator import CommandSimulator
+    from skillforge.core.validator import ExerciseValidator
+    from skillforge.utils.output import SessionDisplay
+
     simulator = CommandSimulator(llm_client)
     validator = ExerciseValidator(llm_client)
-    display = SessionDisplay(console)
+    display = SessionDisplay(console())
 
     mgr = SessionManager.create_new_session(
         course=course,
@@ -354,17 +495,30 @@ def resume(
     Without arguments, lists available sessions.
     With a session ID, resumes that session.
     """
+    from rich import box
+    from rich.table import Table
+
+    from skillforge.core.session import (
+        SessionManager,
+        find_saved_sessions,
+        iter_saved_sessions,
+    )
+    from skillforge.core.simulator import CommandSimulator
+    from skillforge.core.validator import ExerciseValidator
+    from skillforge.utils.llm_client import LLMClientFactory
+    from skillforge.utils.output import SessionDisplay
+
     try:
         config = load_config(provider)
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        console().print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
 
     if not session_id:
         # List available sessions
         sessions = find_saved_sessions(data_dir=config.data_dir)
         if not sessions:
-            console.print("[yellow]No saved sessions found.[/yellow]")
+            console().print("[yellow]No saved sessions found.[/yellow]")
             raise typer.Exit()
 
         table = Table(title="Saved Sessions", box=box.ROUNDED)
@@ -375,44 +529,44 @@ def resume(
 
         for s in sessions:
             table.add_row(
-                s["session_id"][:8] + "...",
-                s["topic"],
-                s["state"],
-                s["last_activity"][:19] if s["last_activity"] else "",
+                s.session_id[:8] + "...",
+                s.topic,
+                s.state,
+                s.last_activity[:19],
             )
 
-        console.print(table)
-        console.print("\n[dim]Use 'skillforge resume <session_id>' to resume.[/dim]")
+        console().print(table)
+        console().print("\n[dim]Use 'skillforge resume <session_id>' to resume.[/dim]")
         return
 
     # Resume specific session
     try:
         llm_client = LLMClientFactory.create_client(config.llm)
     except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        console().print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
 
-    # Match partial session IDs
-    sessions = find_saved_sessions(data_dir=config.data_dir)
-    matched = [s for s in sessions if s["session_id"].startswith(session_id)]
+    # Match partial session IDs; two matches are enough to detect ambiguity,
+    # so stop reading session files after the second
+    matched = list(islice(iter_saved_sessions(config.data_dir, session_id), 2))
 
     if not matched:
-        console.print(
+        console().print(
             f"[bold red]Error:[/bold red] No session found matching '{session_id}'"
         )
         raise typer.Exit(1)
 
     if len(matched) > 1:
-        console.print(
+        console().print(
             "[bold red]Error:[/bold red] Multiple sessions match "
             f"'{session_id}'. Be more specific."
         )
         raise typer.Exit(1)
 
-    full_id = matched[0]["session_id"]
+    full_id = matched[0].session_id
     simulator = CommandSimulator(llm_client)
     validator = ExerciseValidator(llm_client)
-    display = SessionDisplay(console)
+    display = SessionDisplay(console())
 
     try:
         mgr = SessionManager.load_session(
@@ -423,10 +577,12 @@ def resume(
             data_dir=config.data_dir,
         )
     except FileNotFoundError:
-        console.print(f"[bold red]Error:[/bold red] Session '{session_id}' not found.")
+        console().print(
+            f"[bold red]Error:[/bold red] Session '{session_id}' not found."
+        )
         raise typer.Exit(1)
 
-    console.print(f"[green]Resuming session:[/green] {matched[0]['topic']}\n")
+    console().print(f"[green]Resuming session:[/green] {matched[0].topic}\n")
     mgr.run()
 
 
@@ -435,37 +591,44 @@ def status(
     session_id: str = typer.Argument(..., help="Session ID to check"),
 ) -> None:
     """View progress for a saved session without resuming."""
+    from skillforge.core.session import apply_session_events, find_saved_sessions
+    from skillforge.models.session import LearningSession
+    from skillforge.utils.output import SessionDisplay
+    from skillforge.utils.serialization import load_from_file
+
     try:
         config = load_config()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        console().print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
 
-    sessions = find_saved_sessions(data_dir=config.data_dir)
-    matched = [s for s in sessions if s["session_id"].startswith(session_id)]
+    matched = find_saved_sessions(data_dir=config.data_dir, prefix=session_id)
 
     if not matched:
-        console.print(
+        console().print(
             f"[bold red]Error:[/bold red] No session found matching '{session_id}'"
         )
         raise typer.Exit(1)
 
-    full_id = matched[0]["session_id"]
+    full_id = matched[0].session_id
 
     try:
         data_path = Path(config.data_dir).expanduser()
         session_file = data_path / "sessions" / f"{full_id}.json"
         session = load_from_file(LearningSession, session_file)
         assert isinstance(session, LearningSession)
+        apply_session_events(session, data_path)
 
-        display = SessionDisplay(console)
-        console.print(f"\n[bold cyan]{session.course.topic}[/bold cyan]")
-        console.print(f"[dim]State: {session.state.value}[/dim]\n")
+        display = SessionDisplay(console())
+        console().print(f"\n[bold cyan]{session.course.topic}[/bold cyan]")
+        console().print(f"[dim]State: {session.state.value}[/dim]\n")
         display.display_progress_summary(session.progress)
-        console.print()
+        console().print()
 
     except FileNotFoundError:
-        console.print(f"[bold red]Error:[/bold red] Session '{session_id}' not found.")
+        console().print(
+            f"[bold red]Error:[/bold red] Session '{session_id}' not found."
+        )
         raise typer.Exit(1)
 
 
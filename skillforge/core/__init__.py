@@ -2,20 +2,48 @@
 
 This package contains the core components for course generation, command simulation,
 and exercise validation.
+
+Public names are resolved lazily (PEP 562) so that importing a single submodule,
+or the package itself, does not pull in every core component and its dependencies.
 """
 
-from skillforge.core.course_generator import CourseGenerator
-from skillforge.core.session import SessionManager, find_saved_sessions
-from skillforge.core.simulator import (
-    CommandSimulator,
-    SimulationResult,
-    VirtualFileSystem,
-)
-from skillforge.core.validator import (
-    ExerciseValidator,
-    ValidationResult,
-    ValidationStatus,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from skillforge.core.course_generator import CourseGenerator
+    from skillforge.core.session import (
+        SessionManager,
+        SessionSummary,
+        apply_session_events,
+        find_saved_sessions,
+        iter_saved_sessions,
+    )
+    from skillforge.core.simulator import (
+        CommandSimulator,
+        SimulationResult,
+        VirtualFileSystem,
+    )
+    from skillforge.core.validator import (
+        ExerciseValidator,
+        ValidationResult,
+        ValidationStatus,
+    )
+
+_LAZY: dict[str, str] = {
+    "CourseGenerator": "skillforge.core.course_generator",
+    "CommandSimulator": "skillforge.core.simulator",
+    "SimulationResult": "skillforge.core.simulator",
+    "VirtualFileSystem": "skillforge.core.simulator",
+    "ExerciseValidator": "skillforge.core.validator",
+    "ValidationResult": "skillforge.core.validator",
+    "ValidationStatus": "skillforge.core.validator",
+    "SessionManager": "skillforge.core.session",
+    "SessionSummary": "skillforge.core.session",
+    "apply_session_events": "skillforge.core.session",
+    "find_saved_sessions": "skillforge.core.session",
+    "iter_saved_sessions": "skillforge.core.session",
+}
 
 __all__ = [
     "CourseGenerator",
@@ -26,5 +54,21 @@ __all__ = [
     "ValidationResult",
     "ValidationStatus",
     "SessionManager",
+    "SessionSummary",
+    "apply_session_events",
     "find_saved_sessions",
+    "iter_saved_sessions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -5,16 +5,25 @@ with hash-based caching to reduce API costs and improve performance.
 """
 
 import hashlib
-import json
+import os
 import time
-import uuid
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from skillforge.models.course import Course
 from skillforge.models.enums import Difficulty
 from skillforge.utils.llm_client import BaseLLMClient
-from skillforge.utils.serialization import load_from_file, save_to_file
+from skillforge.utils.serialization import load_from_file, write_bytes_atomic
+
+# Maximum number of courses kept in each generator's in-memory cache
+MEMORY_CACHE_SIZE = 128
+
+
+@cache
+def _course_schema() -> dict[str, Any]:
+    """Build the Course JSON schema once; it never changes for a process."""
+    return Course.model_json_schema()
 
 
 class CourseGenerator:
@@ -42,6 +51,11 @@ class CourseGenerator:
         self.llm_client = llm_client
         self.cache_ttl_days = cache_ttl_days
 
+        # (normalized topic, difficulty, num_lessons) -> (course, cached at),
+        # where "cached at" is when the course was generated or written to disk
+        self._memory_cache: dict[tuple[str, str, int], tuple[Course, float]] = {}
+        self._cache_dir_ready = False
+
         if cache_dir:
             self.cache_dir = Path(cache_dir)
         else:
@@ -76,13 +90,51 @@ class CourseGenerator:
         if num_lessons < 1 or num_lessons > 20:
             raise ValueError("Number of lessons must be between 1 and 20")
 
-        # Try cache first if enabled
-        if use_cache:
-            cache_key = self._generate_cache_key(topic, difficulty, num_lessons)
-            cached_course = self._load_from_cache(cache_key)
+        if not use_cache:
+            course_data = self._generate_course_structure(
+                topic, difficulty, num_lessons
+            )
+            return self._parse_course_data(course_data)
+
+        # In-process hits skip hashing and disk I/O entirely. Callers get a
+        # copy so that editing one course cannot leak into later hits
+        memory_key = (topic.lower().strip(), difficulty.value, num_lessons)
+        entry = self._memory_cache.get(memory_key)
+        if entry is not None:
+            course, cached_at = entry
+            if time.time() - cached_at <= self.cache_ttl_days * 86400:
+                return course.model_copy(deep=True)
+            del self._memory_cache[memory_key]
+
+        course, cached_at = self._load_or_generate_course(
+            topic, difficulty, num_lessons
+        )
+
+        if len(self._memory_cache) >= MEMORY_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._memory_cache[next(iter(self._memory_cache))]
+        self._memory_cache[memory_key] = (course, cached_at)
+
+        return course.model_copy(deep=True)
+
+    def _load_or_generate_course(
+        self, topic: str, difficulty: Difficulty, num_lessons: int
+    ) -> tuple[Course, float]:
+        """Load a course from the on-disk cache, generating it on a miss.
+
+        Args:
+            topic: The course topic
+            difficulty: Target difficulty level
+            num_lessons: Number of lessons
+
+        Returns:
+            Tuple of (cached or newly generated Course, time it was cached)
+        """
+        cache_key = self._generate_cache_key(topic, difficulty, num_lessons)
+        cached = self._load_from_cache(cache_key)
 
-            if cached_course:
-                return cached_course
+        if cached:
+            return cached
 
         # Generate new course
         course_data = self._generate_course_structure(topic, difficulty, num_lessons)
@@ -90,12 +142,9 @@ class CourseGenerator:
         # Parse into Course model
         course = self._parse_course_data(course_data)
 
-        # Cache the result if enabled
-        if use_cache:
-            cache_key = self._generate_cache_key(topic, difficulty, num_lessons)
-            self._save_to_cache(cache_key, course)
+        self._save_to_cache(cache_key, course)
 
-        return course
+        return course, time.time()
 
     def _generate_course_structure(
         self, topic: str, difficulty: Difficulty, num_lessons: int
@@ -139,18 +188,7 @@ class CourseGenerator:
         Raises:
             ValueError: If course data is invalid
         """
-        # Add UUIDs if not present
-        if "id" not in data:
-            data["id"] = str(uuid.uuid4())
-
-        for lesson in data.get("lessons", []):
-            if "id" not in lesson:
-                lesson["id"] = str(uuid.uuid4())
-            for exercise in lesson.get("exercises", []):
-                if "id" not in exercise:
-                    exercise["id"] = str(uuid.uuid4())
-
-        # Use Pydantic validation to create Course
+        # Missing IDs are filled in by the models' default factories
         try:
             return Course.model_validate(data)
         except Exception as e:
@@ -159,10 +197,12 @@ class CourseGenerator:
     def _get_course_schema(self) -> dict[str, Any]:
         """Return JSON schema for course generation.
 
+        The schema is shared between calls and must not be mutated.
+
         Returns:
             JSON schema dictionary
         """
-        return Course.model_json_schema()
+        return _course_schema()
 
     def _get_course_generation_system_prompt(self) -> str:
         """Get system prompt for course generation.
@@ -237,30 +277,27 @@ Generate a complete course following the JSON schema provided."""
         Returns:
             16-character cache key (hex)
         """
-        cache_input = {
-            "topic": topic.lower().strip(),
-            "difficulty": difficulty.value,
-            "num_lessons": num_lessons,
-        }
-        cache_string = json.dumps(cache_input, sort_keys=True)
-        return hashlib.sha256(cache_string.encode()).hexdigest()[:16]
+        cache_string = f"{topic.lower().strip()}|{difficulty.value}|{num_lessons}"
+        return hashlib.blake2b(cache_string.encode(), digest_size=8).hexdigest()
 
-    def _load_from_cache(self, cache_key: str) -> Course | None:
+    def _load_from_cache(self, cache_key: str) -> tuple[Course, float] | None:
         """Load course from cache if exists and not expired.
 
         Args:
             cache_key: The cache key
 
         Returns:
-            Course object if found and valid, None otherwise
+            Tuple of (Course, cache file mtime) if found and valid, None otherwise
         """
         cache_file = self.cache_dir / f"{cache_key}.json"
 
-        if not cache_file.exists():
+        # One stat call answers both "does it exist" and "how old is it"
+        try:
+            mtime = os.stat(cache_file).st_mtime
+        except FileNotFoundError:
             return None
 
         # Check if expired
-        mtime = cache_file.stat().st_mtime
         age_days = (time.time() - mtime) / 86400
 
         if age_days > self.cache_ttl_days:
@@ -273,7 +310,7 @@ Generate a complete course following the JSON schema provided."""
 
         # Load and validate
         try:
-            return load_from_file(Course, cache_file)  # type: ignore[return-value]
+            return load_from_file(Course, cache_file), mtime  # type: ignore[return-value]
         except Exception:
             # Corrupted cache, delete and return None
             try:
@@ -289,16 +326,22 @@ Generate a complete course following the JSON schema provided."""
             cache_key: The cache key
             course: Course object to cache
         """
-        # Create cache directory if it doesn't exist
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
         cache_file = self.cache_dir / f"{cache_key}.json"
 
         try:
-            save_to_file(course, cache_file)
+            # Create the cache directory on the first save only
+            if not self._cache_dir_ready:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._cache_dir_ready = True
+
+            # Compact JSON, replaced atomically so that a concurrent reader
+            # never sees (and deletes as corrupt) a half-written file
+            write_bytes_atomic(
+                cache_file, course.__pydantic_serializer__.to_json(course)
+            )
         except Exception:
-            # Ignore cache write errors
-            pass
+            # Ignore cache write errors; recheck the directory next time
+            self._cache_dir_ready = False
 
     def clear_cache(self) -> int:
         """Clear all cached courses.
@@ -306,16 +349,21 @@ Generate a complete course following the JSON schema provided."""
         Returns:
             Number of cache files deleted
         """
-        if not self.cache_dir.exists():
-            return 0
+        self._memory_cache.clear()
 
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                cache_file.unlink()
-                count += 1
-            except OSError:
-                pass  # Ignore errors on deletion
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        count += 1
+                    except OSError:
+                        pass  # Ignore errors on deletion (e.g. directories)
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
 
         return count
 
@@ -328,18 +376,21 @@ Generate a complete course following the JSON schema provided."""
                 - total_size_bytes: Total cache size in bytes
                 - cache_dir: Cache directory path
         """
-        if not self.cache_dir.exists():
-            return {
-                "cached_courses": 0,
-                "total_size_bytes": 0,
-                "cache_dir": str(self.cache_dir),
-            }
+        cached_courses = 0
+        total_size = 0
 
-        files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in files)
+        # One directory scan; DirEntry caches its stat result
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        cached_courses += 1
+                        total_size += entry.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
         return {
-            "cached_courses": len(files),
+            "cached_courses": cached_courses,
             "total_size_bytes": total_size,
             "cache_dir": str(self.cache_dir),
         }
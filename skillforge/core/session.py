@@ -8,9 +8,11 @@ guided terminal-based experience with progress persistence.
 
 import json
 import os
-import tempfile
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from skillforge.core.simulator import CommandSimulator
 from skillforge.core.validator import ExerciseValidator, ValidationStatus
@@ -24,9 +26,36 @@ from skillforge.models.progress import (
 )
 from skillforge.models.session import LearningSession
 from skillforge.utils.output import SessionDisplay
-from skillforge.utils.serialization import load_from_file, save_to_file
+from skillforge.utils.serialization import (
+    load_from_file,
+    save_to_file,
+    write_bytes_atomic,
+)
+
+SPECIAL_COMMANDS = frozenset({"hint", "skip", "quit", "exit", "help", "status"})
+
+# Longer answers cannot be special commands, so they are never lowercased
+_SPECIAL_COMMAND_MAX_LEN = max(map(len, SPECIAL_COMMANDS))
 
-SPECIAL_COMMANDS = {"hint", "skip", "quit", "exit", "help", "status"}
+# Cache of session summaries used by find_saved_sessions
+SUMMARY_INDEX_FILE = "summaries.jsonl"
+
+
+@dataclass(slots=True, frozen=True)
+class SessionSummary:
+    """Summary of a saved session, as listed by find_saved_sessions.
+
+    Attributes:
+        session_id: Unique session identifier
+        topic: Topic of the session's course
+        state: Saved session state value (e.g. "paused")
+        last_activity: ISO timestamp of the last activity, or "" if unknown
+    """
+
+    session_id: str
+    topic: str
+    state: str
+    last_activity: str
 
 
 class SessionManager:
@@ -59,6 +88,7 @@ class SessionManager:
         self.display = display
         self.data_dir = Path(data_dir).expanduser()
         self._hint_count: int = 0
+        self._has_snapshot: bool = False
 
     def run(self) -> None:
         """Run the interactive learning session.
@@ -127,17 +157,17 @@ class SessionManager:
                 # User quit
                 return
 
-            # Mark lesson complete
+            # Mark lesson complete (we already hold its progress, so there is
+            # no need to look it up again by ID via mark_lesson_complete)
             lesson_progress.status = ProgressStatus.COMPLETED
             lesson_progress.completed_at = datetime.now()
-            progress.mark_lesson_complete(lesson.id)
+            self._record_lesson_progress(lesson_idx, lesson_progress)
             self.display.display_lesson_complete(lesson, lesson_progress)
 
             # Ask to continue to next lesson (unless it's the last one)
             if lesson_idx < len(course.lessons) - 1:
                 if not self.display.prompt_continue():
-                    self.session.pause()
-                    self._save_progress()
+                    # run() pauses and saves once the loop unwinds
                     return
 
     def _run_lesson_exercises(
@@ -195,13 +225,12 @@ class SessionManager:
             # Strip surrounding backticks (users sometimes type `command`)
             if answer.startswith("`") and answer.endswith("`") and len(answer) > 1:
                 answer = answer[1:-1].strip()
-            answer_stripped = answer.lower()
 
             # Handle special commands
-            if answer_stripped in SPECIAL_COMMANDS:
-                result = self._handle_special_command(
-                    answer_stripped, exercise, ex_progress
-                )
+            if len(answer) <= _SPECIAL_COMMAND_MAX_LEN and (
+                (command := answer.lower()) in SPECIAL_COMMANDS
+            ):
+                result = self._handle_special_command(command, exercise, ex_progress)
                 if result == "quit":
                     return None
                 if result == "skip":
@@ -209,10 +238,15 @@ class SessionManager:
                 # "continue" means keep prompting
                 continue
 
-            # Simulate the command
-            sim_result = self.simulator.simulate(answer, context=exercise.instruction)
-            if sim_result.output:
-                self.display.display_simulation_result(sim_result.output)
+            # Simulate the command, unless it is exactly the expected answer:
+            # the exercise ends right away, and simulation may be an LLM call
+            expected = exercise.expected_output
+            if expected is None or answer != expected.strip():
+                sim_result = self.simulator.simulate(
+                    answer, context=exercise.instruction
+                )
+                if sim_result.output:
+                    self.display.display_simulation_result(sim_result.output)
 
             # Validate the answer
             ex_progress.attempts += 1
@@ -227,7 +261,7 @@ class SessionManager:
             if validation.status == ValidationStatus.CORRECT:
                 ex_progress.status = ProgressStatus.COMPLETED
                 ex_progress.completed_at = datetime.now()
-                self._save_progress()
+                self._record_exercise_progress(ex_progress)
                 return True
 
             # Show hint on incorrect/partial
@@ -252,8 +286,8 @@ class SessionManager:
             "quit", "skip", or "continue"
         """
         if command in ("quit", "exit"):
+            # run() saves the snapshot as soon as the quit unwinds the loop
             self.session.pause()
-            self._save_progress()
             self.display.console.print(
                 "[yellow]Progress saved. "
                 "Use 'skillforge resume' to continue.[/yellow]"
@@ -263,7 +297,7 @@ class SessionManager:
         if command == "skip":
             ex_progress.status = ProgressStatus.FAILED
             self.display.console.print("[yellow]Exercise skipped.[/yellow]")
-            self._save_progress()
+            self._record_exercise_progress(ex_progress)
             return "skip"
 
         if command == "hint":
@@ -287,22 +321,169 @@ class SessionManager:
         return "continue"
 
     def _save_progress(self) -> None:
-        """Persist session to disk using atomic write."""
+        """Persist a full session snapshot to disk using atomic write.
+
+        The snapshot supersedes any events recorded since the last one, so
+        the session's event log is removed afterwards.
+        """
         sessions_dir = self.data_dir / "sessions"
-        sessions_dir.mkdir(parents=True, exist_ok=True)
+        if not self._has_snapshot:
+            sessions_dir.mkdir(parents=True, exist_ok=True)
 
         target = sessions_dir / f"{self.session.session_id}.json"
 
-        # Atomic write: write to temp file then rename
+        # Compact JSON bytes straight from pydantic-core; snapshots are read
+        # back by the loader, not by people, so indentation is wasted I/O
+        data = self.session.__pydantic_serializer__.to_json(self.session)
+
         try:
-            fd, tmp_path = tempfile.mkstemp(dir=str(sessions_dir), suffix=".tmp")
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(self.session.model_dump_json(indent=2))
-            Path(tmp_path).replace(target)
+            write_bytes_atomic(target, data)
         except OSError:
             # Best-effort fallback: direct write
             save_to_file(self.session, target)
 
+        self._update_summary_index(target)
+        self._has_snapshot = True
+        try:
+            _events_file(sessions_dir, self.session.session_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _update_summary_index(self, session_file: Path) -> None:
+        """Record this session's summary in the index after a snapshot.
+
+        The summary comes from the in-memory session, so the next listing
+        does not have to re-read and parse the snapshot it just wrote.
+
+        Args:
+            session_file: The snapshot file that was just written
+        """
+        try:
+            st = os.stat(session_file)
+        except OSError:
+            return
+
+        header = self.session.model_dump(
+            mode="json",
+            include={
+                "session_id": True,
+                "course": {"topic"},
+                "state": True,
+                "last_activity_at": True,
+            },
+        )
+        summary = SessionSummary(
+            session_id=header["session_id"],
+            topic=header["course"]["topic"],
+            state=header["state"],
+            last_activity=header["last_activity_at"],
+        )
+
+        sessions_dir = session_file.parent
+        index = _load_summary_index(sessions_dir)
+        index[session_file.name] = _summary_record(session_file.name, st, summary)
+        _write_summary_index(sessions_dir, index)
+
+    def _record_exercise_progress(self, ex_progress: ExerciseProgress) -> None:
+        """Append an exercise's progress to the session's event log.
+
+        Args:
+            ex_progress: The exercise progress that changed
+        """
+        position = self._exercise_position(ex_progress)
+        if position is None:
+            # Not part of this session's progress; only a snapshot is safe
+            self._save_progress()
+            return
+
+        lesson_idx, ex_idx = position
+        self._append_event(
+            {
+                "kind": "exercise",
+                "last_activity_at": self.session.last_activity_at.isoformat(),
+                "lesson_index": lesson_idx,
+                "exercise_index": ex_idx,
+                "exercise": ex_progress.model_dump(mode="json"),
+            }
+        )
+
+    def _exercise_position(
+        self, ex_progress: ExerciseProgress
+    ) -> tuple[int, int] | None:
+        """Find where an exercise's progress sits in the session.
+
+        Exercise IDs come from the generated course and may repeat across
+        lessons, so the progress object itself is located. The current
+        lesson is checked first, since that is where exercises are run.
+
+        Args:
+            ex_progress: Progress object held by the session
+
+        Returns:
+            Tuple of (lesson index, exercise index), or None if not found
+        """
+        lessons = self.session.progress.lesson_progress
+        current = self.session.progress.current_lesson_index
+        order = [current] if 0 <= current < len(lessons) else []
+        order.extend(i for i in range(len(lessons)) if i != current)
+        for lesson_idx in order:
+            for ex_idx, ep in enumerate(lessons[lesson_idx].exercise_progress):
+                if ep is ex_progress:
+                    return lesson_idx, ex_idx
+        return None
+
+    def _record_lesson_progress(
+        self, lesson_idx: int, lesson_progress: LessonProgress
+    ) -> None:
+        """Append a lesson's status and the current lesson to the event log.
+
+        The lesson's exercises are logged by their own events, so they are
+        left out here.
+
+        Args:
+            lesson_idx: Position of the lesson in the course
+            lesson_progress: The lesson progress that changed
+        """
+        self._append_event(
+            {
+                "kind": "lesson",
+                "last_activity_at": self.session.last_activity_at.isoformat(),
+                "lesson_index": lesson_idx,
+                "current_lesson_index": self.session.progress.current_lesson_index,
+                "lesson": lesson_progress.model_dump(
+                    mode="json", exclude={"exercise_progress"}
+                ),
+            }
+        )
+
+    def _append_event(self, event: dict[str, Any]) -> None:
+        """Append an event to the session's event log.
+
+        Appending one small line is much cheaper than rewriting the whole
+        session, which only happens at session boundaries (quit, pause,
+        completion). Events are folded back in by load_session.
+
+        Args:
+            event: JSON-serializable event record
+        """
+        if not self._has_snapshot:
+            # Events are only meaningful on top of a snapshot
+            self._save_progress()
+            return
+
+        line = (json.dumps(event) + "\n").encode("utf-8")
+
+        events_file = _events_file(self.data_dir / "sessions", self.session.session_id)
+        try:
+            # Private to the user, like the snapshots it is folded into
+            fd = os.open(events_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            self._save_progress()
+
     @classmethod
     def create_new_session(
         cls,
@@ -401,47 +582,328 @@ class SessionManager:
 
         session = load_from_file(LearningSession, session_file)
         assert isinstance(session, LearningSession)
+        apply_session_events(session, data_path)
         session.resume()
 
-        return cls(
+        manager = cls(
             session=session,
             simulator=simulator,
             validator=validator,
             display=display,
             data_dir=data_dir,
         )
+        manager._has_snapshot = True
+        return manager
+
+
+def _events_file(sessions_dir: Path, session_id: str) -> Path:
+    """Return the path of a session's append-only event log.
+
+    Args:
+        sessions_dir: Directory holding session files
+        session_id: The session ID
+
+    Returns:
+        Path to the ``<session_id>.events.jsonl`` file
+    """
+    return sessions_dir / f"{session_id}.events.jsonl"
+
+
+def apply_session_events(
+    session: LearningSession,
+    data_dir: str | Path = "~/.skillforge",
+) -> None:
+    """Fold events recorded after the last snapshot into a loaded session.
+
+    Each event carries the full state of one exercise, or the status of one
+    lesson along with the current lesson index, so replaying an event that
+    the snapshot already contains is harmless. Events address lessons and
+    exercises by position, since generated IDs may repeat across lessons.
+    Malformed lines, such as a partial write from a crash, and events that
+    no longer match the session's course are skipped.
+
+    Args:
+        session: Session loaded from its snapshot
+        data_dir: Base data directory
+    """
+    sessions_dir = Path(data_dir).expanduser() / "sessions"
+    try:
+        lines = _events_file(sessions_dir, session.session_id).read_bytes().splitlines()
+    except FileNotFoundError:
+        return
+
+    lessons = session.progress.lesson_progress
+
+    for line in lines:
+        try:
+            event = json.loads(line)
+            last_activity = datetime.fromisoformat(event["last_activity_at"])
+            lesson_idx = int(event["lesson_index"])
+            if event.get("kind") == "lesson":
+                lesson = LessonProgress.model_validate(event["lesson"])
+                current_index = int(event["current_lesson_index"])
+            else:
+                ex_progress = ExerciseProgress.model_validate(event["exercise"])
+                ex_idx = int(event["exercise_index"])
+        except (ValueError, KeyError, TypeError):
+            continue
+
+        if not 0 <= lesson_idx < len(lessons):
+            continue
+        lesson_progress = lessons[lesson_idx]
+
+        if event.get("kind") == "lesson":
+            if lesson_progress.lesson_id != lesson.lesson_id:
+                continue
+            lesson_progress.status = lesson.status
+            lesson_progress.started_at = lesson.started_at
+            lesson_progress.completed_at = lesson.completed_at
+            session.progress.current_lesson_index = current_index
+        else:
+            exercises = lesson_progress.exercise_progress
+            if not (
+                0 <= ex_idx < len(exercises)
+                and exercises[ex_idx].exercise_id == ex_progress.exercise_id
+            ):
+                continue
+            exercises[ex_idx] = ex_progress
+        session.last_activity_at = max(session.last_activity_at, last_activity)
+
+
+def _last_event_activity(sessions_dir: Path, session_id: str) -> str | None:
+    """Return the last activity recorded in a session's event log.
+
+    Args:
+        sessions_dir: Directory holding session files
+        session_id: The session ID
+
+    Returns:
+        ISO timestamp from the newest readable event, or None if there is none
+    """
+    try:
+        lines = _events_file(sessions_dir, session_id).read_bytes().splitlines()
+    except OSError:
+        return None
+
+    for line in reversed(lines):
+        try:
+            return str(json.loads(line)["last_activity_at"])
+        except (ValueError, KeyError, TypeError):
+            continue
+    return None
+
+
+def _session_files(sessions_dir: Path, prefix: str) -> Iterator[os.DirEntry[str]]:
+    """Yield session files whose name starts with a prefix.
+
+    Args:
+        sessions_dir: Directory holding session files
+        prefix: Full or partial session ID
+
+    Yields:
+        Directory entries of candidate ``<session_id>.json`` files
+    """
+    try:
+        it = os.scandir(sessions_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    with it:
+        for entry in it:
+            name = entry.name
+            if not (name.endswith(".json") and name.startswith(prefix)):
+                continue
+            if entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _read_summary(path: str) -> SessionSummary | None:
+    """Parse a session file into a summary.
+
+    Args:
+        path: Path to a session file
+
+    Returns:
+        The session summary, or None if the file cannot be read or parsed
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    return SessionSummary(
+        session_id=data.get("session_id", os.path.basename(path)[:-5]),
+        topic=data.get("course", {}).get("topic", "Unknown"),
+        state=data.get("state", "unknown"),
+        last_activity=data.get("last_activity_at") or "",
+    )
+
+
+def iter_saved_sessions(
+    data_dir: str | Path = "~/.skillforge",
+    prefix: str = "",
+) -> Iterator[SessionSummary]:
+    """Lazily yield saved sessions whose ID starts with a prefix.
+
+    Session files are named ``<session_id>.json``, so files that cannot match
+    are skipped by name without being read. Sessions are yielded in directory
+    order; stop iterating early to avoid parsing the remaining files.
+
+    Args:
+        data_dir: Base data directory
+        prefix: Full or partial session ID (default: match all)
+
+    Yields:
+        Summaries of matching sessions
+    """
+    sessions_dir = Path(data_dir).expanduser() / "sessions"
+    for entry in _session_files(sessions_dir, prefix):
+        summary = _read_summary(entry.path)
+        if summary is not None and summary.session_id.startswith(prefix):
+            yield summary
+
+
+def _load_summary_index(sessions_dir: Path) -> dict[str, dict[str, Any]]:
+    """Read the session summary index.
+
+    Args:
+        sessions_dir: Directory holding session files
+
+    Returns:
+        Index records keyed by session file name; empty if there is no index
+    """
+    try:
+        lines = (sessions_dir / SUMMARY_INDEX_FILE).read_bytes().splitlines()
+    except OSError:
+        return {}
+
+    index = {}
+    for line in lines:
+        try:
+            record = json.loads(line)
+            index[record["file"]] = record
+        except (ValueError, KeyError, TypeError):
+            continue
+    return index
+
+
+def _write_summary_index(sessions_dir: Path, index: dict[str, dict[str, Any]]) -> None:
+    """Atomically replace the session summary index.
+
+    The index is only a cache, so write errors are ignored.
+
+    Args:
+        sessions_dir: Directory holding session files
+        index: Index records keyed by session file name
+    """
+    data = "".join(json.dumps(record) + "\n" for record in index.values())
+    try:
+        write_bytes_atomic(sessions_dir / SUMMARY_INDEX_FILE, data.encode("utf-8"))
+    except OSError:
+        pass
+
+
+def _summary_record(
+    name: str, st: os.stat_result, summary: SessionSummary
+) -> dict[str, Any]:
+    """Build the index record for a session file.
+
+    Args:
+        name: Session file name
+        st: Stat result of the session file
+        summary: Summary of the session
+
+    Returns:
+        Index record, valid while the file's inode, size and mtime are unchanged
+    """
+    return {
+        "file": name,
+        "stat": [st.st_ino, st.st_size, st.st_mtime_ns],
+        **asdict(summary),
+    }
+
+
+def _summary_from_record(
+    record: dict[str, Any] | None, st: os.stat_result
+) -> SessionSummary | None:
+    """Return the summary stored in an index record if it is still current.
+
+    Args:
+        record: Index record for a session file, if any
+        st: Current stat result of the session file
+
+    Returns:
+        The cached summary, or None if the record is missing or stale
+    """
+    if record is None or record.get("stat") != [
+        st.st_ino,
+        st.st_size,
+        st.st_mtime_ns,
+    ]:
+        return None
+    try:
+        return SessionSummary(
+            session_id=record["session_id"],
+            topic=record["topic"],
+            state=record["state"],
+            last_activity=record["last_activity"] or "",
+        )
+    except KeyError:
+        return None
 
 
 def find_saved_sessions(
     data_dir: str | Path = "~/.skillforge",
-) -> list[dict[str, str]]:
+    prefix: str = "",
+) -> list[SessionSummary]:
     """List resumable sessions.
 
+    Summaries are cached in an index file next to the sessions, keyed by each
+    file's inode, size and modification time. Listing therefore reads one
+    small file plus only the sessions that changed since the last listing.
+    Events logged since a session's last snapshot do not touch its snapshot,
+    so the last activity is taken from the session's event log if it has one.
+
     Args:
         data_dir: Base data directory
+        prefix: Optional full or partial session ID to filter by
 
     Returns:
-        List of dicts with session_id, topic, state, last_activity
+        Session summaries, most recently active first
     """
     sessions_dir = Path(data_dir).expanduser() / "sessions"
-    if not sessions_dir.exists():
-        return []
+    index = _load_summary_index(sessions_dir)
+
+    # Keep records outside the scanned prefix; rebuild the rest from the scan
+    updated = {name: r for name, r in index.items() if not name.startswith(prefix)}
+    results = []
 
-    results: list[dict[str, str]] = []
-    for path in sessions_dir.glob("*.json"):
+    for entry in _session_files(sessions_dir, prefix):
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            results.append(
-                {
-                    "session_id": data.get("session_id", path.stem),
-                    "topic": data.get("course", {}).get("topic", "Unknown"),
-                    "state": data.get("state", "unknown"),
-                    "last_activity": data.get("last_activity_at", ""),
-                }
-            )
-        except (json.JSONDecodeError, OSError):
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+
+        summary = _summary_from_record(index.get(entry.name), st)
+        if summary is not None:
+            updated[entry.name] = index[entry.name]
+        else:
+            summary = _read_summary(entry.path)
+            if summary is None:
+                continue
+            updated[entry.name] = _summary_record(entry.name, st, summary)
+
+        if not summary.session_id.startswith(prefix):
             continue
+        last_activity = _last_event_activity(sessions_dir, summary.session_id)
+        if last_activity is not None and last_activity > summary.last_activity:
+            summary = replace(summary, last_activity=last_activity)
+        results.append(summary)
+
+    if updated != index:
+        _write_summary_index(sessions_dir, updated)
 
     # Sort by last activity, newest first
-    results.sort(key=lambda x: x["last_activity"], reverse=True)
+    results.sort(key=lambda x: x.last_activity, reverse=True)
     return results
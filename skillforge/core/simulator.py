@@ -7,14 +7,90 @@ without actually running commands or modifying the real file system.
 
 import re
 import shlex
+import sys
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from skillforge.utils.llm_client import BaseLLMClient
 
+# Statements that mark input as Python code rather than a shell command
+_PYTHON_CODE_RE = re.compile(
+    r"import\s+\w+"
+    r"|from\s+\w+\s+import"
+    r"|\w+\s*=\s*.+"
+    r"|print\("
+    r"|def\s+\w+\("
+    r"|class\s+\w+"
+)
+_PRINT_RE = re.compile(r'print\(["\'](.+?)["\']\)')
+
+# Prompts for simulating commands that have no built-in handler
+_LLM_SYSTEM_PROMPT = (
+    "You are simulating command execution in a safe "
+    "learning environment. Provide realistic but safe outputs."
+)
+_LLM_PROMPT_TEMPLATE = """Simulate the output of this command in a learning environment:
 
-@dataclass
+Command: {command}
+
+{context_block}Provide a realistic but safe simulation of what \
+this command would output.
+Keep the output concise and educational.
+
+Respond in the following format:
+Success: [yes/no]
+Exit Code: [number]
+Output:
+[command output here]
+"""
+
+_LLM_BATCH_PROMPT_TEMPLATE = """Simulate the output of each of these commands \
+in a learning environment:
+
+{commands}
+
+{context_block}Provide a realistic but safe simulation of what \
+each command would output.
+Keep each output concise and educational.
+
+Respond with one block per command, in the same order, each starting with the \
+command's number in brackets:
+[number]
+Success: [yes/no]
+Exit Code: [number]
+Output:
+[command output here]
+"""
+
+# Line that opens one command's block in a batched LLM reply, e.g. "[2]"
+_LLM_BATCH_BLOCK_RE = re.compile(r"^\s*\[(\d+)\]\s*$", re.MULTILINE)
+
+# "Success: yes/no" and everything after "Output:" from an LLM simulation reply;
+# both parts are optional so a partial reply still matches
+_LLM_RESPONSE_RE = re.compile(
+    r"(?:.*?Success:\s*(yes|no)\b)?(?:.*?Output:\s*(.*))?",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Maximum number of normalized paths remembered per VirtualFileSystem
+_NORM_CACHE_SIZE = 1024
+
+# Initial state of a fresh simulated environment
+_HOME_DIR = "/home/user"
+_DEFAULT_DIRS = ("/", "/home", _HOME_DIR, "/tmp")
+_DEFAULT_ENV = MappingProxyType(
+    {"HOME": _HOME_DIR, "USER": "user", "PATH": "/usr/local/bin:/usr/bin:/bin"}
+)
+
+
+def _parent(norm_path: str) -> str:
+    """Return the parent of an absolute normalized path ("/" for the root)."""
+    return norm_path[: norm_path.rfind("/")] or "/"
+
+
+@dataclass(slots=True)
 class SimulationResult:
     """Result of a command simulation.
 
@@ -43,8 +119,15 @@ class VirtualFileSystem:
     def __init__(self) -> None:
         """Initialize the virtual file system."""
         self.files: dict[str, str] = {}
-        self.directories: set[str] = {"/", "/home", "/home/user", "/tmp"}
-        self.current_dir = "/home/user"
+        self.directories: set[str] = set()
+        # Directory path -> names of its direct children (files and dirs)
+        self.children: dict[str, set[str]] = {}
+        for directory in _DEFAULT_DIRS:
+            self._add_directory(directory)
+        self.current_dir = _HOME_DIR
+        # (current_dir, path) -> normalized path; normalization does not
+        # depend on file system contents, so entries never go stale
+        self._norm_cache: dict[tuple[str, str], str] = {}
 
     def normalize_path(self, path: str) -> str:
         """Normalize a path to absolute form.
@@ -55,6 +138,21 @@ class VirtualFileSystem:
         Returns:
             Absolute normalized path
         """
+        # Already-clean absolute paths are returned as-is
+        if (
+            path.startswith("/")
+            and "//" not in path
+            and "/./" not in path
+            and "/../" not in path
+            and not path.endswith(("/", "/.", "/.."))
+        ):
+            return path
+
+        key = (self.current_dir, path)
+        cached = self._norm_cache.get(key)
+        if cached is not None:
+            return cached
+
         if not path.startswith("/"):
             # Relative path - make it absolute
             if self.current_dir == "/":
@@ -71,7 +169,34 @@ class VirtualFileSystem:
             elif part and part != ".":
                 parts.append(part)
 
-        return "/" + "/".join(parts) if parts else "/"
+        # Interned so repeated lookups of the same path share one string object
+        normalized = sys.intern("/" + "/".join(parts)) if parts else "/"
+
+        if len(self._norm_cache) >= _NORM_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._norm_cache[next(iter(self._norm_cache))]
+        self._norm_cache[key] = normalized
+        return normalized
+
+    def _add_child(self, norm_path: str) -> None:
+        """Register a normalized path under its parent directory.
+
+        Args:
+            norm_path: Absolute normalized path of a new file or directory
+        """
+        if norm_path == "/":
+            return
+        i = norm_path.rfind("/")
+        self.children.setdefault(norm_path[:i] or "/", set()).add(norm_path[i + 1 :])
+
+    def _add_directory(self, norm_path: str) -> None:
+        """Add a normalized directory path and index it under its parent.
+
+        Args:
+            norm_path: Absolute normalized directory path
+        """
+        self.directories.add(norm_path)
+        self._add_child(norm_path)
 
     def exists(self, path: str) -> bool:
         """Check if a path exists.
@@ -133,9 +258,11 @@ class VirtualFileSystem:
         """
         norm_path = self.normalize_path(path)
         # Create parent directory if needed
-        parent = str(Path(norm_path).parent)
-        if parent and parent not in self.directories:
-            self.directories.add(parent)
+        parent = _parent(norm_path)
+        if parent not in self.directories:
+            self._add_directory(parent)
+        if norm_path not in self.files:
+            self._add_child(norm_path)
         self.files[norm_path] = content
 
     def list_directory(self, path: str = ".") -> list[str]:
@@ -153,33 +280,12 @@ class VirtualFileSystem:
         """
         norm_path = self.normalize_path(path)
 
-        if not self.exists(norm_path):
+        if norm_path not in self.directories:
+            if norm_path in self.files:
+                raise NotADirectoryError(f"Not a directory: {path}")
             raise FileNotFoundError(f"No such directory: {path}")
 
-        if not self.is_directory(norm_path):
-            raise NotADirectoryError(f"Not a directory: {path}")
-
-        # Find all direct children
-        results = []
-        prefix = norm_path if norm_path.endswith("/") else norm_path + "/"
-        if norm_path == "/":
-            prefix = "/"
-
-        # Check files
-        for file_path in self.files:
-            if file_path.startswith(prefix):
-                remainder = file_path[len(prefix) :]
-                if "/" not in remainder:  # Direct child
-                    results.append(remainder)
-
-        # Check directories
-        for dir_path in self.directories:
-            if dir_path != norm_path and dir_path.startswith(prefix):
-                remainder = dir_path[len(prefix) :]
-                if "/" not in remainder:  # Direct child
-                    results.append(remainder)
-
-        return sorted(results)
+        return sorted(self.children.get(norm_path, ()))
 
     def create_directory(self, path: str) -> None:
         """Create a directory.
@@ -188,13 +294,15 @@ class VirtualFileSystem:
             path: Path to directory to create
         """
         norm_path = self.normalize_path(path)
-        self.directories.add(norm_path)
+        if norm_path in self.directories:
+            return
+        self._add_directory(norm_path)
 
-        # Also create parent directories
-        parent = str(Path(norm_path).parent)
-        while parent and parent not in self.directories and parent != "/":
-            self.directories.add(parent)
-            parent = str(Path(parent).parent)
+        # Also create missing parent directories, stopping at the first that exists
+        parent = _parent(norm_path)
+        while parent not in self.directories:
+            self._add_directory(parent)
+            parent = _parent(parent)
 
     def touch(self, path: str) -> None:
         """Create an empty file or update its timestamp.
@@ -204,7 +312,55 @@ class VirtualFileSystem:
         """
         norm_path = self.normalize_path(path)
         if norm_path not in self.files:
-            self.write_file(path, "")
+            self.write_file(norm_path, "")
+
+
+# Canned output for the simulated developer tools
+_PIP_USAGE = (
+    "Usage: pip <command> [options]\n\n"
+    "Commands:\n  install   Install packages\n"
+    "  list      List installed packages"
+)
+_PIP_LIST_OUTPUT = "Package    Version\n---------- -------\npip        24.0"
+_GIT_USAGE = "usage: git [--version] [--help] <command> [<args>]"
+_GIT_STATUS_OUTPUT = "On branch main\nnothing to commit, working tree clean"
+_DOCKER_USAGE = (
+    "Usage: docker [OPTIONS] COMMAND\n\nA self-sufficient runtime for containers"
+)
+_DOCKER_PS_OUTPUT = "CONTAINER ID   IMAGE     COMMAND   CREATED   STATUS   PORTS"
+_KUBECTL_USAGE = "kubectl controls the Kubernetes cluster manager."
+
+_Handler = Callable[["CommandSimulator", list[str]], SimulationResult]
+
+
+def _result_from_llm_response(response: str) -> SimulationResult:
+    """Build a simulation result from an LLM reply in the prompted format.
+
+    Args:
+        response: Reply text with "Success:" and "Output:" sections
+
+    Returns:
+        SimulationResult marked as LLM-simulated
+    """
+    match = _LLM_RESPONSE_RE.match(response)
+    verdict, body = match.groups() if match else (None, None)
+    success = verdict is not None and verdict.lower() == "yes"
+    return SimulationResult(
+        success=success,
+        output=body.strip() if body is not None else response,
+        exit_code=0 if success else 1,
+        state_changes={"llm_simulated": True},
+    )
+
+
+def _llm_error_result(error: Exception) -> SimulationResult:
+    """Build the result reported when the LLM simulation call fails."""
+    return SimulationResult(
+        success=False,
+        output="",
+        error=f"Simulation error: {str(error)}",
+        exit_code=1,
+    )
 
 
 class CommandSimulator:
@@ -221,14 +377,13 @@ class CommandSimulator:
             llm_client: LLM client for fallback simulation of unknown commands
         """
         self.llm_client = llm_client
-        self.filesystem = VirtualFileSystem()
-        self.environment: dict[str, str] = {
-            "HOME": "/home/user",
-            "USER": "user",
-            "PATH": "/usr/local/bin:/usr/bin:/bin",
-        }
-        self.python_imports: set[str] = set()
-        self.python_variables: dict[str, Any] = {}
+        self.filesystem: VirtualFileSystem
+        self.environment: dict[str, str]
+        self.python_imports: set[str]
+        self.python_variables: dict[str, Any]
+        # Commands awaiting a shared LLM request while simulate_batch runs
+        self._llm_batch: list[str] | None = None
+        self.reset()
 
     def simulate(self, command: str, context: str | None = None) -> SimulationResult:
         """Simulate execution of a command.
@@ -242,13 +397,14 @@ class CommandSimulator:
         """
         command = command.strip()
         if not command:
-            return SimulationResult(
-                success=True, output="", exit_code=0, state_changes={}
-            )
+            return SimulationResult(success=True, output="")
 
-        # Try to parse the command
+        # Try to parse the command; only quoting and escapes need shlex
         try:
-            parts = shlex.split(command)
+            if "'" in command or '"' in command or "\\" in command:
+                parts = shlex.split(command)
+            else:
+                parts = command.split()
         except ValueError:
             # Invalid syntax
             return SimulationResult(
@@ -259,44 +415,23 @@ class CommandSimulator:
             )
 
         if not parts:
-            return SimulationResult(
-                success=True, output="", exit_code=0, state_changes={}
-            )
+            return SimulationResult(success=True, output="")
 
         cmd = parts[0]
-        args = parts[1:] if len(parts) > 1 else []
+        args = parts[1:]
 
         # Check for known command patterns
-        if cmd == "echo":
-            return self._simulate_echo(args)
-        elif cmd == "ls":
-            return self._simulate_ls(args)
-        elif cmd == "cat":
-            return self._simulate_cat(args)
-        elif cmd == "mkdir":
-            return self._simulate_mkdir(args)
-        elif cmd == "touch":
-            return self._simulate_touch(args)
-        elif cmd == "cd":
-            return self._simulate_cd(args)
-        elif cmd == "pwd":
-            return self._simulate_pwd()
-        elif cmd == "python" or cmd == "python3":
+        handler = self._HANDLERS.get(cmd)
+        if handler is not None:
+            return handler(self, args)
+        if cmd == "python" or cmd == "python3":
             return self._simulate_python_command(args, context)
-        elif cmd == "pip" or cmd == "pip3":
-            return self._simulate_pip(args)
-        elif cmd == "git":
-            return self._simulate_git(args)
-        elif cmd == "docker":
-            return self._simulate_docker(args)
-        elif cmd == "kubectl":
-            return self._simulate_kubectl(args)
-        else:
-            # Check if it's a Python statement
-            if self._is_python_code(command):
-                return self._simulate_python_code(command, context)
-            # Unknown command - use LLM fallback
-            return self._simulate_with_llm(command, context)
+
+        # Check if it's a Python statement
+        if self._is_python_code(command):
+            return self._simulate_python_code(command, context)
+        # Unknown command - use LLM fallback
+        return self._simulate_with_llm(command, context)
 
     def _simulate_echo(self, args: list[str]) -> SimulationResult:
         """Simulate echo command."""
@@ -366,13 +501,13 @@ class CommandSimulator:
         """Simulate cd command."""
         if not args:
             # cd with no args goes to home
-            self.filesystem.current_dir = self.environment.get("HOME", "/home/user")
+            self.filesystem.current_dir = self.environment.get("HOME", _HOME_DIR)
             return SimulationResult(success=True, output="", exit_code=0)
 
         path = args[0]
         norm_path = self.filesystem.normalize_path(path)
 
-        if not self.filesystem.is_directory(norm_path):
+        if norm_path not in self.filesystem.directories:
             return SimulationResult(
                 success=False,
                 output="",
@@ -388,7 +523,7 @@ class CommandSimulator:
             state_changes={"current_directory": norm_path},
         )
 
-    def _simulate_pwd(self) -> SimulationResult:
+    def _simulate_pwd(self, args: list[str]) -> SimulationResult:
         """Simulate pwd command."""
         return SimulationResult(
             success=True, output=self.filesystem.current_dir, exit_code=0
@@ -429,15 +564,7 @@ class CommandSimulator:
 
     def _is_python_code(self, command: str) -> bool:
         """Check if command looks like Python code."""
-        python_patterns = [
-            r"^import\s+\w+",
-            r"^from\s+\w+\s+import",
-            r"^\w+\s*=\s*.+",
-            r"^print\(",
-            r"^def\s+\w+\(",
-            r"^class\s+\w+",
-        ]
-        return any(re.match(pattern, command) for pattern in python_patterns)
+        return _PYTHON_CODE_RE.match(command) is not None
 
     def _simulate_python_code(self, code: str, context: str | None) -> SimulationResult:
         """Simulate Python code execution."""
@@ -448,23 +575,24 @@ class CommandSimulator:
             return self._simulate_python_import(code)
 
         # Handle simple print statements
-        print_match = re.match(r'print\(["\'](.+?)["\']\)', code)
+        print_match = _PRINT_RE.match(code)
         if print_match:
             output = print_match.group(1)
             return SimulationResult(success=True, output=output, exit_code=0)
 
-        # Handle simple variable assignments
-        assign_match = re.match(r"(\w+)\s*=\s*(.+)", code)
-        if assign_match:
-            var_name = assign_match.group(1)
-            var_value = assign_match.group(2)
-            self.python_variables[var_name] = var_value
-            return SimulationResult(
-                success=True,
-                output="",
-                exit_code=0,
-                state_changes={"python_variable": var_name},
-            )
+        # Handle simple variable assignments (but not "==" comparisons)
+        eq = code.find("=")
+        if eq > 0 and code[eq + 1 : eq + 2] != "=":
+            var_name = code[:eq].strip()
+            var_value = code[eq + 1 :].strip()
+            if var_name.isidentifier() and var_value:
+                self.python_variables[var_name] = var_value
+                return SimulationResult(
+                    success=True,
+                    output="",
+                    exit_code=0,
+                    state_changes={"python_variable": var_name},
+                )
 
         # For more complex code, use LLM fallback
         return self._simulate_with_llm(code, context)
@@ -492,157 +620,150 @@ class CommandSimulator:
     def _simulate_pip(self, args: list[str]) -> SimulationResult:
         """Simulate pip command."""
         if not args:
-            return SimulationResult(
-                success=True,
-                output="Usage: pip <command> [options]\n\n"
-                "Commands:\n  install   Install packages\n"
-                "  list      List installed packages",
-                exit_code=0,
-            )
+            return SimulationResult(success=True, output=_PIP_USAGE, exit_code=0)
 
-        cmd = args[0]
-        if cmd == "install":
-            if len(args) < 2:
-                return SimulationResult(
-                    success=False,
-                    output="",
-                    error="ERROR: You must give at least one requirement to install",
-                    exit_code=1,
-                )
-            package = args[1]
-            return SimulationResult(
-                success=True,
-                output=f"Successfully installed {package}",
-                exit_code=0,
-                state_changes={"installed_package": package},
-            )
-        elif cmd == "list":
-            return SimulationResult(
-                success=True,
-                output="Package    Version\n---------- -------\npip        24.0",
-                exit_code=0,
-            )
-        else:
+        handler = self._PIP_SUBCOMMANDS.get(args[0])
+        if handler is not None:
+            return handler(self, args[1:])
+        return SimulationResult(
+            success=False,
+            output="",
+            error=f"ERROR: unknown command '{args[0]}'",
+            exit_code=1,
+        )
+
+    def _pip_install(self, args: list[str]) -> SimulationResult:
+        """Simulate pip install."""
+        if not args:
             return SimulationResult(
                 success=False,
                 output="",
-                error=f"ERROR: unknown command '{cmd}'",
+                error="ERROR: You must give at least one requirement to install",
                 exit_code=1,
             )
+        package = args[0]
+        return SimulationResult(
+            success=True,
+            output=f"Successfully installed {package}",
+            exit_code=0,
+            state_changes={"installed_package": package},
+        )
+
+    def _pip_list(self, args: list[str]) -> SimulationResult:
+        """Simulate pip list."""
+        return SimulationResult(success=True, output=_PIP_LIST_OUTPUT, exit_code=0)
 
     def _simulate_git(self, args: list[str]) -> SimulationResult:
         """Simulate git command."""
         if not args:
-            return SimulationResult(
-                success=True,
-                output="usage: git [--version] [--help] <command> [<args>]",
-                exit_code=0,
-            )
+            return SimulationResult(success=True, output=_GIT_USAGE, exit_code=0)
 
-        cmd = args[0]
-        if cmd == "init":
-            return SimulationResult(
-                success=True,
-                output="Initialized empty Git repository in .git/",
-                exit_code=0,
-                state_changes={"git_initialized": True},
-            )
-        elif cmd == "status":
-            return SimulationResult(
-                success=True,
-                output="On branch main\nnothing to commit, working tree clean",
-                exit_code=0,
-            )
-        elif cmd == "clone":
-            if len(args) < 2:
-                return SimulationResult(
-                    success=False,
-                    output="",
-                    error="fatal: You must specify a repository to clone.",
-                    exit_code=128,
-                )
-            repo = args[1]
-            return SimulationResult(
-                success=True,
-                output=f"Cloning into '{repo.split('/')[-1].replace('.git', '')}'...",
-                exit_code=0,
-                state_changes={"git_cloned": repo},
-            )
-        else:
-            # Other git commands - use generic response or LLM
+        handler = self._GIT_SUBCOMMANDS.get(args[0])
+        if handler is not None:
+            return handler(self, args[1:])
+        # Other git commands - use generic response or LLM
+        return SimulationResult(
+            success=True, output=f"git {args[0]} completed successfully", exit_code=0
+        )
+
+    def _git_init(self, args: list[str]) -> SimulationResult:
+        """Simulate git init."""
+        return SimulationResult(
+            success=True,
+            output="Initialized empty Git repository in .git/",
+            exit_code=0,
+            state_changes={"git_initialized": True},
+        )
+
+    def _git_status(self, args: list[str]) -> SimulationResult:
+        """Simulate git status."""
+        return SimulationResult(success=True, output=_GIT_STATUS_OUTPUT, exit_code=0)
+
+    def _git_clone(self, args: list[str]) -> SimulationResult:
+        """Simulate git clone."""
+        if not args:
             return SimulationResult(
-                success=True, output=f"git {cmd} completed successfully", exit_code=0
+                success=False,
+                output="",
+                error="fatal: You must specify a repository to clone.",
+                exit_code=128,
             )
+        repo = args[0]
+        return SimulationResult(
+            success=True,
+            output=f"Cloning into '{repo.split('/')[-1].replace('.git', '')}'...",
+            exit_code=0,
+            state_changes={"git_cloned": repo},
+        )
 
     def _simulate_docker(self, args: list[str]) -> SimulationResult:
         """Simulate docker command."""
         if not args:
-            return SimulationResult(
-                success=True,
-                output="Usage: docker [OPTIONS] COMMAND\n\n"
-                "A self-sufficient runtime for containers",
-                exit_code=0,
-            )
+            return SimulationResult(success=True, output=_DOCKER_USAGE, exit_code=0)
 
-        cmd = args[0]
-        if cmd == "run":
-            image = args[-1] if len(args) > 1 else "image"
-            return SimulationResult(
-                success=True,
-                output=f"Running container from {image}...",
-                exit_code=0,
-                state_changes={"docker_container_started": image},
-            )
-        elif cmd == "ps":
-            return SimulationResult(
-                success=True,
-                output="CONTAINER ID   IMAGE     COMMAND   CREATED   STATUS   PORTS",
-                exit_code=0,
-            )
-        elif cmd == "build":
-            return SimulationResult(
-                success=True,
-                output="Successfully built docker image",
-                exit_code=0,
-                state_changes={"docker_image_built": True},
-            )
-        else:
-            return SimulationResult(
-                success=True,
-                output=f"docker {cmd} completed successfully",
-                exit_code=0,
-            )
+        handler = self._DOCKER_SUBCOMMANDS.get(args[0])
+        if handler is not None:
+            return handler(self, args[1:])
+        return SimulationResult(
+            success=True,
+            output=f"docker {args[0]} completed successfully",
+            exit_code=0,
+        )
+
+    def _docker_run(self, args: list[str]) -> SimulationResult:
+        """Simulate docker run."""
+        image = args[-1] if args else "image"
+        return SimulationResult(
+            success=True,
+            output=f"Running container from {image}...",
+            exit_code=0,
+            state_changes={"docker_container_started": image},
+        )
+
+    def _docker_ps(self, args: list[str]) -> SimulationResult:
+        """Simulate docker ps."""
+        return SimulationResult(success=True, output=_DOCKER_PS_OUTPUT, exit_code=0)
+
+    def _docker_build(self, args: list[str]) -> SimulationResult:
+        """Simulate docker build."""
+        return SimulationResult(
+            success=True,
+            output="Successfully built docker image",
+            exit_code=0,
+            state_changes={"docker_image_built": True},
+        )
 
     def _simulate_kubectl(self, args: list[str]) -> SimulationResult:
         """Simulate kubectl command."""
         if not args:
-            return SimulationResult(
-                success=True,
-                output="kubectl controls the Kubernetes cluster manager.",
-                exit_code=0,
-            )
+            return SimulationResult(success=True, output=_KUBECTL_USAGE, exit_code=0)
 
-        cmd = args[0]
-        if cmd == "get":
-            resource = args[1] if len(args) > 1 else "pods"
-            return SimulationResult(
-                success=True,
-                output=f"NAME                READY   STATUS    RESTARTS   AGE\n"
-                f"{resource}-sample   1/1     Running   0          10s",
-                exit_code=0,
-            )
-        elif cmd == "apply":
-            return SimulationResult(
-                success=True,
-                output="resource created/updated successfully",
-                exit_code=0,
-            )
-        else:
-            return SimulationResult(
-                success=True,
-                output=f"kubectl {cmd} completed successfully",
-                exit_code=0,
-            )
+        handler = self._KUBECTL_SUBCOMMANDS.get(args[0])
+        if handler is not None:
+            return handler(self, args[1:])
+        return SimulationResult(
+            success=True,
+            output=f"kubectl {args[0]} completed successfully",
+            exit_code=0,
+        )
+
+    def _kubectl_get(self, args: list[str]) -> SimulationResult:
+        """Simulate kubectl get."""
+        resource = args[0] if args else "pods"
+        return SimulationResult(
+            success=True,
+            output=f"NAME                READY   STATUS    RESTARTS   AGE\n"
+            f"{resource}-sample   1/1     Running   0          10s",
+            exit_code=0,
+        )
+
+    def _kubectl_apply(self, args: list[str]) -> SimulationResult:
+        """Simulate kubectl apply."""
+        return SimulationResult(
+            success=True,
+            output="resource created/updated successfully",
+            exit_code=0,
+        )
 
     def _simulate_with_llm(self, command: str, context: str | None) -> SimulationResult:
         """Use LLM to simulate unknown command.
@@ -661,70 +782,153 @@ class CommandSimulator:
                 error=f"Unknown command: {command}",
                 exit_code=127,
             )
+        if self._llm_batch is not None:
+            # Placeholder; simulate_batch replaces it with the batched result
+            self._llm_batch.append(command)
+            return SimulationResult(success=False, output="")
 
-        # Build prompt for LLM
-        prompt = f"""Simulate the output of this command in a learning environment:
+        context_block = f"Context: {context}\n\n" if context else ""
+        prompt = _LLM_PROMPT_TEMPLATE.format(
+            command=command, context_block=context_block
+        )
 
-Command: {command}
+        try:
+            response = self.llm_client.generate(
+                prompt=prompt,
+                system_prompt=_LLM_SYSTEM_PROMPT,
+                temperature=0.3,
+                max_tokens=512,
+            )
+        except Exception as e:
+            return _llm_error_result(e)
+        return _result_from_llm_response(response)
 
-"""
-        if context:
-            prompt += f"Context: {context}\n\n"
+    def _simulate_llm_batch(
+        self, commands: list[str], context: str | None
+    ) -> list[SimulationResult]:
+        """Use one LLM request to simulate several unknown commands.
 
-        prompt += (
-            """Provide a realistic but safe simulation of what """
-            """this command would output.
-Keep the output concise and educational.
+        Args:
+            commands: Commands to simulate, in order
+            context: Optional context about the learning exercise
 
-Respond in the following format:
-Success: [yes/no]
-Exit Code: [number]
-Output:
-[command output here]
-"""
+        Returns:
+            One SimulationResult per command, in the same order
+        """
+        assert self.llm_client is not None
+        if len(commands) == 1:
+            return [self._simulate_with_llm(commands[0], context)]
+
+        context_block = f"Context: {context}\n\n" if context else ""
+        prompt = _LLM_BATCH_PROMPT_TEMPLATE.format(
+            commands="\n".join(f"[{i}] {cmd}" for i, cmd in enumerate(commands, 1)),
+            context_block=context_block,
         )
 
         try:
             response = self.llm_client.generate(
                 prompt=prompt,
-                system_prompt="You are simulating command execution in a safe "
-                "learning environment. Provide realistic but safe outputs.",
+                system_prompt=_LLM_SYSTEM_PROMPT,
                 temperature=0.3,
-                max_tokens=512,
+                max_tokens=512 * len(commands),
             )
+        except Exception as e:
+            return [_llm_error_result(e) for _ in commands]
 
-            # Parse response
-            success = "Success: yes" in response
-            exit_code = 0 if success else 1
-
-            # Extract output
-            if "Output:" in response:
-                output = response.split("Output:")[1].strip()
-            else:
-                output = response
+        # re.split yields [preamble, number, block, number, block, ...]
+        pieces = _LLM_BATCH_BLOCK_RE.split(response)
+        blocks = dict(zip(map(int, pieces[1::2]), pieces[2::2], strict=True))
 
-            return SimulationResult(
-                success=success,
-                output=output,
-                exit_code=exit_code,
-                state_changes={"llm_simulated": True},
+        # Commands the reply skipped are retried on their own
+        return [
+            (
+                _result_from_llm_response(blocks[i])
+                if i in blocks
+                else self._simulate_with_llm(cmd, context)
             )
+            for i, cmd in enumerate(commands, 1)
+        ]
 
-        except Exception as e:
-            return SimulationResult(
-                success=False,
-                output="",
-                error=f"Simulation error: {str(e)}",
-                exit_code=1,
-            )
+    def simulate_batch(
+        self, commands: Sequence[str], context: str | None = None
+    ) -> list[SimulationResult]:
+        """Simulate a sequence of commands, sharing one LLM request between them.
+
+        Commands with built-in handlers run in order exactly as with
+        simulate(). Commands that would fall back to the LLM are collected
+        and simulated together in a single request, then slotted back into
+        their positions.
+
+        Args:
+            commands: Commands to simulate, in execution order
+            context: Optional context about the learning exercise
+
+        Returns:
+            One SimulationResult per command, in the same order
+        """
+        if self.llm_client is None:
+            return [self.simulate(command, context) for command in commands]
+
+        results: list[SimulationResult] = []
+        deferred: list[int] = []
+        batch: list[str] = []
+        self._llm_batch = batch
+        try:
+            for command in commands:
+                queued = len(batch)
+                results.append(self.simulate(command, context))
+                if len(batch) > queued:
+                    deferred.append(len(results) - 1)
+        finally:
+            self._llm_batch = None
+
+        if batch:
+            for index, result in zip(
+                deferred, self._simulate_llm_batch(batch, context), strict=True
+            ):
+                results[index] = result
+        return results
 
     def reset(self) -> None:
         """Reset simulator state to initial conditions."""
         self.filesystem = VirtualFileSystem()
-        self.environment = {
-            "HOME": "/home/user",
-            "USER": "user",
-            "PATH": "/usr/local/bin:/usr/bin:/bin",
-        }
+        self.environment = dict(_DEFAULT_ENV)
         self.python_imports = set()
         self.python_variables = {}
+
+    # Handlers for known commands that need no exercise context
+    _HANDLERS: ClassVar[dict[str, _Handler]] = {
+        "echo": _simulate_echo,
+        "ls": _simulate_ls,
+        "cat": _simulate_cat,
+        "mkdir": _simulate_mkdir,
+        "touch": _simulate_touch,
+        "cd": _simulate_cd,
+        "pwd": _simulate_pwd,
+        "pip": _simulate_pip,
+        "pip3": _simulate_pip,
+        "git": _simulate_git,
+        "docker": _simulate_docker,
+        "kubectl": _simulate_kubectl,
+    }
+
+    # Subcommand handlers for the tools above; unlisted subcommands get a
+    # generic response
+    _PIP_SUBCOMMANDS: ClassVar[dict[str, _Handler]] = {
+        "install": _pip_install,
+        "list": _pip_list,
+    }
+    _GIT_SUBCOMMANDS: ClassVar[dict[str, _Handler]] = {
+        "init": _git_init,
+        "status": _git_status,
+        "clone": _git_clone,
+    }
+    _DOCKER_SUBCOMMANDS: ClassVar[dict[str, _Handler]] = {
+        "run": _docker_run,
+        "ps": _docker_ps,
+        "build": _docker_build,
+    }
+    _KUBECTL_SUBCOMMANDS: ClassVar[dict[str, _Handler]] = {
+        "get": _kubectl_get,
+        "apply": _kubectl_apply,
+    }
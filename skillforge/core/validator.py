@@ -5,12 +5,77 @@ This module provides LLM-powered evaluation of user answers to exercises,
 with support for pattern-based validation and intelligent feedback generation.
 """
 
+import asyncio
+import copy
+import json
+import re
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, cast
 
-from skillforge.models.lesson import Exercise
-from skillforge.utils.llm_client import BaseLLMClient
+from skillforge.models.lesson import Exercise, to_nfc
+from skillforge.utils.llm_client import BaseLLMClient, RateLimitedClient
+
+# Default cap on LLM validations in flight at once for validate_many
+MAX_CONCURRENT_VALIDATIONS = 8
+
+# Maximum number of LLM validation results remembered for resubmitted answers
+VALIDATION_CACHE_SIZE = 256
+
+# Default number of answers graded per LLM request by validate_many
+VALIDATION_BATCH_SIZE = 8
+
+_EVALUATION_GUIDELINES = """Important evaluation guidelines:
+- For command-line exercises, accept any command that achieves the same result, \
+even if syntax differs (flag order, shorthand flags, equivalent alternatives)
+- Focus on whether the answer accomplishes the exercise goal, not exact string matching
+- If functionally correct but different syntax, mark as correct
+"""
+
+_VALIDATION_SYSTEM_PROMPT = (
+    "You are an expert programming tutor evaluating "
+    "student exercises. Be encouraging but accurate. "
+    "Give clear, specific feedback."
+)
+
+# Single-answer evaluation prompt; the optional blocks are full lines or empty
+_VALIDATION_PROMPT_TEMPLATE = (
+    """Evaluate the following user answer to a learning exercise.
+
+Exercise Instruction: {instruction}
+{expected_block}
+User's Answer: {user_answer}
+{context_block}
+"""
+    + _EVALUATION_GUIDELINES.replace("{", "{{").replace("}", "}}")
+    + """
+Evaluate the answer and respond in this exact format:
+Status: [correct/incorrect/partial]
+Score: [0.0 to 1.0]
+Feedback: [one sentence of constructive feedback]
+Hint: [one helpful hint if not fully correct, or "none" if correct]
+"""
+)
+
+_HINT_SYSTEM_PROMPT = (
+    "You are a helpful programming tutor. Give concise, "
+    "encouraging hints without revealing the answer directly."
+)
+
+_HINT_PROMPT_TEMPLATE = """A student is working on this exercise and needs a hint.
+
+Exercise: {instruction}
+{expected_block}Student's Answer: {user_answer}
+Attempt Number: {attempt_number}
+
+Provide a single, concise hint that guides the student toward the correct answer
+without giving it away. Make the hint progressively more specific for higher
+attempt numbers.
+
+Hint:"""
 
 
 class ValidationStatus(Enum):
@@ -21,6 +86,23 @@ class ValidationStatus(Enum):
     PARTIAL = "partial"
 
 
+# "Field: value" lines in a single-answer LLM evaluation
+_LLM_FIELD_RE = re.compile(
+    r"^[^\S\n]*(status|score|feedback|hint):(.*)$",
+    re.ASCII | re.IGNORECASE | re.MULTILINE,
+)
+
+# Every field of a single-answer evaluation; once all have arrived on complete
+# lines a streamed response can be cut short
+_LLM_FIELDS = frozenset({"status", "score", "feedback", "hint"})
+
+# Status words accepted from LLM evaluations; anything else counts as partial
+_LLM_STATUSES = {
+    "correct": ValidationStatus.CORRECT,
+    "incorrect": ValidationStatus.INCORRECT,
+}
+
+
 @dataclass
 class ValidationResult:
     """Result of validating a user's answer to an exercise.
@@ -57,13 +139,30 @@ class ExerciseValidator:
     LLM-powered evaluation for complex answers.
     """
 
-    def __init__(self, llm_client: BaseLLMClient | None = None) -> None:
+    def __init__(
+        self,
+        llm_client: BaseLLMClient | None = None,
+        max_requests_per_minute: int | None = None,
+        stream_responses: bool = False,
+    ) -> None:
         """Initialize the exercise validator.
 
         Args:
             llm_client: LLM client for intelligent validation
+            max_requests_per_minute: Optional cap on LLM requests per minute;
+                when set, the client is wrapped in a RateLimitedClient
+            stream_responses: Stream single-answer LLM evaluations and stop
+                reading as soon as every field has arrived
         """
+        if llm_client is not None and max_requests_per_minute is not None:
+            llm_client = RateLimitedClient(llm_client, max_requests_per_minute)
         self.llm_client = llm_client
+        self.stream_responses = stream_responses
+        self._result_cache: dict[
+            tuple[str, str, str | None, str, str | None], ValidationResult
+        ] = {}
+        # Guards the result cache when validate() runs on worker threads
+        self._cache_lock = threading.Lock()
 
     def validate(
         self,
@@ -82,7 +181,225 @@ class ExerciseValidator:
             ValidationResult with score, feedback, and hints
         """
         user_answer = user_answer.strip()
+        result = self._validate_locally(exercise, user_answer, context)
+        if result is not None:
+            return result
+
+        # Fall back to LLM-based validation
+        if self.llm_client:
+            return self._validate_with_llm(exercise, user_answer, context)
+
+        # No LLM client and no exact match - do basic comparison
+        return self._validate_basic(exercise, user_answer)
+
+    async def avalidate(
+        self,
+        exercise: Exercise,
+        user_answer: str,
+        context: str | None = None,
+    ) -> ValidationResult:
+        """Validate a user's answer without blocking the event loop.
+
+        Same checks as validate(); only the LLM call is awaited.
+
+        Args:
+            exercise: The exercise being answered
+            user_answer: The user's submitted answer
+            context: Optional learning context for better evaluation
+
+        Returns:
+            ValidationResult with score, feedback, and hints
+        """
+        user_answer = user_answer.strip()
+        result = self._validate_locally(exercise, user_answer, context)
+        if result is not None:
+            return result
+
+        if self.llm_client:
+            return await self._avalidate_with_llm(exercise, user_answer, context)
+
+        return self._validate_basic(exercise, user_answer)
+
+    async def avalidate_many(
+        self,
+        exercises: Sequence[Exercise],
+        user_answers: Sequence[str],
+        context: str | None = None,
+        max_concurrent: int = MAX_CONCURRENT_VALIDATIONS,
+        batch_size: int = VALIDATION_BATCH_SIZE,
+    ) -> list[ValidationResult]:
+        """Validate several answers concurrently.
+
+        Answers settled by pattern matching return immediately. The rest are
+        graded ``batch_size`` at a time in a single LLM request each, with up
+        to ``max_concurrent`` requests in flight.
+
+        Args:
+            exercises: The exercises being answered
+            user_answers: One answer per exercise, in the same order
+            context: Optional learning context for better evaluation
+            max_concurrent: Maximum number of simultaneous LLM requests
+            batch_size: Maximum number of answers graded per LLM request
+
+        Returns:
+            One ValidationResult per exercise, in the same order
+
+        Raises:
+            ValueError: If the number of exercises and answers differ
+        """
+        if len(exercises) != len(user_answers):
+            raise ValueError(
+                f"Got {len(exercises)} exercises but {len(user_answers)} answers"
+            )
+
+        answers = [answer.strip() for answer in user_answers]
+        results: list[ValidationResult | None] = []
+        pending: list[int] = []
+        for index, (exercise, answer) in enumerate(
+            zip(exercises, answers, strict=True)
+        ):
+            result = self._validate_locally(exercise, answer, context)
+            if result is None and not self.llm_client:
+                result = self._validate_basic(exercise, answer)
+            if result is None:
+                pending.append(index)
+            results.append(result)
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def validate_one(index: int) -> None:
+            async with semaphore:
+                results[index] = await self._avalidate_with_llm(
+                    exercises[index], answers[index], context
+                )
+
+        async def validate_batch(indices: list[int]) -> None:
+            if len(indices) == 1:
+                return await validate_one(indices[0])
+            async with semaphore:
+                batch = await self._avalidate_batch_with_llm(
+                    [exercises[i] for i in indices],
+                    [answers[i] for i in indices],
+                    context,
+                )
+            for index, result in zip(indices, batch, strict=True):
+                if result is not None:
+                    results[index] = self._remember_result(
+                        exercises[index], answers[index], context, result
+                    )
+            # Answers the reply did not grade are retried on their own
+            await asyncio.gather(
+                *(
+                    validate_one(i)
+                    for i, r in zip(indices, batch, strict=True)
+                    if r is None
+                )
+            )
+
+        step = max(1, batch_size)
+        await asyncio.gather(
+            *(
+                validate_batch(pending[start : start + step])
+                for start in range(0, len(pending), step)
+            )
+        )
+        # Every slot is filled by the local pass, a batch or validate_one; a
+        # gap is a bug and must not shift later results out of line
+        assert all(result is not None for result in results)
+        return cast(list[ValidationResult], results)
+
+    def validate_many(
+        self,
+        exercises: Sequence[Exercise],
+        user_answers: Sequence[str],
+        context: str | None = None,
+        max_concurrent: int = MAX_CONCURRENT_VALIDATIONS,
+        batch_size: int = VALIDATION_BATCH_SIZE,
+    ) -> list[ValidationResult]:
+        """Validate several answers concurrently from synchronous code.
+
+        Runs avalidate_many() in a fresh event loop, so it must not be called
+        from a running loop; await avalidate_many() there instead.
+
+        Args:
+            exercises: The exercises being answered
+            user_answers: One answer per exercise, in the same order
+            context: Optional learning context for better evaluation
+            max_concurrent: Maximum number of simultaneous LLM requests
+            batch_size: Maximum number of answers graded per LLM request
+
+        Returns:
+            One ValidationResult per exercise, in the same order
+
+        Raises:
+            ValueError: If the number of exercises and answers differ
+        """
+        return asyncio.run(
+            self.avalidate_many(
+                exercises, user_answers, context, max_concurrent, batch_size
+            )
+        )
+
+    def validate_many_threaded(
+        self,
+        exercises: Sequence[Exercise],
+        user_answers: Sequence[str],
+        context: str | None = None,
+        max_workers: int = MAX_CONCURRENT_VALIDATIONS,
+    ) -> Iterator[tuple[int, ValidationResult]]:
+        """Validate several answers on worker threads, yielding as they finish.
+
+        For LLM clients that only offer a blocking generate(): each answer
+        runs through validate() on a thread pool owned by this call. If the
+        caller stops iterating early, answers not yet started are cancelled.
+
+        Args:
+            exercises: The exercises being answered
+            user_answers: One answer per exercise, in the same order
+            context: Optional learning context for better evaluation
+            max_workers: Maximum number of answers validated at once
+
+        Yields:
+            (index, result) pairs in completion order, where index is the
+            position of the answer in ``user_answers``
 
+        Raises:
+            ValueError: If the number of exercises and answers differ
+        """
+        if len(exercises) != len(user_answers):
+            raise ValueError(
+                f"Got {len(exercises)} exercises but {len(user_answers)} answers"
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="validator"
+        )
+        try:
+            futures = {
+                executor.submit(self.validate, exercise, answer, context): index
+                for index, (exercise, answer) in enumerate(
+                    zip(exercises, user_answers, strict=True)
+                )
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _validate_locally(
+        self, exercise: Exercise, user_answer: str, context: str | None = None
+    ) -> ValidationResult | None:
+        """Settle an answer without a new LLM request when possible.
+
+        Args:
+            exercise: The exercise being answered
+            user_answer: The user's stripped answer
+            context: Optional learning context for better evaluation
+
+        Returns:
+            ValidationResult for empty, pattern-matched or previously graded
+            answers, None otherwise
+        """
         if not user_answer:
             return ValidationResult(
                 status=ValidationStatus.INCORRECT,
@@ -97,12 +414,55 @@ class ExerciseValidator:
             if result is not None:
                 return result
 
-        # Fall back to LLM-based validation
-        if self.llm_client:
-            return self._validate_with_llm(exercise, user_answer, context)
+        # Resubmissions of an answer the LLM already graded reuse its result
+        key = self._result_cache_key(exercise, user_answer, context)
+        with self._cache_lock:
+            result = self._result_cache.pop(key, None)
+            if result is not None:
+                self._result_cache[key] = result  # mark most recently used
+        # Hand out a copy so callers editing hints or details cannot change
+        # what later resubmissions get back
+        return copy.deepcopy(result) if result is not None else None
 
-        # No LLM client and no exact match - do basic comparison
-        return self._validate_basic(exercise, user_answer)
+    @staticmethod
+    def _result_cache_key(
+        exercise: Exercise, user_answer: str, context: str | None
+    ) -> tuple[str, str, str | None, str, str | None]:
+        """Build the result cache key for an answer to an exercise."""
+        return (
+            exercise.id,
+            exercise.instruction,
+            exercise.expected_output,
+            user_answer,
+            context,
+        )
+
+    def _remember_result(
+        self,
+        exercise: Exercise,
+        user_answer: str,
+        context: str | None,
+        result: ValidationResult,
+    ) -> ValidationResult:
+        """Cache an LLM validation result unless the request failed.
+
+        Args:
+            exercise: The exercise that was validated
+            user_answer: The user's stripped answer
+            context: Learning context the answer was graded with
+            result: The LLM validation result
+
+        Returns:
+            The same result, for chaining
+        """
+        if "error" not in result.details:
+            key = self._result_cache_key(exercise, user_answer, context)
+            with self._cache_lock:
+                if len(self._result_cache) >= VALIDATION_CACHE_SIZE:
+                    # Evict the least recently used entry (first in insertion order)
+                    del self._result_cache[next(iter(self._result_cache))]
+                self._result_cache[key] = copy.deepcopy(result)
+        return result
 
     def _validate_with_pattern(
         self, exercise: Exercise, user_answer: str
@@ -116,67 +476,54 @@ class ExerciseValidator:
         Returns:
             ValidationResult if pattern match is definitive, None otherwise
         """
-        expected = exercise.expected_output
-        if expected is None:
+        forms = exercise.expected_forms
+        if forms is None:
             return None
 
-        expected_stripped = expected.strip()
-
-        # Exact match
-        if user_answer == expected_stripped:
-            return ValidationResult(
-                status=ValidationStatus.CORRECT,
-                score=1.0,
-                feedback="Correct! Well done.",
-                details={"match_type": "exact"},
-            )
-
-        # Case-insensitive match
-        if user_answer.lower() == expected_stripped.lower():
-            return ValidationResult(
-                status=ValidationStatus.CORRECT,
-                score=1.0,
-                feedback="Correct! Well done.",
-                details={"match_type": "case_insensitive"},
-            )
-
-        # Normalized whitespace match
-        normalized_answer = " ".join(user_answer.split())
-        normalized_expected = " ".join(expected_stripped.split())
-        if normalized_answer == normalized_expected:
-            return ValidationResult(
-                status=ValidationStatus.CORRECT,
-                score=1.0,
-                feedback="Correct! Well done.",
-                details={"match_type": "normalized_whitespace"},
-            )
+        # Cheapest checks first; each derived form of the answer is built once
+        # and the expected side comes precomputed (and NFC-normalized) from
+        # the exercise
+        user_answer = to_nfc(user_answer)
+        if user_answer == forms.stripped:
+            return self._pattern_match_result("exact")
+
+        answer_lower = user_answer.lower()
+        if answer_lower == forms.lower:
+            return self._pattern_match_result("case_insensitive")
+
+        # Collapsing whitespace never lengthens the answer, so an answer
+        # shorter than the normalized expected output cannot match it
+        answer_tokens = user_answer.split()
+        if len(user_answer) >= len(forms.normalized) and (
+            " ".join(answer_tokens) == forms.normalized
+        ):
+            return self._pattern_match_result("normalized_whitespace")
 
         # Command-aware matching: if both look like CLI commands with the same
         # base command, compare tokens as sets (handles flag reordering and
-        # equivalent shorthand flags)
-        if self._is_equivalent_command(normalized_answer, normalized_expected):
-            return ValidationResult(
-                status=ValidationStatus.CORRECT,
-                score=1.0,
-                feedback="Correct! Well done.",
-                details={"match_type": "command_equivalent"},
-            )
+        # equivalent shorthand flags). Only answers that share the base
+        # command are re-tokenized in lowercase.
+        if (
+            answer_tokens
+            and forms.lower_tokens
+            and answer_tokens[0].lower() == forms.lower_tokens[0]
+            and self._is_equivalent_command(answer_lower.split(), forms.lower_tokens)
+        ):
+            return self._pattern_match_result("command_equivalent")
 
         # Skip substring checks for command-like inputs — substring
         # relationships between commands are misleading (e.g. "docker version"
         # is a substring of "docker --version" but they are different valid
         # commands).  Fall through to LLM for accurate evaluation instead.
-        answer_tokens = normalized_answer.split()
-        expected_tokens = normalized_expected.split()
         both_look_like_commands = (
             len(answer_tokens) >= 2
-            and len(expected_tokens) >= 2
-            and answer_tokens[0] == expected_tokens[0]
+            and len(forms.tokens) >= 2
+            and answer_tokens[0] == forms.tokens[0]
         )
 
         if not both_look_like_commands:
             # Check if answer contains the expected output
-            if expected_stripped.lower() in user_answer.lower():
+            if forms.lower in answer_lower:
                 return ValidationResult(
                     status=ValidationStatus.PARTIAL,
                     score=0.7,
@@ -187,7 +534,7 @@ class ExerciseValidator:
                 )
 
             # If expected output is in the answer (reversed check)
-            if user_answer.lower() in expected_stripped.lower():
+            if answer_lower in forms.lower:
                 return ValidationResult(
                     status=ValidationStatus.PARTIAL,
                     score=0.5,
@@ -200,6 +547,23 @@ class ExerciseValidator:
         # No definitive pattern match - return None to try LLM
         return None
 
+    @staticmethod
+    def _pattern_match_result(match_type: str) -> ValidationResult:
+        """Build the result for an answer that matched the expected output.
+
+        Args:
+            match_type: How the answer matched, recorded in the details
+
+        Returns:
+            A correct ValidationResult
+        """
+        return ValidationResult(
+            status=ValidationStatus.CORRECT,
+            score=1.0,
+            feedback="Correct! Well done.",
+            details={"match_type": match_type},
+        )
+
     def _validate_basic(self, exercise: Exercise, user_answer: str) -> ValidationResult:
         """Basic validation without LLM (fallback).
 
@@ -248,52 +612,238 @@ class ExerciseValidator:
         """
         assert self.llm_client is not None
 
-        prompt = f"""Evaluate the following user answer to a learning exercise.
+        prompt = self._build_validation_prompt(exercise, user_answer, context)
+        try:
+            if self.stream_responses:
+                response = self._read_llm_evaluation_stream(prompt)
+            else:
+                response = self.llm_client.generate(
+                    prompt=prompt,
+                    system_prompt=_VALIDATION_SYSTEM_PROMPT,
+                    temperature=0.3,
+                    max_tokens=256,
+                )
+        except Exception as e:
+            return self._llm_error_result(e)
+        return self._remember_result(
+            exercise,
+            user_answer,
+            context,
+            self._parse_llm_response(response, exercise),
+        )
 
-Exercise Instruction: {exercise.instruction}
-"""
-        if exercise.expected_output:
-            prompt += f"Expected Output: {exercise.expected_output}\n"
+    def _read_llm_evaluation_stream(self, prompt: str) -> str:
+        """Stream a single-answer evaluation, stopping once it is complete.
 
-        prompt += f"""
-User's Answer: {user_answer}
-"""
-        if context:
-            prompt += f"Learning Context: {context}\n"
+        Args:
+            prompt: The validation prompt
 
-        prompt += """
-Important evaluation guidelines:
-- For command-line exercises, accept any command that achieves the same result, \
-even if syntax differs (flag order, shorthand flags, equivalent alternatives)
-- Focus on whether the answer accomplishes the exercise goal, not exact string matching
-- If functionally correct but different syntax, mark as correct
+        Returns:
+            The response text up to the line that completed the last field,
+            or the whole response if some field never arrived
+        """
+        assert self.llm_client is not None
 
-Evaluate the answer and respond in this exact format:
-Status: [correct/incorrect/partial]
-Score: [0.0 to 1.0]
-Feedback: [one sentence of constructive feedback]
-Hint: [one helpful hint if not fully correct, or "none" if correct]
-"""
+        stream = self.llm_client.stream_generate(
+            prompt=prompt,
+            system_prompt=_VALIDATION_SYSTEM_PROMPT,
+            temperature=0.3,
+            max_tokens=256,
+        )
+        response = ""
+        try:
+            for chunk in stream:
+                response += chunk
+                if "\n" not in chunk:
+                    continue
+                complete = response[: response.rfind("\n")]
+                seen = {m.group(1).lower() for m in _LLM_FIELD_RE.finditer(complete)}
+                if seen >= _LLM_FIELDS:
+                    return complete
+        finally:
+            stream.close()
+        return response
+
+    async def _avalidate_with_llm(
+        self,
+        exercise: Exercise,
+        user_answer: str,
+        context: str | None = None,
+    ) -> ValidationResult:
+        """Validate using LLM without blocking the event loop.
 
+        Args:
+            exercise: The exercise being validated
+            user_answer: The user's answer
+            context: Optional learning context
+
+        Returns:
+            ValidationResult from LLM evaluation
+        """
+        assert self.llm_client is not None
+
+        prompt = self._build_validation_prompt(exercise, user_answer, context)
         try:
-            response = self.llm_client.generate(
+            response = await self.llm_client.agenerate(
                 prompt=prompt,
-                system_prompt=(
-                    "You are an expert programming tutor evaluating "
-                    "student exercises. Be encouraging but accurate. "
-                    "Give clear, specific feedback."
-                ),
+                system_prompt=_VALIDATION_SYSTEM_PROMPT,
                 temperature=0.3,
                 max_tokens=256,
             )
-            return self._parse_llm_response(response, exercise)
         except Exception as e:
-            return ValidationResult(
-                status=ValidationStatus.PARTIAL,
-                score=0.5,
-                feedback=f"Validation error: {e}. " "Your answer has been recorded.",
-                details={"error": str(e)},
+            return self._llm_error_result(e)
+        return self._remember_result(
+            exercise,
+            user_answer,
+            context,
+            self._parse_llm_response(response, exercise),
+        )
+
+    async def _avalidate_batch_with_llm(
+        self,
+        exercises: Sequence[Exercise],
+        user_answers: Sequence[str],
+        context: str | None = None,
+    ) -> list[ValidationResult | None]:
+        """Grade several answers with one LLM request.
+
+        Args:
+            exercises: The exercises being validated
+            user_answers: One answer per exercise, in the same order
+            context: Optional learning context
+
+        Returns:
+            One entry per exercise, in the same order; None where the reply
+            had no usable row for that answer
+        """
+        assert self.llm_client is not None
+
+        prompt = self._build_batch_validation_prompt(exercises, user_answers, context)
+        try:
+            response = await self.llm_client.agenerate(
+                prompt=prompt,
+                system_prompt=_VALIDATION_SYSTEM_PROMPT,
+                temperature=0.3,
+                max_tokens=256 * len(exercises),
             )
+        except Exception as e:
+            return [self._llm_error_result(e) for _ in exercises]
+        return self._parse_batch_llm_response(response, exercises)
+
+    @staticmethod
+    def _build_validation_prompt(
+        exercise: Exercise, user_answer: str, context: str | None
+    ) -> str:
+        """Build the LLM prompt for evaluating an answer.
+
+        Args:
+            exercise: The exercise being validated
+            user_answer: The user's answer
+            context: Optional learning context
+
+        Returns:
+            Prompt string
+        """
+        return _VALIDATION_PROMPT_TEMPLATE.format(
+            instruction=exercise.instruction,
+            expected_block=(
+                f"Expected Output: {exercise.expected_output}\n"
+                if exercise.expected_output
+                else ""
+            ),
+            user_answer=user_answer,
+            context_block=f"Learning Context: {context}\n" if context else "",
+        )
+
+    @staticmethod
+    def _build_batch_validation_prompt(
+        exercises: Sequence[Exercise],
+        user_answers: Sequence[str],
+        context: str | None,
+    ) -> str:
+        """Build the LLM prompt for evaluating several answers at once.
+
+        Args:
+            exercises: The exercises being validated
+            user_answers: One answer per exercise, in the same order
+            context: Optional learning context
+
+        Returns:
+            Prompt string
+        """
+        prompt = "Evaluate each of the following user answers to learning exercises.\n"
+        for number, (exercise, answer) in enumerate(
+            zip(exercises, user_answers, strict=True), 1
+        ):
+            prompt += f"\n[{number}]\nExercise Instruction: {exercise.instruction}\n"
+            if exercise.expected_output:
+                prompt += f"Expected Output: {exercise.expected_output}\n"
+            prompt += f"User's Answer: {answer}\n"
+        if context:
+            prompt += f"\nLearning Context: {context}\n"
+
+        prompt += f"""
+{_EVALUATION_GUIDELINES}
+Respond with exactly one JSON object per line, one line per answer, and nothing else:
+{{"id": <answer number>, "status": "correct|incorrect|partial", \
+"score": <0.0 to 1.0>, "feedback": "<one sentence of constructive feedback>", \
+"hint": "<one helpful hint if not fully correct, or none if correct>"}}
+"""
+        return prompt
+
+    def _parse_batch_llm_response(
+        self, response: str, exercises: Sequence[Exercise]
+    ) -> list[ValidationResult | None]:
+        """Parse a batched LLM validation response into per-answer results.
+
+        Args:
+            response: Raw LLM response with one JSON object per line
+            exercises: The exercises that were graded, in prompt order
+
+        Returns:
+            One entry per exercise; None where no valid row was found
+        """
+        results: list[ValidationResult | None] = [None] * len(exercises)
+        for line in response.splitlines():
+            line = line.strip()
+            if not line.startswith("{"):
+                continue
+            try:
+                row = json.loads(line)
+                index = int(row["id"]) - 1
+                score = max(0.0, min(1.0, float(row.get("score", 0.5))))
+            except (ValueError, TypeError, KeyError):
+                continue
+            if not 0 <= index < len(exercises):
+                continue
+
+            exercise = exercises[index]
+            status = _LLM_STATUSES.get(
+                str(row.get("status", "")).strip().lower(), ValidationStatus.PARTIAL
+            )
+            hint = str(row.get("hint") or "none").strip()
+            hints = [hint] if hint.lower() != "none" else []
+            if status != ValidationStatus.CORRECT and exercise.hints:
+                hints.append(exercise.hints[0])
+
+            results[index] = ValidationResult(
+                status=status,
+                score=score,
+                feedback=str(row.get("feedback") or "Answer evaluated."),
+                hints=hints,
+                details={"source": "llm"},
+            )
+        return results
+
+    @staticmethod
+    def _llm_error_result(error: Exception) -> ValidationResult:
+        """Build the result reported when the LLM validation call fails."""
+        return ValidationResult(
+            status=ValidationStatus.PARTIAL,
+            score=0.5,
+            feedback=f"Validation error: {error}. " "Your answer has been recorded.",
+            details={"error": str(error)},
+        )
 
     def _parse_llm_response(
         self, response: str, exercise: Exercise
@@ -312,36 +862,28 @@ Hint: [one helpful hint if not fully correct, or "none" if correct]
         feedback = "Answer evaluated."
         hints: list[str] = []
 
-        for line in response.strip().split("\n"):
-            line = line.strip()
+        for match in _LLM_FIELD_RE.finditer(response):
+            key = match.group(1).lower()
+            value = match.group(2).strip()
 
-            if line.lower().startswith("status:"):
-                status_str = line.split(":", 1)[1].strip().lower()
-                if status_str == "correct":
-                    status = ValidationStatus.CORRECT
-                elif status_str == "incorrect":
-                    status = ValidationStatus.INCORRECT
-                else:
-                    status = ValidationStatus.PARTIAL
+            if key == "status":
+                status = _LLM_STATUSES.get(value.lower(), ValidationStatus.PARTIAL)
 
-            elif line.lower().startswith("score:"):
+            elif key == "score":
                 try:
-                    score = float(line.split(":", 1)[1].strip())
-                    score = max(0.0, min(1.0, score))
+                    score = max(0.0, min(1.0, float(value)))
                 except ValueError:
                     pass
 
-            elif line.lower().startswith("feedback:"):
-                feedback = line.split(":", 1)[1].strip()
+            elif key == "feedback":
+                feedback = value
 
-            elif line.lower().startswith("hint:"):
-                hint = line.split(":", 1)[1].strip()
-                if hint.lower() != "none":
-                    hints.append(hint)
+            elif value.lower() != "none":
+                hints.append(value)
 
-        # Add exercise hints if answer is not correct
-        if status != ValidationStatus.CORRECT:
-            hints.extend(self._get_exercise_hints(exercise, hint_index=0))
+        # Add the first exercise hint if answer is not correct
+        if status != ValidationStatus.CORRECT and exercise.hints:
+            hints.append(exercise.hints[0])
 
         return ValidationResult(
             status=status,
@@ -352,22 +894,21 @@ Hint: [one helpful hint if not fully correct, or "none" if correct]
         )
 
     @staticmethod
-    def _is_equivalent_command(answer: str, expected: str) -> bool:
-        """Check if two strings are equivalent CLI commands.
+    def _is_equivalent_command(
+        answer_tokens: Sequence[str], expected_tokens: Sequence[str]
+    ) -> bool:
+        """Check if two token sequences are equivalent CLI commands.
 
         Compares the base command and treats remaining tokens as sets,
         so flag order doesn't matter.
 
         Args:
-            answer: Normalized user answer
-            expected: Normalized expected output
+            answer_tokens: Lowercase tokens of the user answer
+            expected_tokens: Lowercase tokens of the expected output
 
         Returns:
             True if the commands are functionally equivalent
         """
-        answer_tokens = answer.lower().split()
-        expected_tokens = expected.lower().split()
-
         if not answer_tokens or not expected_tokens:
             return False
 
@@ -402,12 +943,8 @@ Hint: [one helpful hint if not fully correct, or "none" if correct]
         Returns:
             List of hint strings
         """
-        if not exercise.hints:
-            return []
-        if hint_index >= len(exercise.hints):
-            return []
-        # Return one hint at a time
-        return [exercise.hints[hint_index]]
+        # Return one hint at a time; the slice is empty past the last hint
+        return exercise.hints[hint_index : hint_index + 1]
 
     def generate_hint(
         self,
@@ -454,29 +991,21 @@ Hint: [one helpful hint if not fully correct, or "none" if correct]
         """
         assert self.llm_client is not None
 
-        prompt = f"""A student is working on this exercise and needs a hint.
-
-Exercise: {exercise.instruction}
-"""
-        if exercise.expected_output:
-            prompt += f"Expected Answer: {exercise.expected_output}\n"
-
-        prompt += f"""Student's Answer: {user_answer}
-Attempt Number: {attempt_number}
-
-Provide a single, concise hint that guides the student toward the correct answer
-without giving it away. Make the hint progressively more specific for higher
-attempt numbers.
-
-Hint:"""
+        prompt = _HINT_PROMPT_TEMPLATE.format(
+            instruction=exercise.instruction,
+            expected_block=(
+                f"Expected Answer: {exercise.expected_output}\n"
+                if exercise.expected_output
+                else ""
+            ),
+            user_answer=user_answer,
+            attempt_number=attempt_number,
+        )
 
         try:
             response = self.llm_client.generate(
                 prompt=prompt,
-                system_prompt=(
-                    "You are a helpful programming tutor. Give concise, "
-                    "encouraging hints without revealing the answer directly."
-                ),
+                system_prompt=_HINT_SYSTEM_PROMPT,
                 temperature=0.5,
                 max_tokens=128,
             )
@@ -4,10 +4,12 @@ Course data model.
 This module defines the structure for a complete learning course.
 """
 
+from uuid import uuid4
+
 from pydantic import BaseModel, Field
 
 from .enums import Difficulty
-from .lesson import Lesson
+from .lesson import Lesson, position_by_id
 
 
 class Course(BaseModel):
@@ -25,7 +27,10 @@ class Course(BaseModel):
         lessons: List of lessons in this course
     """
 
-    id: str = Field(..., description="Unique identifier for the course")
+    id: str = Field(
+        default_factory=lambda: str(uuid4()),
+        description="Unique identifier for the course",
+    )
     topic: str = Field(..., description="The main topic of the course")
     description: str = Field(..., description="What the course covers")
     difficulty: Difficulty = Field(..., description="Difficulty level")
@@ -43,10 +48,8 @@ class Course(BaseModel):
         Returns:
             The Lesson object if found, None otherwise
         """
-        for lesson in self.lessons:
-            if lesson.id == lesson_id:
-                return lesson
-        return None
+        i = position_by_id(self, "_lesson_positions", self.lessons, lesson_id)
+        return self.lessons[i] if i is not None else None
 
     def get_lesson_by_index(self, index: int) -> Lesson | None:
         """
@@ -4,9 +4,108 @@ Lesson and Exercise data models.
 This module defines the structure for lessons and exercises in a course.
 """
 
+import unicodedata
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import NamedTuple
+from uuid import uuid4
+
 from pydantic import BaseModel, Field
 
 
+def position_by_id(
+    owner: BaseModel,
+    index_key: str,
+    items: Sequence[object],
+    item_id: str,
+    id_attr: str = "id",
+) -> int | None:
+    """
+    Find the position of the item with the given ID using a memoized index.
+
+    The index maps each ID to its position and is stored in the owner's
+    instance ``__dict__`` under ``index_key``, outside the model fields, so it
+    is neither serialized nor compared. Every hit is checked against the
+    current list, and the index is rebuilt when the check fails, so
+    replacing, renaming or appending items never returns a stale result.
+    IDs are expected to be unique; on a rebuild the first occurrence wins.
+
+    Args:
+        owner: Model that holds the items
+        index_key: Name under which the owner stores the index
+        items: The owner's list of items
+        item_id: The ID to look for
+        id_attr: Name of the attribute holding each item's ID
+
+    Returns:
+        Position of the item with a matching ID, or None if there is none
+    """
+    positions: dict[str, int] | None = owner.__dict__.get(index_key)
+    if positions is not None:
+        i = positions.get(item_id)
+        if i is not None and i < len(items) and getattr(items[i], id_attr) == item_id:
+            return i
+
+    positions = {}
+    for i, item in enumerate(items):
+        positions.setdefault(getattr(item, id_attr), i)
+    owner.__dict__[index_key] = positions
+    return positions.get(item_id)
+
+
+def to_nfc(text: str) -> str:
+    """
+    Return text in Unicode NFC form.
+
+    Answers pasted from some editors use decomposed sequences (a letter
+    followed by a combining accent) that never compare equal to the composed
+    form. The quick check skips the full normalization for the common case of
+    text that is already NFC, which includes all ASCII text.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        The NFC form of the text (the same object if already normalized)
+    """
+    if text.isascii() or unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+class ExpectedOutputForms(NamedTuple):
+    """Normalized variants of an exercise's expected output.
+
+    Attributes:
+        stripped: Expected output in NFC form without surrounding whitespace
+        lower: Stripped expected output in lowercase
+        normalized: Stripped expected output with whitespace runs collapsed
+        tokens: Whitespace-separated tokens of the expected output
+        lower_tokens: Whitespace-separated tokens of the lowercase output
+    """
+
+    stripped: str
+    lower: str
+    normalized: str
+    tokens: tuple[str, ...]
+    lower_tokens: tuple[str, ...]
+
+
+@lru_cache(maxsize=1024)
+def _expected_output_forms(expected: str) -> ExpectedOutputForms:
+    """Compute (and memoize) the normalized forms of an expected output."""
+    stripped = to_nfc(expected.strip())
+    lower = stripped.lower()
+    tokens = tuple(stripped.split())
+    return ExpectedOutputForms(
+        stripped=stripped,
+        lower=lower,
+        normalized=" ".join(tokens),
+        tokens=tokens,
+        lower_tokens=tuple(lower.split()),
+    )
+
+
 class Exercise(BaseModel):
     """
     Represents a single exercise within a lesson.
@@ -21,13 +120,31 @@ class Exercise(BaseModel):
         hints: List of hints to help the user if they get stuck
     """
 
-    id: str = Field(..., description="Unique identifier for the exercise")
+    id: str = Field(
+        default_factory=lambda: str(uuid4()),
+        description="Unique identifier for the exercise",
+    )
     instruction: str = Field(..., description="The task description for the user")
     expected_output: str | None = Field(
         None, description="Expected result for validation"
     )
     hints: list[str] = Field(default_factory=list, description="Hints to help the user")
 
+    @property
+    def expected_forms(self) -> ExpectedOutputForms | None:
+        """
+        Get the normalized forms of the expected output used for matching.
+
+        The forms are memoized per expected output string, so repeated
+        attempts at the same exercise reuse them.
+
+        Returns:
+            ExpectedOutputForms, or None if no expected output is defined
+        """
+        if self.expected_output is None:
+            return None
+        return _expected_output_forms(self.expected_output)
+
 
 class Lesson(BaseModel):
     """
@@ -43,7 +160,10 @@ class Lesson(BaseModel):
         exercises: List of exercises in this lesson
     """
 
-    id: str = Field(..., description="Unique identifier for the lesson")
+    id: str = Field(
+        default_factory=lambda: str(uuid4()),
+        description="Unique identifier for the lesson",
+    )
     title: str = Field(..., description="The lesson title")
     objectives: list[str] = Field(
         ..., description="Learning objectives for this lesson"
@@ -62,10 +182,8 @@ class Lesson(BaseModel):
         Returns:
             The Exercise object if found, None otherwise
         """
-        for exercise in self.exercises:
-            if exercise.id == exercise_id:
-                return exercise
-        return None
+        i = position_by_id(self, "_exercise_positions", self.exercises, exercise_id)
+        return self.exercises[i] if i is not None else None
 
     def get_exercise_by_index(self, index: int) -> Exercise | None:
         """
@@ -10,6 +10,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from .enums import ProgressStatus
+from .lesson import position_by_id
 
 
 class ExerciseProgress(BaseModel):
@@ -69,10 +70,28 @@ class LessonProgress(BaseModel):
         Returns:
             The ExerciseProgress object if found, None otherwise
         """
-        for progress in self.exercise_progress:
-            if progress.exercise_id == exercise_id:
-                return progress
-        return None
+        i = position_by_id(
+            self,
+            "_exercise_positions",
+            self.exercise_progress,
+            exercise_id,
+            id_attr="exercise_id",
+        )
+        return self.exercise_progress[i] if i is not None else None
+
+    def completion_stats(self) -> tuple[int, int]:
+        """
+        Count completed exercises in a single pass.
+
+        Returns:
+            Tuple of (completed exercises, total exercises)
+        """
+        completed_status = ProgressStatus.COMPLETED
+        completed = 0
+        for ex in self.exercise_progress:
+            if ex.status == completed_status:
+                completed += 1
+        return completed, len(self.exercise_progress)
 
     def calculate_completion_percentage(self) -> float:
         """
@@ -81,25 +100,27 @@ class LessonProgress(BaseModel):
         Returns:
             Percentage of completed exercises (0.0 to 100.0)
         """
-        if not self.exercise_progress:
+        completed, total = self.completion_stats()
+        if not total:
             return 0.0
-        completed = sum(
-            1 for ex in self.exercise_progress if ex.status == ProgressStatus.COMPLETED
-        )
-        return (completed / len(self.exercise_progress)) * 100.0
+        return (completed / total) * 100.0
 
     def is_completed(self) -> bool:
         """
         Check if all exercises in the lesson are completed.
 
+        Stops at the first exercise that is not completed.
+
         Returns:
             True if all exercises are completed, False otherwise
         """
         if not self.exercise_progress:
             return False
-        return all(
-            ex.status == ProgressStatus.COMPLETED for ex in self.exercise_progress
-        )
+        completed_status = ProgressStatus.COMPLETED
+        for ex in self.exercise_progress:
+            if ex.status != completed_status:
+                return False
+        return True
 
 
 class CourseProgress(BaseModel):
@@ -142,10 +163,14 @@ class CourseProgress(BaseModel):
         Returns:
             The LessonProgress object if found, None otherwise
         """
-        for progress in self.lesson_progress:
-            if progress.lesson_id == lesson_id:
-                return progress
-        return None
+        i = position_by_id(
+            self,
+            "_lesson_positions",
+            self.lesson_progress,
+            lesson_id,
+            id_attr="lesson_id",
+        )
+        return self.lesson_progress[i] if i is not None else None
 
     def get_current_lesson_progress(self) -> LessonProgress | None:
         """
@@ -158,6 +183,20 @@ class CourseProgress(BaseModel):
             return self.lesson_progress[self.current_lesson_index]
         return None
 
+    def completion_stats(self) -> tuple[int, int]:
+        """
+        Count completed lessons in a single pass.
+
+        Returns:
+            Tuple of (completed lessons, total lessons)
+        """
+        completed_status = ProgressStatus.COMPLETED
+        completed = 0
+        for lesson in self.lesson_progress:
+            if lesson.status == completed_status:
+                completed += 1
+        return completed, len(self.lesson_progress)
+
     def calculate_completion_percentage(self) -> float:
         """
         Calculate the overall completion percentage for this course.
@@ -165,27 +204,27 @@ class CourseProgress(BaseModel):
         Returns:
             Percentage of completed lessons (0.0 to 100.0)
         """
-        if not self.lesson_progress:
+        completed, total = self.completion_stats()
+        if not total:
             return 0.0
-        completed = sum(
-            1
-            for lesson in self.lesson_progress
-            if lesson.status == ProgressStatus.COMPLETED
-        )
-        return (completed / len(self.lesson_progress)) * 100.0
+        return (completed / total) * 100.0
 
     def is_completed(self) -> bool:
         """
         Check if all lessons in the course are completed.
 
+        Stops at the first lesson that is not completed.
+
         Returns:
             True if all lessons are completed, False otherwise
         """
         if not self.lesson_progress:
             return False
-        return all(
-            lesson.status == ProgressStatus.COMPLETED for lesson in self.lesson_progress
-        )
+        completed_status = ProgressStatus.COMPLETED
+        for lesson in self.lesson_progress:
+            if lesson.status != completed_status:
+                return False
+        return True
 
     def mark_lesson_complete(self, lesson_id: str) -> bool:
         """
@@ -94,8 +94,7 @@ class LearningSession(BaseModel):
         Sets the session state to PAUSED and records the pause timestamp.
         """
         self.state = SessionState.PAUSED
-        self.paused_at = datetime.now()
-        self.last_activity_at = datetime.now()
+        self.paused_at = self.last_activity_at = datetime.now()
 
     def resume(self) -> None:
         """
@@ -113,8 +112,7 @@ class LearningSession(BaseModel):
         Sets the session state to COMPLETED and records the completion timestamp.
         """
         self.state = SessionState.COMPLETED
-        self.completed_at = datetime.now()
-        self.last_activity_at = datetime.now()
+        self.completed_at = self.last_activity_at = datetime.now()
 
     def abandon(self) -> None:
         """
@@ -3,13 +3,39 @@ Utility functions for SkillForge.
 
 This package contains helper utilities for serialization, LLM clients,
 and other common operations.
+
+Public names are resolved lazily (PEP 562) so that importing a single submodule
+(e.g. ``skillforge.utils.llm_client``) does not pull in Rich or the core package.
 """
 
-from .output import SessionDisplay
-from .serialization import load_from_file, save_to_file
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .output import SessionDisplay
+    from .serialization import load_from_file, save_to_file
+
+_LAZY: dict[str, str] = {
+    "SessionDisplay": "skillforge.utils.output",
+    "save_to_file": "skillforge.utils.serialization",
+    "load_from_file": "skillforge.utils.serialization",
+}
 
 __all__ = [
     "save_to_file",
     "load_from_file",
     "SessionDisplay",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
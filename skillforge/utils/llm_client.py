@@ -4,11 +4,16 @@ This module provides a unified interface for interacting with different LLM prov
 with built-in retry logic, error handling, and rate limiting.
 """
 
+import asyncio
+import hashlib
 import json
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Generator
+from functools import lru_cache
 from typing import Any
 
 from anthropic import Anthropic, APIError, APITimeoutError, RateLimitError
@@ -25,6 +30,11 @@ from openai import (
 from skillforge.models.config import LLMConfig
 from skillforge.models.enums import LLMProvider
 
+_API_KEY_ENV_VARS = {
+    LLMProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
+    LLMProvider.OPENAI: "OPENAI_API_KEY",
+}
+
 
 def _strip_markdown_fences(text: str) -> str:
     """Strip markdown code fences from LLM response."""
@@ -79,6 +89,72 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> str:
+        """Generate completion from prompt without blocking the event loop.
+
+        The default implementation runs generate() in a worker thread, so
+        concurrent calls overlap their network round-trips.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text response
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> Generator[str, None, None]:
+        """Generate completion from prompt, yielding text as it arrives.
+
+        Callers may stop iterating early; closing the iterator ends the
+        request. The default implementation yields the full generate()
+        response as a single chunk.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Successive chunks of the generated text
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        yield self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
     @abstractmethod
     def generate_json(
         self,
@@ -219,6 +295,60 @@ class AnthropicClient(BaseLLMClient):
 
         return self._make_request_with_retry(make_request, "Anthropic text generation")
 
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> Generator[str, None, None]:
+        """Generate completion from prompt using Claude, yielding text deltas.
+
+        Only opening the stream is retried; errors after text has started
+        arriving are raised immediately.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Successive chunks of the generated text
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        temp = temperature if temperature is not None else self.config.temperature
+
+        def open_stream() -> Any:
+            params = {
+                "model": self.config.model,
+                "max_tokens": max_tokens,
+                "temperature": temp,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": True,
+            }
+
+            if system_prompt:
+                params["system"] = system_prompt
+
+            return self.client.messages.create(**params)  # type: ignore[call-overload]
+
+        stream = self._make_request_with_retry(open_stream, "Anthropic text streaming")
+        try:
+            for event in stream:
+                if (
+                    event.type == "content_block_delta"
+                    and event.delta.type == "text_delta"
+                ):
+                    yield event.delta.text
+        except (APIError, OpenAIAPIError, Exception) as e:
+            raise RuntimeError(f"Anthropic text streaming failed: {str(e)}") from e
+        finally:
+            stream.close()
+
     def generate_json(
         self,
         prompt: str,
@@ -345,6 +475,57 @@ class OpenAIClient(BaseLLMClient):
 
         return self._make_request_with_retry(make_request, "OpenAI text generation")
 
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> Generator[str, None, None]:
+        """Generate completion from prompt using GPT, yielding text deltas.
+
+        Only opening the stream is retried; errors after text has started
+        arriving are raised immediately.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Successive chunks of the generated text
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        temp = temperature if temperature is not None else self.config.temperature
+
+        def open_stream() -> Any:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            return self.client.chat.completions.create(
+                model=self.config.model,
+                max_tokens=max_tokens,
+                temperature=temp,
+                messages=messages,  # type: ignore[arg-type]
+                stream=True,
+            )
+
+        stream = self._make_request_with_retry(open_stream, "OpenAI text streaming")
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except (OpenAIAPIError, Exception) as e:
+            raise RuntimeError(f"OpenAI text streaming failed: {str(e)}") from e
+        finally:
+            stream.close()
+
     def generate_json(
         self,
         prompt: str,
@@ -406,8 +587,256 @@ class OpenAIClient(BaseLLMClient):
         return self._make_request_with_retry(make_request, "OpenAI JSON generation")
 
 
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an error (or its cause) reports provider rate limiting."""
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, (RateLimitError, OpenAIRateLimitError)):
+            return True
+        message = str(current).lower()
+        if "429" in message or "rate limit" in message or "rate_limit" in message:
+            return True
+        current = current.__cause__
+    return False
+
+
+class RateLimitedClient(BaseLLMClient):
+    """LLM client wrapper that keeps request rate under a provider limit.
+
+    Requests are spaced with a sliding window of start times so that at most
+    ``limit`` begin within any ``window_seconds``. When the provider reports
+    rate limiting the limit is halved and further requests back off
+    exponentially; after a run of successful requests the limit is raised
+    again one step at a time, up to ``max_requests``.
+    """
+
+    # Successful requests needed before the limit is raised by one
+    RAMP_UP_AFTER = 10
+
+    def __init__(
+        self,
+        client: BaseLLMClient,
+        max_requests: int = 50,
+        window_seconds: float = 60.0,
+    ):
+        """Wrap an LLM client with rate limiting.
+
+        Args:
+            client: The client that performs the requests
+            max_requests: Maximum requests started per window
+            window_seconds: Length of the sliding window in seconds
+
+        Raises:
+            ValueError: If max_requests or window_seconds is not positive
+        """
+        if max_requests < 1 or window_seconds <= 0:
+            raise ValueError("max_requests and window_seconds must be positive")
+        super().__init__(client.config)
+        self.client = client
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.limit = max_requests
+        self._starts: deque[float] = deque()
+        self._blocked_until = 0.0
+        self._failures = 0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next request slot.
+
+        Returns:
+            Seconds the caller must wait before starting its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            while self._starts and self._starts[0] <= now - self.window_seconds:
+                self._starts.popleft()
+            start = max(now, self._blocked_until)
+            if len(self._starts) >= self.limit:
+                start = max(start, self._starts[-self.limit] + self.window_seconds)
+            if self._starts:
+                # Slots are handed out in order, even when the limit has just
+                # changed, so the deque stays sorted for the checks above
+                start = max(start, self._starts[-1])
+            self._starts.append(start)
+            return start - now
+
+    def _record_success(self) -> None:
+        """Note a successful request, ramping the limit back up over time."""
+        with self._lock:
+            self._failures = 0
+            self._successes += 1
+            if self._successes >= self.RAMP_UP_AFTER and self.limit < self.max_requests:
+                self.limit += 1
+                self._successes = 0
+
+    def _record_failure(self, error: Exception) -> None:
+        """Note a failed request, backing off if it was rate limited."""
+        if not _is_rate_limit_error(error):
+            return
+        with self._lock:
+            self._successes = 0
+            self._failures += 1
+            self.limit = max(1, self.limit // 2)
+            delay = min(
+                self.base_delay * 2 ** (self._failures - 1), self.window_seconds
+            )
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+    def _call(self, request_func: Callable[[], Any]) -> Any:
+        """Run a request once its slot is due, recording the outcome."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            result = request_func()
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._record_success()
+        return result
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> str:
+        """Generate completion from prompt once the rate limit allows.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text response
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        return self._call(
+            lambda: self.client.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        )
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> str:
+        """Generate completion once the rate limit allows, without blocking.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text response
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            result = await self.client.agenerate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._record_success()
+        return result
+
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int = 2048,
+    ) -> Generator[str, None, None]:
+        """Stream a completion once the rate limit allows.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Optional temperature override (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Successive chunks of the generated text
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If API call fails after retries
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            yield from self.client.stream_generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        self._record_success()
+
+    def generate_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Generate structured JSON response once the rate limit allows.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            schema: Optional JSON schema to enforce structure
+
+        Returns:
+            Parsed JSON response as dictionary
+
+        Raises:
+            ValueError: If JSON is malformed
+            RuntimeError: If API call fails after retries
+        """
+        return self._call(
+            lambda: self.client.generate_json(
+                prompt=prompt, system_prompt=system_prompt, schema=schema
+            )
+        )
+
+
 class LLMClientFactory:
-    """Factory for creating appropriate LLM client based on provider."""
+    """Factory for creating appropriate LLM client based on provider.
+
+    Clients are memoized per (provider, model, temperature, API key) so repeated
+    calls within a process reuse the same SDK client and its connection pool.
+    Only a digest of the API key is used in the cache key.
+    """
 
     @staticmethod
     def create_client(config: LLMConfig) -> BaseLLMClient:
@@ -422,6 +851,19 @@ class LLMClientFactory:
         Raises:
             ValueError: If provider is not supported or API key is missing
         """
+        api_key = os.getenv(_API_KEY_ENV_VARS.get(config.provider, ""), "")
+        key_digest = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+        return LLMClientFactory._create_cached(
+            config.provider, config.model, config.temperature, key_digest
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _create_cached(
+        provider: LLMProvider, model: str, temperature: float, key_digest: str
+    ) -> BaseLLMClient:
+        """Construct a client; memoized by create_client's cache key."""
+        config = LLMConfig(provider=provider, model=model, temperature=temperature)
         if config.provider == LLMProvider.ANTHROPIC:
             return AnthropicClient(config)
         elif config.provider == LLMProvider.OPENAI:
@@ -431,3 +873,8 @@ class LLMClientFactory:
                 f"Unknown provider: {config.provider}. "
                 f"Supported providers: {LLMProvider.ANTHROPIC}, {LLMProvider.OPENAI}"
             )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized clients."""
+        LLMClientFactory._create_cached.cache_clear()
@@ -8,6 +8,7 @@ exercise prompts, validation results, and progress summaries in the terminal.
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -16,6 +17,20 @@ from skillforge.models.course import Course
 from skillforge.models.lesson import Exercise, Lesson
 from skillforge.models.progress import CourseProgress, LessonProgress
 
+# Styles are built once and applied to Text objects directly, so the
+# frequently redrawn session output bypasses Rich's markup parser.
+_BOLD = Style(bold=True)
+_BOLD_CYAN = Style(bold=True, color="cyan")
+_BOLD_GREEN = Style(bold=True, color="green")
+_DIM = Style(dim=True)
+_YELLOW = Style(color="yellow")
+
+_RESULT_STYLES: dict[ValidationStatus, tuple[Style, str]] = {
+    ValidationStatus.CORRECT: (_BOLD_GREEN, "✓"),
+    ValidationStatus.PARTIAL: (Style(bold=True, color="yellow"), "~"),
+    ValidationStatus.INCORRECT: (Style(bold=True, color="red"), "✗"),
+}
+
 
 class SessionDisplay:
     """Rich terminal display for interactive learning sessions."""
@@ -34,14 +49,21 @@ class SessionDisplay:
         Args:
             course: The course being started
         """
-        content = (
-            f"[bold cyan]{course.topic}[/bold cyan]\n\n"
-            f"{course.description}\n\n"
-            f"[dim]Difficulty: {course.difficulty.value.title()} | "
-            f"Lessons: {course.total_lessons()} | "
-            f"Exercises: {course.total_exercises()}[/dim]\n\n"
-            f"[yellow]Commands:[/yellow] "
-            f"[dim]hint, skip, quit, help, status[/dim]"
+        content = Text.assemble(
+            (course.topic, _BOLD_CYAN),
+            "\n\n",
+            course.description,
+            "\n\n",
+            (
+                f"Difficulty: {course.difficulty.value.title()} | "
+                f"Lessons: {course.total_lessons()} | "
+                f"Exercises: {course.total_exercises()}",
+                _DIM,
+            ),
+            "\n\n",
+            ("Commands:", _YELLOW),
+            " ",
+            ("hint, skip, quit, help, status", _DIM),
         )
         self.console.print(
             Panel(content, title="Welcome to SkillForge", border_style="green")
@@ -57,10 +79,13 @@ class SessionDisplay:
             lesson_num: Current lesson number (1-based)
             total_lessons: Total number of lessons
         """
-        objectives = "\n".join(f"  - {obj}" for obj in lesson.objectives)
-        content = (
-            f"[bold]{lesson.title}[/bold]\n\n"
-            f"[yellow]Objectives:[/yellow]\n{objectives}"
+        objectives = "\n".join(["  - " + obj for obj in lesson.objectives])
+        content = Text.assemble(
+            (lesson.title, _BOLD),
+            "\n\n",
+            ("Objectives:", _YELLOW),
+            "\n",
+            objectives,
         )
         self.console.print(
             Panel(
@@ -103,17 +128,8 @@ class SessionDisplay:
         Args:
             result: The validation result to display
         """
-        if result.status == ValidationStatus.CORRECT:
-            style = "green"
-            icon = "✓"
-        elif result.status == ValidationStatus.PARTIAL:
-            style = "yellow"
-            icon = "~"
-        else:
-            style = "red"
-            icon = "✗"
-
-        self.console.print(f"[bold {style}]{icon} {result.feedback}[/bold {style}]")
+        style, icon = _RESULT_STYLES[result.status]
+        self.console.print(Text(f"{icon} {result.feedback}", style=style))
 
     def display_hint(self, hint: str, attempt: int) -> None:
         """Display a hint panel.
@@ -136,9 +152,10 @@ class SessionDisplay:
         pct = progress.calculate_completion_percentage()
         self.console.print(
             Panel(
-                f"[bold green]Lesson Complete![/bold green]\n\n"
-                f"{lesson.title}\n"
-                f"Completion: {pct:.0f}%",
+                Text.assemble(
+                    ("Lesson Complete!", _BOLD_GREEN),
+                    f"\n\n{lesson.title}\nCompletion: {pct:.0f}%",
+                ),
                 border_style="green",
             )
         )
@@ -5,6 +5,8 @@ This module provides functions to save and load Pydantic models to/from JSON fil
 with proper handling of datetime fields and pretty-printing support.
 """
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -39,10 +41,44 @@ def save_to_file(model: BaseModel, file_path: str | Path, indent: int = 2) -> No
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Use Pydantic's model_dump_json with proper serialization
-    json_str = model.model_dump_json(indent=indent)
+    # Serialize straight to UTF-8 bytes with pydantic-core (same output as
+    # model_dump_json, without the intermediate str and re-encode)
+    json_bytes = model.__pydantic_serializer__.to_json(model, indent=indent)
 
-    path.write_text(json_str, encoding="utf-8")
+    path.write_bytes(json_bytes)
+
+
+def write_bytes_atomic(file_path: str | Path, data: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The data is written to a temporary file in the same directory, which then
+    replaces the target, so readers never see a partially written file. The
+    parent directory must already exist.
+
+    Args:
+        file_path: Path to the output file
+        data: Bytes to write
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def load_from_file(model_class: type[BaseModel], file_path: str | Path) -> BaseModel:
@@ -70,13 +106,14 @@ def load_from_file(model_class: type[BaseModel], file_path: str | Path) -> BaseM
     """
     path = Path(file_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    json_str = path.read_text(encoding="utf-8")
+    try:
+        json_bytes = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    # Use Pydantic's model_validate_json for validation and deserialization
-    return model_class.model_validate_json(json_str)
+    # Use Pydantic's model_validate_json for validation and deserialization;
+    # it parses bytes directly, so no intermediate str decode is needed
+    return model_class.model_validate_json(json_bytes)
 
 
 def to_dict(model: BaseModel, exclude_none: bool = False) -> dict[str, Any]:
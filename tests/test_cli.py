@@ -11,7 +11,7 @@ import pytest
 from typer.testing import CliRunner
 
 from skillforge import __version__
-from skillforge.cli import app
+from skillforge.cli import app, display_course_overview, load_config
 from skillforge.models.course import Course
 from skillforge.models.enums import Difficulty
 from skillforge.models.lesson import Exercise, Lesson
@@ -61,6 +61,27 @@ class TestCLIVersion:
         assert result.exit_code == 0
         assert __version__ in result.stdout
 
+    def test_version_does_not_import_rich(self) -> None:
+        """Test --version prints without loading Rich or pydantic models."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from skillforge.cli import app\n"
+            "try:\n"
+            "    app(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'rich.console' not in sys.modules\n"
+            "assert 'pydantic' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert __version__ in result.stdout
+
 
 class TestCLIHelp:
     """Test help-related CLI functionality."""
@@ -89,12 +110,71 @@ class TestCLIHelp:
         assert "topic" in result.stdout.lower()
 
 
+class TestLoadConfig:
+    """Test configuration loading."""
+
+    def test_load_config_is_cached_per_provider(self) -> None:
+        """Test repeated calls reuse the parsed config until the cache is cleared."""
+        load_config.cache_clear()
+        with patch.dict(os.environ, {"SKILLFORGE_MODEL": "model-a"}):
+            first = load_config("anthropic")
+            assert load_config("anthropic") is first
+            assert load_config("openai") is not first
+
+        with patch.dict(os.environ, {"SKILLFORGE_MODEL": "model-b"}):
+            assert load_config("anthropic").llm.model == "model-a"
+            load_config.cache_clear()
+            assert load_config("anthropic").llm.model == "model-b"
+        load_config.cache_clear()
+
+
+class TestPrewarmImports:
+    """Test background import prewarming."""
+
+    def test_prewarm_imports_modules_and_logs_failures(self, caplog) -> None:
+        """Test prewarm imports what it can and logs import errors."""
+        import logging
+        import sys
+
+        from skillforge.cli import _prewarm_imports
+
+        with caplog.at_level(logging.DEBUG, logger="skillforge.cli"):
+            thread = _prewarm_imports("skillforge.does_not_exist", "colorsys")
+            thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert "colorsys" in sys.modules
+        assert "skillforge.does_not_exist" in caplog.text
+
+
+class TestSaveCourse:
+    """Test saving generated courses."""
+
+    def test_save_course_creates_directory_once(self, tmp_path, mock_course) -> None:
+        """Test save_course writes the course and only creates its dir once."""
+        from skillforge import cli
+
+        course_dir = tmp_path / "courses"
+        with (
+            patch("skillforge.cli._courses_dir", return_value=course_dir),
+            patch.object(cli, "_ENSURED_DIRS", set()),
+        ):
+            cli.save_course(mock_course)
+            with (
+                patch("pathlib.Path.mkdir") as mock_mkdir,
+                patch("skillforge.utils.serialization.save_to_file"),
+            ):
+                cli.save_course(mock_course)
+                mock_mkdir.assert_not_called()
+
+        assert (course_dir / "test-id.json").exists()
+
+
 class TestLearnCommand:
     """Test the learn command functionality."""
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_with_topic(
         self, mock_client_factory, mock_generator_class, mock_course
     ) -> None:
@@ -111,8 +191,24 @@ class TestLearnCommand:
         assert "Generating course" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
+    def test_learn_skips_spinner_without_terminal(
+        self, mock_client_factory, mock_generator_class, mock_course
+    ) -> None:
+        """Test the status spinner is not started when output is piped."""
+        mock_generator_class.return_value.generate_course.return_value = mock_course
+
+        with patch("rich.console.Console.status") as mock_status:
+            result = runner.invoke(
+                app, ["learn", "pytorch basics", "--no-interactive"], input="n\n"
+            )
+        assert result.exit_code == 0
+        mock_status.assert_not_called()
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_with_difficulty(
         self, mock_client_factory, mock_generator_class, mock_course
     ) -> None:
@@ -130,8 +226,8 @@ class TestLearnCommand:
         assert "Advanced" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_with_lesson_count(
         self, mock_client_factory, mock_generator_class, mock_course
     ) -> None:
@@ -147,8 +243,8 @@ class TestLearnCommand:
         assert "Lessons: 7" in result.stdout
 
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_with_provider(
         self, mock_client_factory, mock_generator_class, mock_course
     ) -> None:
@@ -173,8 +269,8 @@ class TestLearnCommand:
             assert "API key" in result.stdout or "ANTHROPIC_API_KEY" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_invalid_difficulty(
         self, mock_client_factory, mock_generator_class
     ) -> None:
@@ -184,8 +280,8 @@ class TestLearnCommand:
         assert "Invalid difficulty" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_invalid_lesson_count(
         self, mock_client_factory, mock_generator_class
     ) -> None:
@@ -195,8 +291,8 @@ class TestLearnCommand:
         assert "must be between 1 and 20" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_displays_course_overview(
         self, mock_client_factory, mock_generator_class, mock_course
     ) -> None:
@@ -211,9 +307,26 @@ class TestLearnCommand:
         assert result.exit_code == 0
         assert "Course Overview" in result.stdout or "Python Basics" in result.stdout
 
+    def test_course_overview_shows_markup_literally(self, mock_course) -> None:
+        """Test that course text containing Rich markup is printed verbatim."""
+        from rich.console import Console
+
+        lesson = mock_course.lessons[0]
+        lesson.title = "[red]Variables[/red]"
+        lesson.objectives = ["Use [bold] tags", "Second", "Third"]
+        recorder = Console(record=True, width=200)
+
+        with patch("skillforge.cli.console", return_value=recorder):
+            display_course_overview(mock_course)
+
+        output = recorder.export_text()
+        assert "[red]Variables[/red]" in output
+        assert "• Use [bold] tags" in output
+        assert "...and 1 more" in output
+
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     @patch("skillforge.cli.save_course")
     def test_learn_save_course(
         self, mock_save, mock_client_factory, mock_generator_class, mock_course
@@ -229,13 +342,28 @@ class TestLearnCommand:
         assert result.exit_code == 0
         mock_save.assert_called_once()
 
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
+    @patch("skillforge.cli.save_course")
+    def test_learn_yes_saves_without_prompt(
+        self, mock_save, mock_client_factory, mock_generator_class, mock_course
+    ) -> None:
+        """Test --yes saves the course without asking for confirmation."""
+        mock_generator_class.return_value.generate_course.return_value = mock_course
+
+        result = runner.invoke(app, ["learn", "Python", "--no-interactive", "--yes"])
+        assert result.exit_code == 0
+        assert "Save this course" not in result.stdout
+        mock_save.assert_called_once()
+
 
 class TestCacheCommands:
     """Test cache management commands."""
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_cache_clear(self, mock_client_factory, mock_generator_class) -> None:
         """Test cache-clear command."""
         mock_generator = Mock()
@@ -248,8 +376,8 @@ class TestCacheCommands:
         assert "Cleared" in result.stdout or "cleared" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_cache_clear_empty(self, mock_client_factory, mock_generator_class) -> None:
         """Test cache-clear with no cached courses."""
         mock_generator = Mock()
@@ -261,8 +389,8 @@ class TestCacheCommands:
         assert "No cached courses" in result.stdout or "0" in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_cache_info(self, mock_client_factory, mock_generator_class) -> None:
         """Test cache-info command."""
         mock_generator = Mock()
@@ -290,8 +418,8 @@ class TestCLIOutput:
         assert __version__ in result.stdout
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("skillforge.cli.CourseGenerator")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_learn_output_formatted(
         self, mock_client_factory, mock_generator_class, mock_course
     ) -> None:
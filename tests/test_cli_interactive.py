@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 from typer.testing import CliRunner
 
 from skillforge.cli import app
+from skillforge.core.session import SessionSummary
 from skillforge.models.course import Course
 
 runner = CliRunner()
@@ -43,8 +44,8 @@ class TestLearnInteractive:
     """Tests for the learn command with interactive mode."""
 
     @patch("skillforge.cli._start_interactive_session")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
-    @patch("skillforge.cli.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
     def test_interactive_starts_session(
         self,
         mock_gen_cls: MagicMock,
@@ -59,8 +60,8 @@ class TestLearnInteractive:
         runner.invoke(app, ["learn", "git basics", "--interactive"], input="y\n")
         mock_start.assert_called_once()
 
-    @patch("skillforge.cli.LLMClientFactory.create_client")
-    @patch("skillforge.cli.CourseGenerator")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
+    @patch("skillforge.core.course_generator.CourseGenerator")
     def test_no_interactive_skips_session(
         self,
         mock_gen_cls: MagicMock,
@@ -81,7 +82,7 @@ class TestResumeCommand:
     """Tests for the resume command."""
 
     @patch("skillforge.cli.load_config")
-    @patch("skillforge.cli.find_saved_sessions")
+    @patch("skillforge.core.session.find_saved_sessions")
     def test_list_sessions_when_no_id(
         self,
         mock_find: MagicMock,
@@ -89,12 +90,12 @@ class TestResumeCommand:
     ) -> None:
         mock_config.return_value = MagicMock(data_dir="/tmp/test")
         mock_find.return_value = [
-            {
-                "session_id": "abc12345-full-id",
-                "topic": "Git Basics",
-                "state": "paused",
-                "last_activity": "2026-01-01T00:00:00",
-            }
+            SessionSummary(
+                session_id="abc12345-full-id",
+                topic="Git Basics",
+                state="paused",
+                last_activity="2026-01-01T00:00:00",
+            )
         ]
 
         result = runner.invoke(app, ["resume"])
@@ -102,7 +103,7 @@ class TestResumeCommand:
         assert "paused" in result.output
 
     @patch("skillforge.cli.load_config")
-    @patch("skillforge.cli.find_saved_sessions")
+    @patch("skillforge.core.session.find_saved_sessions")
     def test_no_sessions_message(
         self,
         mock_find: MagicMock,
@@ -115,9 +116,9 @@ class TestResumeCommand:
         assert "No saved sessions" in result.output
 
     @patch("skillforge.cli.load_config")
-    @patch("skillforge.cli.find_saved_sessions")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
-    @patch("skillforge.cli.SessionManager.load_session")
+    @patch("skillforge.core.session.iter_saved_sessions")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
+    @patch("skillforge.core.session.SessionManager.load_session")
     def test_resume_specific_session(
         self,
         mock_load: MagicMock,
@@ -127,12 +128,12 @@ class TestResumeCommand:
     ) -> None:
         mock_config.return_value = MagicMock(data_dir="/tmp/test")
         mock_find.return_value = [
-            {
-                "session_id": "abc12345",
-                "topic": "Git Basics",
-                "state": "paused",
-                "last_activity": "2026-01-01",
-            }
+            SessionSummary(
+                session_id="abc12345",
+                topic="Git Basics",
+                state="paused",
+                last_activity="2026-01-01",
+            )
         ]
         mock_factory.return_value = MagicMock()
         mock_mgr = MagicMock()
@@ -143,8 +144,8 @@ class TestResumeCommand:
         mock_mgr.run.assert_called_once()
 
     @patch("skillforge.cli.load_config")
-    @patch("skillforge.cli.find_saved_sessions")
-    @patch("skillforge.cli.LLMClientFactory.create_client")
+    @patch("skillforge.core.session.iter_saved_sessions")
+    @patch("skillforge.utils.llm_client.LLMClientFactory.create_client")
     def test_resume_no_match(
         self,
         mock_factory: MagicMock,
@@ -152,7 +153,7 @@ class TestResumeCommand:
         mock_config: MagicMock,
     ) -> None:
         mock_config.return_value = MagicMock(data_dir="/tmp/test")
-        mock_find.return_value = []
+        mock_find.return_value = iter([])
         mock_factory.return_value = MagicMock()
 
         result = runner.invoke(app, ["resume", "nonexistent"])
@@ -163,7 +164,7 @@ class TestStatusCommand:
     """Tests for the status command."""
 
     @patch("skillforge.cli.load_config")
-    @patch("skillforge.cli.find_saved_sessions")
+    @patch("skillforge.core.session.find_saved_sessions")
     def test_status_no_match(
         self,
         mock_find: MagicMock,
@@ -176,8 +177,8 @@ class TestStatusCommand:
         assert "No session found" in result.output
 
     @patch("skillforge.cli.load_config")
-    @patch("skillforge.cli.find_saved_sessions")
-    @patch("skillforge.cli.load_from_file")
+    @patch("skillforge.core.session.find_saved_sessions")
+    @patch("skillforge.utils.serialization.load_from_file")
     def test_status_shows_progress(
         self,
         mock_load_file: MagicMock,
@@ -225,12 +226,12 @@ class TestStatusCommand:
 
         mock_config.return_value = MagicMock(data_dir="/tmp/test")
         mock_find.return_value = [
-            {
-                "session_id": "abc12345",
-                "topic": "Git Basics",
-                "state": "paused",
-                "last_activity": "",
-            }
+            SessionSummary(
+                session_id="abc12345",
+                topic="Git Basics",
+                state="paused",
+                last_activity="",
+            )
         ]
         mock_load_file.return_value = session
 
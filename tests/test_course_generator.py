@@ -3,7 +3,7 @@
 import os
 import time
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -253,6 +253,17 @@ def test_cache_key_generation_case_insensitive(mock_llm_client):
     assert key1 == key2 == key3
 
 
+def test_cache_key_generation_strips_whitespace(mock_llm_client):
+    """Test that surrounding whitespace in the topic does not change the key."""
+    generator = CourseGenerator(mock_llm_client)
+
+    key1 = generator._generate_cache_key("Python", Difficulty.BEGINNER, 5)
+    key2 = generator._generate_cache_key("  Python \n", Difficulty.BEGINNER, 5)
+
+    assert key1 == key2
+    assert all(c in "0123456789abcdef" for c in key1)
+
+
 def test_cache_key_generation_different_params(mock_llm_client):
     """Test that different parameters generate different cache keys."""
     generator = CourseGenerator(mock_llm_client)
@@ -290,6 +301,109 @@ def test_generate_course_uses_cache(
     assert len(course1.lessons) == len(course2.lessons)
 
 
+def test_generate_course_computes_cache_key_once(
+    mock_llm_client, sample_course_json, temp_cache_dir
+):
+    """Test that a cache miss hashes the parameters only once."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+
+    generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
+
+    with patch.object(
+        generator, "_generate_cache_key", wraps=generator._generate_cache_key
+    ) as key_spy:
+        generator.generate_course("Python", use_cache=True)
+
+    assert key_spy.call_count == 1
+
+
+def test_generate_course_cache_disabled_skips_key(mock_llm_client, sample_course_json):
+    """Test that no cache key is computed when caching is disabled."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+
+    generator = CourseGenerator(mock_llm_client)
+
+    with patch.object(generator, "_generate_cache_key") as key_spy:
+        generator.generate_course("Python", use_cache=False)
+
+    key_spy.assert_not_called()
+
+
+def test_generate_course_memory_cache_skips_disk(
+    mock_llm_client, sample_course_json, temp_cache_dir
+):
+    """Test that repeat calls in one process are served from memory."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+
+    generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
+    course1 = generator.generate_course("Python")
+
+    with patch.object(generator, "_generate_cache_key") as key_spy:
+        course2 = generator.generate_course("  python ")
+
+    key_spy.assert_not_called()
+    assert course2 == course1
+    assert mock_llm_client.generate_json.call_count == 1
+
+
+def test_generate_course_memory_cache_returns_copies(
+    mock_llm_client, sample_course_json, temp_cache_dir
+):
+    """Test that editing a returned course does not change later hits."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+
+    generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
+    course1 = generator.generate_course("Python")
+    course1.lessons[0].title = "Edited"
+    course2 = generator.generate_course("Python")
+    course2.lessons.pop()
+    course3 = generator.generate_course("Python")
+
+    assert course3 is not course2
+    assert course3.lessons[0].title != "Edited"
+    assert len(course3.lessons) == len(sample_course_json["lessons"])
+
+
+def test_generate_course_memory_cache_uses_disk_age(
+    mock_llm_client, sample_course_json, temp_cache_dir
+):
+    """Test that a course loaded from disk expires with its cache file."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+
+    generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
+    generator.generate_course("Python")
+    assert mock_llm_client.generate_json.call_count == 1
+
+    # A fresh process finds a file that is a day short of expiring
+    cache_key = generator._generate_cache_key("Python", Difficulty.BEGINNER, 5)
+    cache_file = temp_cache_dir / f"{cache_key}.json"
+    old_mtime = time.time() - 29 * 86400
+    os.utime(cache_file, (old_mtime, old_mtime))
+    generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
+    generator.generate_course("Python")
+    assert mock_llm_client.generate_json.call_count == 1
+
+    # Two days later the in-memory copy has expired along with the file
+    later = time.time() + 2 * 86400
+    with patch("skillforge.core.course_generator.time.time", return_value=later):
+        generator.generate_course("Python")
+    assert mock_llm_client.generate_json.call_count == 2
+
+
+def test_clear_cache_clears_memory_cache(
+    mock_llm_client, sample_course_json, temp_cache_dir
+):
+    """Test that clearing the cache also forgets in-memory courses."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+
+    generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
+    generator.generate_course("Python")
+    generator.clear_cache()
+    generator.generate_course("Python")
+
+    assert mock_llm_client.generate_json.call_count == 2
+
+
 def test_generate_course_cache_miss(
     mock_llm_client, sample_course_json, temp_cache_dir
 ):
@@ -363,6 +477,39 @@ def test_corrupted_cache_handled(mock_llm_client, sample_course_json, temp_cache
     assert not cache_file.exists() or cache_file.read_text() != "invalid json content"
 
 
+def test_save_to_cache_creates_dir_once(mock_llm_client, sample_course_json, tmp_path):
+    """Test that the cache directory is created on the first save only."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+    generator = CourseGenerator(mock_llm_client, cache_dir=tmp_path / "cache")
+
+    with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mkdir:
+        generator.generate_course("Python")
+        generator.generate_course("Docker")
+
+    assert mkdir.call_count == 1
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+
+def test_save_to_cache_recreates_deleted_dir(
+    mock_llm_client, sample_course_json, tmp_path
+):
+    """Test that a cache directory removed mid-process is created again."""
+    mock_llm_client.generate_json.return_value = sample_course_json
+    cache_dir = tmp_path / "cache"
+    generator = CourseGenerator(mock_llm_client, cache_dir=cache_dir)
+
+    generator.generate_course("Python")
+    generator.clear_cache()
+    cache_dir.rmdir()
+
+    generator.generate_course("Docker")  # write fails, directory is rechecked
+    generator.generate_course("Rust")
+
+    assert [p.name for p in cache_dir.glob("*.json")] == [
+        f"{generator._generate_cache_key('Rust', Difficulty.BEGINNER, 5)}.json"
+    ]
+
+
 # Cache management tests
 
 
@@ -387,6 +534,22 @@ def test_clear_cache(mock_llm_client, sample_course_json, temp_cache_dir):
     assert len(list(temp_cache_dir.glob("*.json"))) == 0
 
 
+def test_clear_cache_ignores_other_entries(mock_llm_client, temp_cache_dir):
+    """Test that clearing only deletes cached course files."""
+    temp_cache_dir.mkdir(parents=True)
+    (temp_cache_dir / "a.json").write_text("{}")
+    (temp_cache_dir / "notes.txt").write_text("keep")
+    (temp_cache_dir / "nested.json").mkdir()
+
+    count = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir).clear_cache()
+
+    assert count == 1
+    assert sorted(p.name for p in temp_cache_dir.iterdir()) == [
+        "nested.json",
+        "notes.txt",
+    ]
+
+
 def test_clear_cache_empty(mock_llm_client, temp_cache_dir):
     """Test clearing empty cache."""
     generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
@@ -413,6 +576,20 @@ def test_get_cache_stats(mock_llm_client, sample_course_json, temp_cache_dir):
     assert stats["cache_dir"] == str(temp_cache_dir)
 
 
+def test_get_cache_stats_counts_only_course_files(mock_llm_client, temp_cache_dir):
+    """Test that stats ignore non-course entries in the cache directory."""
+    temp_cache_dir.mkdir(parents=True)
+    (temp_cache_dir / "a.json").write_text("{}")
+    (temp_cache_dir / "b.json").write_text("{}}")
+    (temp_cache_dir / "notes.txt").write_text("{}\n")
+    (temp_cache_dir / "nested.json").mkdir()
+
+    stats = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir).get_cache_stats()
+
+    assert stats["cached_courses"] == 2
+    assert stats["total_size_bytes"] == 5
+
+
 def test_get_cache_stats_empty(mock_llm_client, temp_cache_dir):
     """Test cache statistics with empty cache."""
     generator = CourseGenerator(mock_llm_client, cache_dir=temp_cache_dir)
@@ -439,6 +616,16 @@ def test_system_prompt_generation(mock_llm_client):
     assert "json" in prompt.lower()
 
 
+def test_course_schema_is_cached(mock_llm_client):
+    """Test that the course schema is built once and reused."""
+    generator = CourseGenerator(mock_llm_client)
+
+    schema = generator._get_course_schema()
+
+    assert schema == Course.model_json_schema()
+    assert generator._get_course_schema() is schema
+
+
 def test_user_prompt_includes_requirements(mock_llm_client):
     """Test user prompt includes all requirements."""
     generator = CourseGenerator(mock_llm_client)
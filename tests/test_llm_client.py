@@ -1,7 +1,8 @@
 """Tests for LLM client abstraction."""
 
+import asyncio
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from anthropic import APITimeoutError
@@ -10,8 +11,10 @@ from skillforge.models.config import LLMConfig
 from skillforge.models.enums import LLMProvider
 from skillforge.utils.llm_client import (
     AnthropicClient,
+    BaseLLMClient,
     LLMClientFactory,
     OpenAIClient,
+    RateLimitedClient,
     _strip_markdown_fences,
 )
 
@@ -74,6 +77,25 @@ def test_factory_creates_openai_client(openai_config):
         assert client.config == openai_config
 
 
+def test_factory_reuses_client_for_same_config(anthropic_config):
+    """Test factory returns the memoized client for an identical config and key."""
+    LLMClientFactory.clear_cache()
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
+        first = LLMClientFactory.create_client(anthropic_config)
+        second = LLMClientFactory.create_client(anthropic_config.model_copy())
+        assert first is second
+
+
+def test_factory_creates_new_client_when_key_changes(anthropic_config):
+    """Test factory does not share clients across different API keys."""
+    LLMClientFactory.clear_cache()
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "key-one"}):
+        first = LLMClientFactory.create_client(anthropic_config)
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "key-two"}):
+        second = LLMClientFactory.create_client(anthropic_config)
+    assert first is not second
+
+
 def test_factory_validates_provider_enum():
     """Test LLMConfig validates provider enum."""
     # Pydantic should validate the enum before factory even gets it
@@ -119,6 +141,65 @@ def test_anthropic_generate_text(mock_anthropic_class, anthropic_config):
         mock_client.messages.create.assert_called_once()
 
 
+@patch("skillforge.utils.llm_client.Anthropic")
+def test_agenerate_delegates_to_generate(mock_anthropic_class, anthropic_config):
+    """Test the default agenerate runs generate with the same arguments."""
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
+        client = AnthropicClient(anthropic_config)
+        with patch.object(client, "generate", return_value="async text") as generate:
+            result = asyncio.run(
+                client.agenerate(prompt="Test prompt", system_prompt="System")
+            )
+
+        assert result == "async text"
+        generate.assert_called_once_with(
+            prompt="Test prompt",
+            system_prompt="System",
+            temperature=None,
+            max_tokens=2048,
+        )
+
+
+@patch("skillforge.utils.llm_client.Anthropic")
+def test_anthropic_stream_generate(mock_anthropic_class, anthropic_config):
+    """Test AnthropicClient streams text deltas and closes the stream."""
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
+        events = [
+            Mock(type="message_start"),
+            Mock(type="content_block_delta", delta=Mock(type="text_delta", text="Hel")),
+            Mock(type="content_block_delta", delta=Mock(type="text_delta", text="lo")),
+            Mock(type="message_stop"),
+        ]
+        mock_stream = Mock()
+        mock_stream.__iter__ = Mock(return_value=iter(events))
+        mock_client = Mock()
+        mock_client.messages.create.return_value = mock_stream
+        mock_anthropic_class.return_value = mock_client
+
+        client = AnthropicClient(anthropic_config)
+        chunks = list(client.stream_generate(prompt="Test prompt", system_prompt="S"))
+
+        assert chunks == ["Hel", "lo"]
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["system"] == "S"
+        mock_stream.close.assert_called_once()
+
+
+@patch("skillforge.utils.llm_client.Anthropic")
+def test_stream_generate_defaults_to_generate(mock_anthropic_class, anthropic_config):
+    """Test the default stream_generate yields the generate() response once."""
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
+        client = AnthropicClient(anthropic_config)
+        with patch.object(client, "generate", return_value="whole") as generate:
+            chunks = list(BaseLLMClient.stream_generate(client, prompt="p"))
+
+        assert chunks == ["whole"]
+        generate.assert_called_once_with(
+            prompt="p", system_prompt=None, temperature=None, max_tokens=2048
+        )
+
+
 @patch("skillforge.utils.llm_client.Anthropic")
 def test_anthropic_generate_with_system_prompt(mock_anthropic_class, anthropic_config):
     """Test AnthropicClient includes system prompt when provided."""
@@ -286,6 +367,28 @@ def test_openai_generate_text(mock_openai_class, openai_config):
         mock_client.chat.completions.create.assert_called_once()
 
 
+@patch("skillforge.utils.llm_client.OpenAI")
+def test_openai_stream_generate(mock_openai_class, openai_config):
+    """Test OpenAIClient streams content deltas, skipping empty chunks."""
+    with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+        chunks = [
+            Mock(choices=[Mock(delta=Mock(content="Hel"))]),
+            Mock(choices=[Mock(delta=Mock(content=None))]),
+            Mock(choices=[]),
+            Mock(choices=[Mock(delta=Mock(content="lo"))]),
+        ]
+        mock_stream = Mock()
+        mock_stream.__iter__ = Mock(return_value=iter(chunks))
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_stream
+        mock_openai_class.return_value = mock_client
+
+        client = OpenAIClient(openai_config)
+        assert list(client.stream_generate(prompt="Test prompt")) == ["Hel", "lo"]
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+        mock_stream.close.assert_called_once()
+
+
 @patch("skillforge.utils.llm_client.OpenAI")
 def test_openai_generate_with_system_prompt(mock_openai_class, openai_config):
     """Test OpenAIClient includes system prompt when provided."""
@@ -415,6 +518,136 @@ def test_openai_no_retry_on_api_error(mock_openai_class, openai_config):
     pass
 
 
+# RateLimitedClient Tests
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    clock = FakeClock()
+    with (
+        patch("skillforge.utils.llm_client.time.monotonic", clock.monotonic),
+        patch("skillforge.utils.llm_client.time.sleep", clock.sleep),
+    ):
+        yield clock
+
+
+def test_rate_limited_client_spaces_requests(fake_clock):
+    """Test requests beyond the window limit wait for the oldest to expire."""
+    inner = Mock()
+    inner.generate.return_value = "ok"
+    client = RateLimitedClient(inner, max_requests=2, window_seconds=60.0)
+
+    assert [client.generate(prompt="p") for _ in range(3)] == ["ok"] * 3
+    assert fake_clock.sleeps == [60.0]
+    assert inner.generate.call_count == 3
+
+
+def test_rate_limited_client_backs_off_on_rate_limit(fake_clock):
+    """Test a rate-limit error halves the limit and delays the next request."""
+    inner = Mock()
+    inner.generate.side_effect = [
+        RuntimeError("Text generation failed after 3 attempts due to rate limiting"),
+        "ok",
+    ]
+    client = RateLimitedClient(inner, max_requests=8, window_seconds=60.0)
+
+    with pytest.raises(RuntimeError):
+        client.generate(prompt="p")
+    assert client.limit == 4
+
+    assert client.generate(prompt="p") == "ok"
+    assert fake_clock.sleeps == [client.base_delay]
+
+
+def test_rate_limited_client_ignores_other_errors(fake_clock):
+    """Test that non rate-limit errors leave the limit untouched."""
+    inner = Mock()
+    inner.generate_json.side_effect = ValueError("Failed to parse JSON response")
+    client = RateLimitedClient(inner, max_requests=8)
+
+    with pytest.raises(ValueError):
+        client.generate_json(prompt="p")
+    assert client.limit == 8
+
+
+def test_rate_limited_client_ramps_limit_back_up(fake_clock):
+    """Test the limit recovers one step after a run of successes."""
+    inner = Mock()
+    inner.generate.return_value = "ok"
+    client = RateLimitedClient(inner, max_requests=8, window_seconds=1.0)
+    client.limit = 4
+
+    for _ in range(RateLimitedClient.RAMP_UP_AFTER):
+        client.generate(prompt="p")
+    assert client.limit == 5
+
+
+def test_rate_limited_client_halves_limit_mid_window(fake_clock):
+    """Test slots stay ordered when the limit changes within one window."""
+    client = RateLimitedClient(Mock(), max_requests=4, window_seconds=60.0)
+    client.limit = 1
+
+    assert client._reserve() == 0.0
+    assert client._reserve() == 60.0
+    for _ in range(2 * RateLimitedClient.RAMP_UP_AFTER):
+        client._record_success()
+    assert client.limit == 3
+    assert client._reserve() == 60.0
+
+    client._record_failure(RuntimeError("429 rate limit exceeded"))
+    assert client.limit == 1
+    assert client._reserve() == 120.0
+    assert list(client._starts) == sorted(client._starts)
+
+
+def test_rate_limited_client_async(fake_clock):
+    """Test agenerate delegates to the wrapped client's agenerate."""
+    inner = Mock()
+    inner.agenerate = AsyncMock(return_value="async ok")
+    client = RateLimitedClient(inner, max_requests=2)
+
+    assert asyncio.run(client.agenerate(prompt="p", max_tokens=10)) == "async ok"
+    inner.agenerate.assert_awaited_once_with(
+        prompt="p", system_prompt=None, temperature=None, max_tokens=10
+    )
+
+
+def test_rate_limited_client_stream(fake_clock):
+    """Test streamed requests take a slot and record rate-limit failures."""
+    inner = Mock()
+    inner.stream_generate.side_effect = [
+        iter(["a", "b"]),
+        RuntimeError("429 Too Many Requests"),
+    ]
+    client = RateLimitedClient(inner, max_requests=4, window_seconds=60.0)
+
+    assert list(client.stream_generate(prompt="p")) == ["a", "b"]
+    with pytest.raises(RuntimeError):
+        list(client.stream_generate(prompt="p"))
+    assert client.limit == 2
+
+
+def test_rate_limited_client_rejects_bad_limits():
+    """Test that non-positive limits are rejected."""
+    with pytest.raises(ValueError):
+        RateLimitedClient(Mock(), max_requests=0)
+
+
 # Integration Tests (marked, optional)
 
 
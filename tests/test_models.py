@@ -25,6 +25,7 @@ from skillforge.models import (
     ProgressStatus,
     SessionState,
 )
+from skillforge.models.lesson import to_nfc
 
 
 class TestExercise:
@@ -66,6 +67,53 @@ class TestExercise:
         assert exercise.hints == []
         assert exercise.expected_output is None
 
+    def test_exercise_id_generated_when_missing(self) -> None:
+        """Test that an ID is generated for exercises created without one."""
+        first = Exercise(instruction="First")
+        second = Exercise(instruction="Second")
+        assert first.id
+        assert first.id != second.id
+
+    def test_exercise_expected_forms(self) -> None:
+        """Test the normalized forms of the expected output."""
+        exercise = Exercise(id="ex5", instruction="List", expected_output=" LS   -la ")
+        forms = exercise.expected_forms
+        assert forms is not None
+        assert forms.stripped == "LS   -la"
+        assert forms.lower == "ls   -la"
+        assert forms.normalized == "LS -la"
+        assert forms.tokens == ("LS", "-la")
+        assert forms.lower_tokens == ("ls", "-la")
+        assert exercise.expected_forms is forms
+
+        exercise.expected_output = "pwd"
+        assert exercise.expected_forms is not None
+        assert exercise.expected_forms.stripped == "pwd"
+
+        assert Exercise(id="ex6", instruction="Free").expected_forms is None
+
+    def test_exercise_expected_forms_nfc(self) -> None:
+        """Test that expected forms are NFC-normalized."""
+        exercise = Exercise(id="ex8", instruction="Say", expected_output="Cafe\u0301")
+        assert exercise.expected_forms is not None
+        assert exercise.expected_forms.stripped == "Caf\u00e9"
+        assert exercise.expected_forms.lower == "caf\u00e9"
+        assert exercise.expected_output == "Cafe\u0301"
+
+    def test_to_nfc(self) -> None:
+        """Test NFC normalization and its already-normalized fast path."""
+        text = "ls -la"
+        assert to_nfc(text) is text
+        assert to_nfc("e\u0301") == "\u00e9"
+
+    def test_exercise_expected_forms_not_serialized(self) -> None:
+        """Test that computing expected forms leaves the model data unchanged."""
+        exercise = Exercise(id="ex7", instruction="List", expected_output="ls")
+        copy = exercise.model_copy()
+        assert exercise.expected_forms is not None
+        assert exercise == copy
+        assert "expected_forms" not in exercise.model_dump()
+
 
 class TestLesson:
     """Test the Lesson model."""
@@ -127,6 +175,39 @@ class TestLesson:
         assert lesson.get_exercise_by_id("ex2") == ex2
         assert lesson.get_exercise_by_id("nonexistent") is None
 
+    def test_lesson_get_exercise_by_id_after_changes(self) -> None:
+        """Test that exercise lookups follow changes to the exercise list."""
+        ex1 = Exercise(id="ex1", instruction="First")
+        ex2 = Exercise(id="ex2", instruction="Second")
+        lesson = Lesson(
+            id="lesson1", title="Test", objectives=["Test"], exercises=[ex1, ex2]
+        )
+        assert lesson.get_exercise_by_id("ex2") == ex2
+
+        ex3 = Exercise(id="ex3", instruction="Third")
+        lesson.exercises.append(ex3)
+        assert lesson.get_exercise_by_id("ex3") == ex3
+
+        replacement = Exercise(id="ex4", instruction="Fourth")
+        lesson.exercises[1] = replacement
+        assert lesson.get_exercise_by_id("ex2") is None
+        assert lesson.get_exercise_by_id("ex4") == replacement
+
+        lesson.exercises = [ex2]
+        assert lesson.get_exercise_by_id("ex2") == ex2
+        assert lesson.get_exercise_by_id("ex1") is None
+
+    def test_lesson_lookup_index_not_serialized(self) -> None:
+        """Test that the lookup index does not leak into dumps or equality."""
+        exercises = [Exercise(id="ex1", instruction="First")]
+        lesson = Lesson(id="l1", title="T", objectives=["O"], exercises=exercises)
+        other = Lesson(id="l1", title="T", objectives=["O"], exercises=exercises)
+
+        lesson.get_exercise_by_id("ex1")
+
+        assert lesson == other
+        assert lesson.model_dump() == other.model_dump()
+
     def test_lesson_get_exercise_by_index(self) -> None:
         """Test getting exercise by index."""
         ex1 = Exercise(id="ex1", instruction="First")
@@ -196,6 +277,26 @@ class TestCourse:
         assert len(course.lessons[0].exercises) == 1
         assert course.lessons[0].exercises[0].id == "ex1"
 
+    def test_course_ids_generated_when_missing(self) -> None:
+        """Test that IDs are generated for nested data that omits them."""
+        course = Course.model_validate(
+            {
+                "topic": "Generated",
+                "description": "Test",
+                "difficulty": "beginner",
+                "lessons": [
+                    {
+                        "title": "Lesson",
+                        "objectives": ["Learn"],
+                        "exercises": [{"instruction": "Do it"}],
+                    }
+                ],
+            }
+        )
+        assert course.id
+        assert course.lessons[0].id
+        assert course.lessons[0].exercises[0].id
+
     def test_course_missing_required_fields(self) -> None:
         """Test that required fields are enforced."""
         with pytest.raises(ValidationError):
@@ -249,6 +350,27 @@ class TestCourse:
         assert course.get_lesson_by_id("lesson2") == lesson2
         assert course.get_lesson_by_id("nonexistent") is None
 
+    def test_course_get_lesson_by_id_after_changes(self) -> None:
+        """Test that lesson lookups follow changes to the lesson list."""
+        lesson1 = Lesson(id="lesson1", title="First", objectives=["Learn"])
+        lesson2 = Lesson(id="lesson2", title="Second", objectives=["Practice"])
+        course = Course(
+            id="course1",
+            topic="Test",
+            description="Test",
+            difficulty=Difficulty.BEGINNER,
+            lessons=[lesson1, lesson2],
+        )
+        assert course.get_lesson_by_id("lesson1") == lesson1
+
+        lesson2.id = "renamed"
+        assert course.get_lesson_by_id("lesson2") is None
+        assert course.get_lesson_by_id("renamed") == lesson2
+
+        course.lessons.insert(0, Lesson(id="lesson0", title="Zero", objectives=["X"]))
+        assert course.get_lesson_by_id("lesson1") == lesson1
+        assert course.get_lesson_by_id("lesson0") is course.lessons[0]
+
     def test_course_get_lesson_by_index(self) -> None:
         """Test getting lesson by index."""
         lesson1 = Lesson(id="lesson1", title="First", objectives=["Learn"])
@@ -536,6 +658,21 @@ class TestLessonProgress:
         assert progress.get_exercise_progress("ex2") == ex2
         assert progress.get_exercise_progress("nonexistent") is None
 
+    def test_lesson_progress_get_exercise_progress_after_changes(self) -> None:
+        """Test that exercise progress lookups follow list changes."""
+        ex1 = ExerciseProgress(exercise_id="ex1")
+        progress = LessonProgress(lesson_id="lesson1", exercise_progress=[ex1])
+        assert progress.get_exercise_progress("ex1") == ex1
+
+        ex2 = ExerciseProgress(exercise_id="ex2")
+        progress.exercise_progress.insert(0, ex2)
+        assert progress.get_exercise_progress("ex2") is ex2
+        assert progress.get_exercise_progress("ex1") is ex1
+
+        progress.exercise_progress.pop()
+        assert progress.get_exercise_progress("ex1") is None
+        assert "_exercise_positions" not in progress.model_dump()
+
     def test_lesson_progress_calculate_completion_percentage(self) -> None:
         """Test completion percentage calculation."""
         progress = LessonProgress(
@@ -549,6 +686,8 @@ class TestLessonProgress:
         )
 
         assert progress.calculate_completion_percentage() == 50.0
+        assert progress.completion_stats() == (2, 4)
+        assert LessonProgress(lesson_id="empty").completion_stats() == (0, 0)
 
     def test_lesson_progress_is_completed(self) -> None:
         """Test checking if lesson is completed."""
@@ -676,6 +815,20 @@ class TestCourseProgress:
         assert progress.get_lesson_progress("lesson2") == lesson2
         assert progress.get_lesson_progress("nonexistent") is None
 
+    def test_course_progress_get_lesson_progress_after_changes(self) -> None:
+        """Test that lesson progress lookups follow list changes."""
+        lesson1 = LessonProgress(lesson_id="lesson1")
+        progress = CourseProgress(
+            course_id="course1", user_id="user1", lesson_progress=[lesson1]
+        )
+        assert progress.mark_lesson_complete("lesson1")
+
+        lesson2 = LessonProgress(lesson_id="lesson2")
+        progress.lesson_progress = [lesson2, lesson1]
+        assert progress.get_lesson_progress("lesson2") is lesson2
+        assert progress.get_lesson_progress("lesson1") is lesson1
+        assert progress == CourseProgress.model_validate(progress.model_dump())
+
     def test_course_progress_get_current_lesson_progress(self) -> None:
         """Test getting current lesson progress."""
         lesson1 = LessonProgress(lesson_id="lesson1")
@@ -703,6 +856,7 @@ class TestCourseProgress:
         )
 
         assert progress.calculate_completion_percentage() == 50.0
+        assert progress.completion_stats() == (2, 4)
 
     def test_course_progress_is_completed(self) -> None:
         """Test checking if course is completed."""
@@ -1028,6 +1182,7 @@ class TestLearningSession:
         assert session.state == SessionState.PAUSED
         assert session.paused_at is not None
         assert session.last_activity_at is not None
+        assert session.paused_at == session.last_activity_at
 
     def test_session_resume(self) -> None:
         """Test resuming a paused session."""
@@ -1067,6 +1222,7 @@ class TestLearningSession:
         assert session.state == SessionState.COMPLETED
         assert session.completed_at is not None
         assert session.last_activity_at is not None
+        assert session.completed_at == session.last_activity_at
 
     def test_session_abandon(self) -> None:
         """Test abandoning a session."""
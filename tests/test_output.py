@@ -120,6 +120,14 @@ class TestSessionDisplayWelcome:
         assert "skip" in output
         assert "quit" in output
 
+    def test_welcome_renders_brackets_literally(self) -> None:
+        console, buf = make_console()
+        display = SessionDisplay(console)
+        course = make_course()
+        course.topic = "Arrays [bold]and[/bold] slices"
+        display.display_welcome(course)
+        assert "Arrays [bold]and[/bold] slices" in buf.getvalue()
+
 
 class TestSessionDisplayLessonHeader:
     """Tests for display_lesson_header."""
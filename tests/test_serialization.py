@@ -7,6 +7,7 @@ for all Pydantic models.
 
 import json
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -33,6 +34,7 @@ from skillforge.utils.serialization import (
     save_to_file,
     to_dict,
     to_json,
+    write_bytes_atomic,
 )
 
 
@@ -546,3 +548,29 @@ def test_roundtrip_config(sample_app_config, temp_json_file):
     assert loaded.data_dir == sample_app_config.data_dir
     assert loaded.llm.provider == sample_app_config.llm.provider
     assert loaded.llm.model == sample_app_config.llm.model
+
+
+# Atomic write tests
+
+
+def test_write_bytes_atomic_replaces_file(tmp_path):
+    """Test that write_bytes_atomic writes and overwrites a file."""
+    target = tmp_path / "data.json"
+    write_bytes_atomic(target, b'{"a": 1}')
+    write_bytes_atomic(target, b'{"b": 2}')
+
+    assert target.read_bytes() == b'{"b": 2}'
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_write_bytes_atomic_failure_keeps_original(tmp_path):
+    """Test that a failed write leaves the old file and no temp file behind."""
+    target = tmp_path / "data.json"
+    target.write_bytes(b"original")
+
+    with patch("skillforge.utils.serialization.os.write", side_effect=OSError):
+        with pytest.raises(OSError):
+            write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"original"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
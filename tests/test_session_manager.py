@@ -1,6 +1,7 @@
 """Tests for the SessionManager interactive session orchestrator."""
 
 import json
+from datetime import datetime
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
@@ -8,7 +9,11 @@ from unittest.mock import patch
 import pytest
 from rich.console import Console
 
-from skillforge.core.session import SessionManager, find_saved_sessions
+from skillforge.core.session import (
+    SessionManager,
+    find_saved_sessions,
+    iter_saved_sessions,
+)
 from skillforge.core.simulator import CommandSimulator
 from skillforge.core.validator import (
     ExerciseValidator,
@@ -255,6 +260,36 @@ class TestRunExercise:
         assert ep.status == ProgressStatus.COMPLETED
         assert ep.attempts == 1
 
+    def test_exact_answer_skips_simulation(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        ex = make_exercise(expected="git init")
+        ep = ExerciseProgress(exercise_id=ex.id)
+
+        with (
+            patch.object(mgr.display, "prompt_answer", return_value="git init"),
+            patch.object(mgr.simulator, "simulate") as simulate,
+        ):
+            result = mgr._run_exercise(ex, ep)
+
+        assert result is True
+        simulate.assert_not_called()
+
+    def test_other_answers_are_simulated(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        ex = make_exercise(expected="git init")
+        ep = ExerciseProgress(exercise_id=ex.id)
+
+        answers = iter(["git status", "git init"])
+        with (
+            patch.object(mgr.display, "prompt_answer", side_effect=answers),
+            patch.object(
+                mgr.simulator, "simulate", wraps=mgr.simulator.simulate
+            ) as simulate,
+        ):
+            mgr._run_exercise(ex, ep)
+
+        simulate.assert_called_once_with("git status", context=ex.instruction)
+
     def test_skip_command(self, tmp_path: Path) -> None:
         mgr = make_manager(tmp_path=tmp_path)
         ex = make_exercise()
@@ -276,6 +311,17 @@ class TestRunExercise:
 
         assert result is None
 
+    def test_special_commands_case_insensitive(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        ex = make_exercise()
+        ep = ExerciseProgress(exercise_id=ex.id)
+
+        with patch.object(mgr.display, "prompt_answer", return_value=" `SKIP` "):
+            result = mgr._run_exercise(ex, ep)
+
+        assert result is False
+        assert ep.status == ProgressStatus.FAILED
+
     def test_wrong_then_correct(self, tmp_path: Path) -> None:
         mgr = make_manager(tmp_path=tmp_path)
         ex = make_exercise(expected="git init")
@@ -320,6 +366,23 @@ class TestSaveProgress:
         data = json.loads(session_file.read_text())
         assert data["session_id"] == mgr.session.session_id
 
+    def test_saved_file_is_compact(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+
+        session_file = tmp_path / "sessions" / f"{mgr.session.session_id}.json"
+        raw = session_file.read_bytes()
+        assert b"\n" not in raw
+        assert LearningSession.model_validate_json(raw) == mgr.session
+
+    def test_no_temp_files_left_behind(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+        mgr._save_progress()
+
+        names = sorted(p.name for p in (tmp_path / "sessions").iterdir())
+        assert names == [f"{mgr.session.session_id}.json", "summaries.jsonl"]
+
     def test_creates_sessions_dir(self, tmp_path: Path) -> None:
         data_dir = tmp_path / "new_dir"
         mgr = make_manager(tmp_path=data_dir)
@@ -327,6 +390,184 @@ class TestSaveProgress:
         assert (data_dir / "sessions").is_dir()
 
 
+class TestRecordExerciseProgress:
+    def _load(self, mgr: SessionManager, tmp_path: Path) -> SessionManager:
+        return SessionManager.load_session(
+            session_id=mgr.session.session_id,
+            simulator=CommandSimulator(),
+            validator=ExerciseValidator(),
+            display=make_display(),
+            data_dir=str(tmp_path),
+        )
+
+    def test_first_record_writes_snapshot(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        mgr._record_exercise_progress(ep)
+
+        sessions_dir = tmp_path / "sessions"
+        assert (sessions_dir / f"{mgr.session.session_id}.json").exists()
+        assert not (sessions_dir / f"{mgr.session.session_id}.events.jsonl").exists()
+
+    def test_later_records_append_events(self, tmp_path: Path) -> None:
+        mgr = make_manager(course=make_course(exercises_per=2), tmp_path=tmp_path)
+        mgr._save_progress()
+        session_file = tmp_path / "sessions" / f"{mgr.session.session_id}.json"
+        snapshot = session_file.read_text()
+
+        for ep in mgr.session.progress.lesson_progress[0].exercise_progress:
+            ep.status = ProgressStatus.COMPLETED
+            ep.attempts = 2
+            mgr._record_exercise_progress(ep)
+
+        events_file = tmp_path / "sessions" / f"{mgr.session.session_id}.events.jsonl"
+        assert len(events_file.read_text().splitlines()) == 2
+        assert session_file.read_text() == snapshot
+
+    def test_load_folds_events_into_snapshot(self, tmp_path: Path) -> None:
+        mgr = make_manager(course=make_course(exercises_per=2), tmp_path=tmp_path)
+        mgr._save_progress()
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[1]
+        ep.status = ProgressStatus.COMPLETED
+        ep.attempts = 3
+        ep.user_answer = "answer0_1"
+        mgr._record_exercise_progress(ep)
+
+        loaded = self._load(mgr, tmp_path)
+        first, second = loaded.session.progress.lesson_progress[0].exercise_progress
+        assert first.status == ProgressStatus.NOT_STARTED
+        assert second.status == ProgressStatus.COMPLETED
+        assert second.attempts == 3
+        assert second.user_answer == "answer0_1"
+
+    def test_load_skips_malformed_events(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        ep.status = ProgressStatus.FAILED
+        mgr._record_exercise_progress(ep)
+        events_file = tmp_path / "sessions" / f"{mgr.session.session_id}.events.jsonl"
+        with open(events_file, "a") as f:
+            f.write('{"kind": "exercise", "exer')
+
+        loaded = self._load(mgr, tmp_path)
+        loaded_ep = loaded.session.progress.lesson_progress[0].exercise_progress[0]
+        assert loaded_ep.status == ProgressStatus.FAILED
+
+    def test_snapshot_compacts_events(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        ep.status = ProgressStatus.COMPLETED
+        mgr._record_exercise_progress(ep)
+
+        mgr._save_progress()
+
+        events_file = tmp_path / "sessions" / f"{mgr.session.session_id}.events.jsonl"
+        assert not events_file.exists()
+        loaded = self._load(mgr, tmp_path)
+        loaded_ep = loaded.session.progress.lesson_progress[0].exercise_progress[0]
+        assert loaded_ep.status == ProgressStatus.COMPLETED
+
+    def test_event_log_is_private(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        mgr._record_exercise_progress(ep)
+
+        events_file = tmp_path / "sessions" / f"{mgr.session.session_id}.events.jsonl"
+        assert events_file.stat().st_mode & 0o777 == 0o600
+
+    def test_load_replays_duplicate_exercise_ids_by_position(
+        self, tmp_path: Path
+    ) -> None:
+        course = make_course(num_lessons=2)
+        for lesson in course.lessons:
+            lesson.exercises[0].id = "ex1"
+        mgr = make_manager(course=course, tmp_path=tmp_path)
+        for lp in mgr.session.progress.lesson_progress:
+            lp.exercise_progress[0].exercise_id = "ex1"
+        mgr._save_progress()
+        for lesson_idx, status in enumerate(
+            (ProgressStatus.COMPLETED, ProgressStatus.FAILED)
+        ):
+            mgr.session.progress.current_lesson_index = lesson_idx
+            ep = mgr.session.progress.lesson_progress[lesson_idx].exercise_progress[0]
+            ep.status = status
+            mgr._record_exercise_progress(ep)
+        mgr.session.progress.lesson_progress[0].exercise_progress[0].attempts = 5
+        mgr._record_exercise_progress(
+            mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        )
+
+        loaded = self._load(mgr, tmp_path)
+        first, second = loaded.session.progress.lesson_progress
+        assert first.exercise_progress[0].status == ProgressStatus.COMPLETED
+        assert first.exercise_progress[0].attempts == 5
+        assert second.exercise_progress[0].status == ProgressStatus.FAILED
+
+    def test_load_folds_lesson_events(self, tmp_path: Path) -> None:
+        mgr = make_manager(course=make_course(num_lessons=2), tmp_path=tmp_path)
+        mgr._save_progress()
+        progress = mgr.session.progress
+        progress.current_lesson_index = 1
+        lp = progress.lesson_progress[1]
+        lp.status = ProgressStatus.COMPLETED
+        lp.completed_at = datetime(2026, 1, 2, 3, 4, 5)
+        mgr._record_lesson_progress(1, lp)
+
+        loaded = self._load(mgr, tmp_path)
+        loaded_progress = loaded.session.progress
+        first, second = loaded_progress.lesson_progress
+        assert loaded_progress.current_lesson_index == 1
+        assert first.status == ProgressStatus.NOT_STARTED
+        assert second.status == ProgressStatus.COMPLETED
+        assert second.completed_at == datetime(2026, 1, 2, 3, 4, 5)
+        assert len(second.exercise_progress) == 1
+
+    def test_completed_lesson_survives_crash(self, tmp_path: Path) -> None:
+        course = make_course(num_lessons=2)
+        mgr = make_manager(course=course, tmp_path=tmp_path)
+        answers = iter(["answer0_0", "answer1_0"])
+
+        def crash() -> bool:
+            raise SystemExit
+
+        with (
+            patch.object(mgr.display, "prompt_answer", side_effect=answers),
+            patch.object(mgr.display, "prompt_continue", side_effect=crash),
+            pytest.raises(SystemExit),
+        ):
+            mgr.run()
+
+        loaded = self._load(mgr, tmp_path)
+        first, second = loaded.session.progress.lesson_progress
+        assert first.status == ProgressStatus.COMPLETED
+        assert first.completed_at is not None
+        assert second.status == ProgressStatus.NOT_STARTED
+
+    def test_listing_reports_event_activity(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+        find_saved_sessions(str(tmp_path))
+
+        mgr.session.last_activity_at = datetime(2099, 1, 1)
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        mgr._record_exercise_progress(ep)
+
+        sessions = find_saved_sessions(str(tmp_path))
+        assert sessions[0].last_activity == "2099-01-01T00:00:00"
+
+    def test_event_logs_not_listed_as_sessions(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr._save_progress()
+        ep = mgr.session.progress.lesson_progress[0].exercise_progress[0]
+        mgr._record_exercise_progress(ep)
+
+        sessions = find_saved_sessions(str(tmp_path))
+        assert [s.session_id for s in sessions] == [mgr.session.session_id]
+
+
 # --- load_session ---
 
 
@@ -413,6 +654,33 @@ class TestRun:
 
         assert mgr.session.state == SessionState.PAUSED
 
+    def test_quit_writes_one_snapshot(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+
+        with (
+            patch.object(mgr.display, "prompt_answer", return_value="quit"),
+            patch.object(mgr, "_save_progress", wraps=mgr._save_progress) as save,
+        ):
+            mgr.run()
+
+        assert save.call_count == 1
+        session_file = tmp_path / "sessions" / f"{mgr.session.session_id}.json"
+        assert json.loads(session_file.read_text())["state"] == "paused"
+
+    def test_decline_continue_writes_one_snapshot(self, tmp_path: Path) -> None:
+        course = make_course(num_lessons=2, exercises_per=1)
+        mgr = make_manager(course=course, tmp_path=tmp_path)
+        mgr._save_progress()
+
+        with (
+            patch.object(mgr.display, "prompt_answer", return_value="answer0_0"),
+            patch.object(mgr.display, "prompt_continue", return_value=False),
+            patch.object(mgr, "_save_progress", wraps=mgr._save_progress) as save,
+        ):
+            mgr.run()
+
+        assert save.call_count == 1
+
     def test_skip_exercise_still_completes_lesson(self, tmp_path: Path) -> None:
         course = make_course(num_lessons=1, exercises_per=2)
         mgr = make_manager(course=course, tmp_path=tmp_path)
@@ -518,9 +786,9 @@ class TestFindSavedSessions:
 
         result = find_saved_sessions(data_dir=str(tmp_path))
         assert len(result) == 1
-        assert result[0]["session_id"] == "abc123"
-        assert result[0]["topic"] == "Git Basics"
-        assert result[0]["state"] == "paused"
+        assert result[0].session_id == "abc123"
+        assert result[0].topic == "Git Basics"
+        assert result[0].state == "paused"
 
     def test_ignores_invalid_json(self, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
@@ -530,6 +798,117 @@ class TestFindSavedSessions:
         result = find_saved_sessions(data_dir=str(tmp_path))
         assert result == []
 
+    def test_ignores_non_json_entries(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        (sessions_dir / "partial.tmp").write_text("{}")
+        (sessions_dir / "nested.json").mkdir()
+        (sessions_dir / "ok.json").write_text(json.dumps({"session_id": "ok"}))
+
+        result = find_saved_sessions(data_dir=str(tmp_path))
+        assert [s.session_id for s in result] == ["ok"]
+
+    def test_prefix_filters_by_file_name(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        for sid in ("abc1", "abc2", "xyz1"):
+            (sessions_dir / f"{sid}.json").write_text(json.dumps({"session_id": sid}))
+        # Not parsed at all: its name does not match the prefix
+        (sessions_dir / "zzz.json").write_text("not json")
+
+        with patch("skillforge.core.session.open", create=True, wraps=open) as m:
+            result = find_saved_sessions(data_dir=str(tmp_path), prefix="abc")
+        assert sorted(s.session_id for s in result) == ["abc1", "abc2"]
+        assert m.call_count == 2
+
+    def test_iter_saved_sessions_is_lazy(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        for i in range(3):
+            (sessions_dir / f"s{i}.json").write_text(
+                json.dumps({"session_id": f"s{i}"})
+            )
+
+        it = iter_saved_sessions(data_dir=str(tmp_path))
+        first = next(it)
+        assert first.session_id.startswith("s")
+        it.close()
+
+    def test_iter_saved_sessions_missing_dir(self, tmp_path: Path) -> None:
+        assert list(iter_saved_sessions(data_dir=str(tmp_path))) == []
+
+    def test_second_listing_uses_summary_index(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        for sid in ("a", "b"):
+            data = {"session_id": sid, "course": {"topic": f"Topic {sid}"}}
+            (sessions_dir / f"{sid}.json").write_text(json.dumps(data))
+
+        first = find_saved_sessions(data_dir=str(tmp_path))
+        assert (sessions_dir / "summaries.jsonl").exists()
+
+        with patch("skillforge.core.session.open", create=True, wraps=open) as m:
+            second = find_saved_sessions(data_dir=str(tmp_path))
+        assert m.call_count == 0
+        assert sorted(second, key=lambda s: s.session_id) == sorted(
+            first, key=lambda s: s.session_id
+        )
+
+    def test_saving_session_updates_summary_index(self, tmp_path: Path) -> None:
+        mgr = make_manager(tmp_path=tmp_path)
+        mgr.session.pause()
+        mgr._save_progress()
+
+        with patch("skillforge.core.session.open", create=True, wraps=open) as m:
+            result = find_saved_sessions(data_dir=str(tmp_path))
+        assert m.call_count == 0
+        assert len(result) == 1
+        summary = result[0]
+        assert summary.session_id == mgr.session.session_id
+        assert summary.topic == "Test Topic"
+        assert summary.state == "paused"
+        assert summary == next(iter_saved_sessions(data_dir=str(tmp_path)))
+
+    def test_summary_index_refreshes_changed_sessions(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        path = sessions_dir / "a.json"
+        path.write_text(json.dumps({"session_id": "a", "state": "active"}))
+        find_saved_sessions(data_dir=str(tmp_path))
+
+        path.write_text(json.dumps({"session_id": "a", "state": "completed"}))
+        result = find_saved_sessions(data_dir=str(tmp_path))
+        assert [s.state for s in result] == ["completed"]
+
+    def test_summary_index_drops_deleted_sessions(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        for sid in ("abc", "xyz"):
+            (sessions_dir / f"{sid}.json").write_text(json.dumps({"session_id": sid}))
+        find_saved_sessions(data_dir=str(tmp_path))
+
+        (sessions_dir / "abc.json").unlink()
+        assert find_saved_sessions(data_dir=str(tmp_path), prefix="abc") == []
+        result = find_saved_sessions(data_dir=str(tmp_path))
+        assert [s.session_id for s in result] == ["xyz"]
+
+    def test_null_last_activity_lists_as_empty(self, tmp_path: Path) -> None:
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        (sessions_dir / "a.json").write_text(
+            json.dumps({"session_id": "a", "last_activity_at": None})
+        )
+        (sessions_dir / "b.json").write_text(
+            json.dumps({"session_id": "b", "last_activity_at": "2026-01-01T00:00:00"})
+        )
+
+        for _ in range(2):  # scan, then from the summary index
+            result = find_saved_sessions(data_dir=str(tmp_path))
+            assert [(s.session_id, s.last_activity) for s in result] == [
+                ("b", "2026-01-01T00:00:00"),
+                ("a", ""),
+            ]
+
     def test_sorts_by_last_activity(self, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
         sessions_dir.mkdir()
@@ -544,7 +923,7 @@ class TestFindSavedSessions:
             (sessions_dir / f"s{i}.json").write_text(json.dumps(data))
 
         result = find_saved_sessions(data_dir=str(tmp_path))
-        assert result[0]["session_id"] == "s1"  # newest first
+        assert result[0].session_id == "s1"  # newest first
 
     def test_multiple_sessions(self, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
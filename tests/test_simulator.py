@@ -1,6 +1,6 @@
 """Tests for the command simulator."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -40,6 +40,37 @@ class TestVirtualFileSystem:
         assert fs.normalize_path("/home/user/./file.txt") == "/home/user/file.txt"
         assert fs.normalize_path("/home/user/docs/../file.txt") == "/home/user/file.txt"
 
+    def test_normalize_path_unclean_absolute(self):
+        """Test absolute paths that need normalizing despite the fast path."""
+        fs = VirtualFileSystem()
+
+        assert fs.normalize_path("/home//user/") == "/home/user"
+        assert fs.normalize_path("/home/./user/.") == "/home/user"
+        assert fs.normalize_path("/home/user/..") == "/home"
+        assert fs.normalize_path("/home/../../tmp") == "/tmp"
+        assert fs.normalize_path("/") == "/"
+        assert fs.normalize_path("/home/.config") == "/home/.config"
+
+    def test_normalize_path_cache_tracks_current_dir(self):
+        """Test that cached relative paths resolve against the current dir."""
+        fs = VirtualFileSystem()
+
+        assert fs.normalize_path("file.txt") == "/home/user/file.txt"
+        fs.current_dir = "/tmp"
+        assert fs.normalize_path("file.txt") == "/tmp/file.txt"
+        fs.current_dir = "/home/user"
+        assert fs.normalize_path("file.txt") == "/home/user/file.txt"
+
+    def test_normalize_path_cache_is_bounded(self):
+        """Test that the normalization cache does not grow without bound."""
+        fs = VirtualFileSystem()
+
+        for i in range(2000):
+            fs.normalize_path(f"dir{i}/../file{i}")
+
+        assert len(fs._norm_cache) <= 1024
+        assert fs.normalize_path("dir0/../file0") == "/home/user/file0"
+
     def test_write_and_read_file(self):
         """Test writing and reading files."""
         fs = VirtualFileSystem()
@@ -94,6 +125,16 @@ class TestVirtualFileSystem:
         assert fs.is_file("/home/user/newfile.txt")
         assert fs.read_file("/home/user/newfile.txt") == ""
 
+    def test_normalize_path_interns_results(self):
+        """Test that equal normalized paths share one string object."""
+        fs = VirtualFileSystem()
+        first = fs.normalize_path("projects/../notes.txt")
+        fs.current_dir = "/"
+        second = fs.normalize_path("home/user/notes.txt")
+
+        assert first == second == "/home/user/notes.txt"
+        assert first is second
+
     def test_list_directory(self):
         """Test listing directory contents."""
         fs = VirtualFileSystem()
@@ -106,6 +147,19 @@ class TestVirtualFileSystem:
         assert "file2.txt" in contents
         assert "subdir" in contents
 
+    def test_list_directory_direct_children_only(self):
+        """Test that listing shows direct children only, each once."""
+        fs = VirtualFileSystem()
+        fs.create_directory("/home/user/projects/app")
+        fs.write_file("/home/user/projects/app/main.py", "print('hi')")
+        fs.write_file("/home/user/projects/README.md", "v1")
+        fs.write_file("/home/user/projects/README.md", "v2")
+
+        assert fs.list_directory("/") == ["home", "tmp"]
+        assert fs.list_directory("/home/user") == ["projects"]
+        assert fs.list_directory("/home/user/projects") == ["README.md", "app"]
+        assert fs.list_directory("/home/user/projects/app") == ["main.py"]
+
     def test_list_empty_directory(self):
         """Test listing an empty directory."""
         fs = VirtualFileSystem()
@@ -184,6 +238,20 @@ class TestCommandSimulator:
         assert result.success is False
         assert "No such file or directory" in result.error
 
+    def test_simulate_cd_normalizes_once(self):
+        """Test that cd normalizes its target path a single time."""
+        sim = CommandSimulator()
+        sim.filesystem.create_directory("/home/user/project")
+
+        with patch.object(
+            sim.filesystem, "normalize_path", wraps=sim.filesystem.normalize_path
+        ) as normalize:
+            result = sim.simulate("cd project/../project")
+
+        assert result.success is True
+        assert sim.filesystem.current_dir == "/home/user/project"
+        normalize.assert_called_once_with("project/../project")
+
     def test_simulate_mkdir(self):
         """Test simulating mkdir command."""
         sim = CommandSimulator()
@@ -265,6 +333,20 @@ class TestCommandSimulator:
         assert result.success is True
         assert "x" in sim.python_variables
 
+    def test_simulate_python_assignment_parsing(self):
+        """Test which statements are treated as simple assignments."""
+        sim = CommandSimulator()
+
+        result = sim._simulate_python_code("total=a + b", None)
+        assert result.state_changes == {"python_variable": "total"}
+        assert sim.python_variables["total"] == "a + b"
+
+        # Comparisons and attribute targets are not simple assignments
+        for code in ("x == 5", "obj.attr = 1", "x ="):
+            result = sim._simulate_python_code(code, None)
+            assert result.exit_code == 127
+        assert set(sim.python_variables) == {"total"}
+
     def test_simulate_python_print(self):
         """Test simulating Python print statement."""
         sim = CommandSimulator()
@@ -309,6 +391,11 @@ class TestCommandSimulator:
         assert "Successfully installed" in result.output
         assert result.state_changes["installed_package"] == "requests"
 
+    def test_simulate_pip3_alias(self):
+        """Test that pip3 is handled like pip."""
+        sim = CommandSimulator()
+        assert sim.simulate("pip3 install torch") == sim.simulate("pip install torch")
+
     def test_simulate_pip_list(self):
         """Test simulating pip list."""
         sim = CommandSimulator()
@@ -394,6 +481,19 @@ class TestCommandSimulator:
         assert result.success is True
         assert "created" in result.output.lower() or "updated" in result.output.lower()
 
+    def test_simulate_unlisted_subcommands(self):
+        """Test the fallback responses for subcommands without a handler."""
+        sim = CommandSimulator()
+
+        for command in ("git log", "docker pull", "kubectl delete"):
+            result = sim.simulate(f"{command} thing")
+            assert result.success is True
+            assert result.output == f"{command} completed successfully"
+
+        result = sim.simulate("pip freeze")
+        assert result.success is False
+        assert result.error == "ERROR: unknown command 'freeze'"
+
     def test_simulate_with_llm_fallback(self):
         """Test LLM fallback for unknown command."""
         mock_client = Mock()
@@ -408,6 +508,78 @@ class TestCommandSimulator:
         assert result.success is True
         assert result.state_changes.get("llm_simulated") is True
 
+    def test_llm_response_parsing(self):
+        """Test parsing of success flag and output from LLM responses."""
+        mock_client = Mock()
+        sim = CommandSimulator(llm_client=mock_client)
+
+        mock_client.generate.return_value = (
+            "Success: Yes\nExit Code: 0\nOutput:\nline 1\nOutput: line 2\n"
+        )
+        result = sim.simulate("custom-command")
+        assert result.success is True
+        assert result.exit_code == 0
+        assert result.output == "line 1\nOutput: line 2"
+
+        mock_client.generate.return_value = "Success: no\nOutput: boom"
+        result = sim.simulate("custom-command")
+        assert result.success is False
+        assert result.exit_code == 1
+        assert result.output == "boom"
+
+        mock_client.generate.return_value = "free-form reply"
+        result = sim.simulate("custom-command")
+        assert result.success is False
+        assert result.output == "free-form reply"
+
+    def test_simulate_batch_single_llm_request(self):
+        """Test that unknown commands in a batch share one LLM request."""
+        mock_client = Mock()
+        mock_client.generate.return_value = (
+            "[1]\nSuccess: yes\nExit Code: 0\nOutput:\nfirst output\n"
+            "[2]\nSuccess: no\nExit Code: 1\nOutput:\nsecond failed\n"
+        )
+
+        sim = CommandSimulator(llm_client=mock_client)
+        results = sim.simulate_batch(
+            ["mkdir project", "tool-one --flag", "cd project", "tool-two", "pwd"],
+            context="Learning CLI tools",
+        )
+
+        assert mock_client.generate.call_count == 1
+        prompt = mock_client.generate.call_args[1]["prompt"]
+        assert "[1] tool-one --flag" in prompt
+        assert "[2] tool-two" in prompt
+        assert "Learning CLI tools" in prompt
+
+        assert [r.success for r in results] == [True, True, True, False, True]
+        assert results[1].output == "first output"
+        assert results[3].output == "second failed"
+        assert results[3].state_changes.get("llm_simulated") is True
+        assert results[4].output == "/home/user/project"
+
+    def test_simulate_batch_retries_missing_blocks(self):
+        """Test that commands missing from a batched reply are simulated alone."""
+        mock_client = Mock()
+        mock_client.generate.side_effect = [
+            "[2]\nSuccess: yes\nOutput:\nsecond",
+            "Success: yes\nOutput:\nfirst",
+        ]
+
+        sim = CommandSimulator(llm_client=mock_client)
+        results = sim.simulate_batch(["tool-one", "tool-two"])
+
+        assert mock_client.generate.call_count == 2
+        assert [r.output for r in results] == ["first", "second"]
+
+    def test_simulate_batch_without_llm(self):
+        """Test batch simulation without an LLM client."""
+        sim = CommandSimulator()
+        results = sim.simulate_batch(["echo hi", "unknown-tool"])
+
+        assert results[0].output == "hi"
+        assert results[1].exit_code == 127
+
     def test_simulate_unknown_without_llm(self):
         """Test unknown command without LLM client."""
         sim = CommandSimulator()  # No LLM client
@@ -439,6 +611,15 @@ class TestCommandSimulator:
         assert "Invalid command syntax" in result.error
         assert result.exit_code == 1
 
+    def test_simulate_quoted_arguments(self):
+        """Test that quoted and escaped arguments are tokenized like a shell."""
+        sim = CommandSimulator()
+
+        assert sim.simulate('echo "hello   world"').output == "hello   world"
+        assert sim.simulate("echo 'a b'  c").output == "a b c"
+        assert sim.simulate("echo a\\ b").output == "a b"
+        assert sim.simulate("echo   plain\targs ").output == "plain args"
+
     def test_reset_simulator(self):
         """Test resetting simulator state."""
         sim = CommandSimulator()
@@ -459,6 +640,20 @@ class TestCommandSimulator:
         assert sim.filesystem.current_dir == "/home/user"
         assert sim.environment["HOME"] == "/home/user"
 
+    def test_environment_not_shared_between_simulators(self):
+        """Test that environment changes do not leak into other simulators."""
+        sim = CommandSimulator()
+        sim.environment["HOME"] = "/root"
+        sim.environment["EDITOR"] = "vim"
+
+        other = CommandSimulator()
+        assert other.environment["HOME"] == "/home/user"
+        assert "EDITOR" not in other.environment
+
+        sim.reset()
+        assert sim.environment["HOME"] == "/home/user"
+        assert "EDITOR" not in sim.environment
+
     def test_multiple_commands_preserve_state(self):
         """Test that state is preserved across multiple commands."""
         sim = CommandSimulator()
@@ -489,6 +684,22 @@ class TestCommandSimulator:
         assert "pandas" in sim.python_imports
         assert len(sim.python_imports) == 3
 
+    def test_is_python_code(self):
+        """Test detection of Python statements versus shell commands."""
+        sim = CommandSimulator()
+
+        for code in (
+            "import os",
+            "from x import y",
+            "x = 1",
+            "print('hi')",
+            "def f(",
+            "class Foo",
+        ):
+            assert sim._is_python_code(code), code
+        for command in ("npm install", "x", "  import os", "printf hi"):
+            assert not sim._is_python_code(command), command
+
     def test_llm_fallback_error_handling(self):
         """Test error handling in LLM fallback."""
         mock_client = Mock()
@@ -1,6 +1,8 @@
 """Tests for the exercise validator."""
 
-from unittest.mock import Mock
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -10,6 +12,7 @@ from skillforge.core.validator import (
     ValidationStatus,
 )
 from skillforge.models.lesson import Exercise
+from skillforge.utils.llm_client import RateLimitedClient
 
 # --- Fixtures ---
 
@@ -152,6 +155,18 @@ class TestPatternValidation:
         assert result.is_correct
         assert result.details["match_type"] == "normalized_whitespace"
 
+    def test_decomposed_unicode_answer_matches(self):
+        """Test that an NFD answer matches an NFC expected output."""
+        exercise = Exercise(
+            id="ex-nfc",
+            instruction="Print the greeting",
+            expected_output="echo caf\u00e9",
+        )
+        validator = ExerciseValidator()
+        result = validator.validate(exercise, "echo cafe\u0301")
+        assert result.is_correct
+        assert result.details["match_type"] == "exact"
+
     def test_answer_contains_expected(self):
         """Test when answer contains the expected output."""
         exercise = Exercise(
@@ -370,6 +385,114 @@ class TestLLMValidation:
         assert result.status == ValidationStatus.PARTIAL
         assert result.score == 0.5
 
+    def test_llm_result_cached_for_resubmission(self, no_output_exercise):
+        """Test that resubmitting the same answer reuses the LLM result."""
+        mock_client = Mock()
+        mock_client.generate.return_value = (
+            "Status: incorrect\nScore: 0.2\nFeedback: Not quite.\nHint: none"
+        )
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        first = validator.validate(no_output_exercise, "answer", context="ctx")
+        second = validator.validate(no_output_exercise, "  answer ", context="ctx")
+        assert second == first
+        assert mock_client.generate.call_count == 1
+
+    def test_cached_result_is_copied(self, no_output_exercise):
+        """Test that editing a returned result does not change the cached one."""
+        mock_client = Mock()
+        mock_client.generate.return_value = (
+            "Status: incorrect\nScore: 0.2\nFeedback: Not quite.\nHint: Try again"
+        )
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        first = validator.validate(no_output_exercise, "answer")
+        first.hints.append("extra")
+        second = validator.validate(no_output_exercise, "answer")
+        second.details["note"] = "changed"
+        third = validator.validate(no_output_exercise, "answer")
+
+        assert mock_client.generate.call_count == 1
+        assert third is not second
+        assert "extra" not in third.hints
+        assert "note" not in third.details
+
+        validator.validate(no_output_exercise, "answer", context="other")
+        validator.validate(no_output_exercise, "Answer", context="ctx")
+        assert mock_client.generate.call_count == 3
+
+    def test_llm_errors_not_cached(self, no_output_exercise):
+        """Test that failed LLM validations are retried on resubmission."""
+        mock_client = Mock()
+        mock_client.generate.side_effect = [
+            Exception("API error"),
+            "Status: correct\nScore: 1.0\nFeedback: Good.\nHint: none",
+        ]
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        assert "error" in validator.validate(no_output_exercise, "answer").details
+        assert validator.validate(no_output_exercise, "answer").is_correct
+        assert mock_client.generate.call_count == 2
+
+    def test_llm_streamed_evaluation_stops_early(self, no_output_exercise):
+        """Test streaming stops reading once every field line is complete."""
+        consumed = []
+
+        def stream_generate(**kwargs):
+            for chunk in [
+                "Status: inc",
+                "orrect\nScore: 0.3\nFeedback: Missing return.\n",
+                "Hint: Use return.\nSome",
+                " trailing commentary",
+            ]:
+                consumed.append(chunk)
+                yield chunk
+
+        mock_client = Mock()
+        mock_client.stream_generate = stream_generate
+        validator = ExerciseValidator(llm_client=mock_client, stream_responses=True)
+        result = validator.validate(no_output_exercise, "def add(a, b): pass")
+
+        assert result.status == ValidationStatus.INCORRECT
+        assert result.score == 0.3
+        assert result.feedback == "Missing return."
+        assert result.hints[0] == "Use return."
+        assert len(consumed) == 3
+        assert not mock_client.generate.called
+
+    def test_llm_streamed_evaluation_incomplete(self, no_output_exercise):
+        """Test a stream missing some fields is read and parsed in full."""
+        mock_client = Mock()
+        mock_client.stream_generate.return_value = (
+            chunk for chunk in ["Status: correct\n", "Score: 0.9"]
+        )
+        validator = ExerciseValidator(llm_client=mock_client, stream_responses=True)
+        result = validator.validate(no_output_exercise, "answer")
+
+        assert result.is_correct
+        assert result.score == 0.9
+
+    def test_llm_response_fields_anywhere(self, no_output_exercise):
+        """Test field lines are found regardless of case, indent or line endings."""
+        mock_client = Mock()
+        mock_client.generate.return_value = (
+            "Here is my evaluation:\r\n"
+            "  STATUS: Incorrect\r\n"
+            "\tscore: 0.25\r\n"
+            "Feedback: Close, but check the flag.\r\n"
+            "Hint: Use -l.\r\n"
+            "hint: NONE\r\n"
+        )
+
+        validator = ExerciseValidator(llm_client=mock_client)
+        result = validator.validate(no_output_exercise, "answer")
+
+        assert result.status == ValidationStatus.INCORRECT
+        assert result.score == 0.25
+        assert result.feedback == "Close, but check the flag."
+        assert result.hints[0] == "Use -l."
+        assert "NONE" not in result.hints
+
 
 # --- Hint Generation Tests ---
 
@@ -435,6 +558,176 @@ class TestHintGeneration:
 # --- Integration-style Tests ---
 
 
+class TestConcurrentValidation:
+    """Tests for async and concurrent validation."""
+
+    def test_avalidate_uses_async_client(self, no_output_exercise):
+        """Test that avalidate awaits agenerate instead of calling generate."""
+        mock_client = Mock()
+        mock_client.agenerate = AsyncMock(
+            return_value="Status: correct\nScore: 1.0\nFeedback: Nice.\nHint: none"
+        )
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        result = asyncio.run(validator.avalidate(no_output_exercise, "def add(): ..."))
+
+        assert result.is_correct
+        assert result.feedback == "Nice."
+        mock_client.agenerate.assert_awaited_once()
+        assert not mock_client.generate.called
+
+    def test_validate_many_preserves_order(self, simple_exercise, no_output_exercise):
+        """Test results line up with inputs and pattern matches skip the LLM."""
+        mock_client = Mock()
+        mock_client.agenerate = AsyncMock(
+            return_value="Status: incorrect\nScore: 0.1\nFeedback: No.\nHint: none"
+        )
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        results = validator.validate_many(
+            [simple_exercise, no_output_exercise, simple_exercise],
+            ["ls", "print(1)", ""],
+        )
+
+        assert [r.status for r in results] == [
+            ValidationStatus.CORRECT,
+            ValidationStatus.INCORRECT,
+            ValidationStatus.INCORRECT,
+        ]
+        assert results[1].feedback == "No."
+        assert mock_client.agenerate.await_count == 1
+
+    def test_validate_many_limits_concurrency(self, no_output_exercise):
+        """Test that no more than max_concurrent LLM calls run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def agenerate(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return "Status: correct\nScore: 1.0\nFeedback: Ok.\nHint: none"
+
+        mock_client = Mock()
+        mock_client.agenerate = agenerate
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        results = validator.validate_many(
+            [no_output_exercise] * 6, ["answer"] * 6, max_concurrent=2, batch_size=1
+        )
+
+        assert all(r.is_correct for r in results)
+        assert peak == 2
+
+    def test_validate_many_batches_llm_requests(self, no_output_exercise):
+        """Test that pending answers share one LLM request per batch."""
+        mock_client = Mock()
+        mock_client.agenerate = AsyncMock(
+            return_value=(
+                '{"id": 2, "status": "incorrect", "score": 0.2, '
+                '"feedback": "Not yet.", "hint": "Check the docs."}\n'
+                '{"id": 1, "status": "correct", "score": 1.0, '
+                '"feedback": "Great.", "hint": "none"}\n'
+                '{"id": 3, "status": "partial", "score": 7, "feedback": "Close."}\n'
+            )
+        )
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        results = validator.validate_many(
+            [no_output_exercise] * 3, ["first", "second", "third"], context="Python"
+        )
+
+        assert mock_client.agenerate.await_count == 1
+        prompt = mock_client.agenerate.await_args.kwargs["prompt"]
+        assert "[1]" in prompt and "User's Answer: second" in prompt
+        assert "Learning Context: Python" in prompt
+
+        assert results[0].is_correct and results[0].feedback == "Great."
+        assert results[0].hints == []
+        assert results[1].status == ValidationStatus.INCORRECT
+        assert results[1].hints[0] == "Check the docs."
+        assert results[2].is_partial and results[2].score == 1.0
+
+    def test_validate_many_retries_ungraded_answers(self, no_output_exercise):
+        """Test that answers missing from a batched reply are graded alone."""
+        mock_client = Mock()
+        mock_client.agenerate = AsyncMock(
+            side_effect=[
+                '{"id": 1, "status": "correct", "score": 1.0, "feedback": "Ok."}\n'
+                "not json",
+                "Status: incorrect\nScore: 0.0\nFeedback: Retried.\nHint: none",
+            ]
+        )
+        validator = ExerciseValidator(llm_client=mock_client)
+
+        results = validator.validate_many([no_output_exercise] * 2, ["a", "b"])
+
+        assert mock_client.agenerate.await_count == 2
+        assert results[0].feedback == "Ok."
+        assert results[1].feedback == "Retried."
+
+    def test_rate_limit_wraps_client(self, no_output_exercise):
+        """Test that max_requests_per_minute wraps the client in a limiter."""
+        mock_client = Mock()
+        mock_client.generate.return_value = "Status: correct\nScore: 1.0"
+
+        validator = ExerciseValidator(mock_client, max_requests_per_minute=30)
+
+        assert isinstance(validator.llm_client, RateLimitedClient)
+        assert validator.llm_client.max_requests == 30
+        assert validator.validate(no_output_exercise, "answer").is_correct
+        assert mock_client.generate.called
+
+    def test_validate_many_length_mismatch(self, simple_exercise):
+        """Test that mismatched exercises and answers are rejected."""
+        validator = ExerciseValidator()
+        with pytest.raises(ValueError):
+            validator.validate_many([simple_exercise], ["ls", "pwd"])
+
+    def test_validate_many_threaded(self, simple_exercise, no_output_exercise):
+        """Test threaded validation overlaps blocking LLM calls."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate(**kwargs):
+            barrier.wait()  # only returns once three calls are in flight
+            return "Status: correct\nScore: 0.8\nFeedback: Fine.\nHint: none"
+
+        mock_client = Mock(spec=["generate"])
+        mock_client.generate.side_effect = generate
+        validator = ExerciseValidator(llm_client=mock_client)
+        exercises = [no_output_exercise] * 3 + [simple_exercise]
+        answers = ["a", "b", "c", "ls"]
+
+        results = dict(validator.validate_many_threaded(exercises, answers))
+
+        assert sorted(results) == [0, 1, 2, 3]
+        assert [results[i].score for i in range(3)] == [0.8] * 3
+        assert results[3].details["match_type"] == "exact"
+        assert mock_client.generate.call_count == 3
+
+    def test_validate_many_threaded_shuts_down_pool(self, simple_exercise):
+        """Test that each call's worker threads are gone once it finishes."""
+        validator = ExerciseValidator()
+        before = set(threading.enumerate())
+
+        for max_workers in (2, 3):
+            results = validator.validate_many_threaded(
+                [simple_exercise] * 4, ["ls"] * 4, max_workers=max_workers
+            )
+            next(results)
+            results.close()  # stop early, as a caller breaking out would
+
+        assert set(threading.enumerate()) <= before
+
+    def test_validate_many_threaded_length_mismatch(self, simple_exercise):
+        """Test that threaded validation rejects mismatched inputs."""
+        validator = ExerciseValidator()
+        with pytest.raises(ValueError):
+            list(validator.validate_many_threaded([simple_exercise], []))
+
+
 class TestValidationWorkflow:
     """Tests for validation workflows."""
 